@@ -33,3 +33,18 @@ if __name__ == "__main__":
     # Perform BFS starting from a vertex that does not exist
     print("\nBFS Traversal Starting from Vertex Z (Non-Existent):")
     graph.bfs("Z")
+
+    # Consume the traversal lazily, with depth and parent information
+    print("\nBFS Traversal Details Starting from Vertex A:")
+    for vertex, depth, parent in graph.bfs_iter("A", details=True):
+        print(f"{vertex} (depth {depth}, parent {parent})")
+
+    # Compute hop counts from several seeds in one pass
+    print("\nMulti-Source BFS From Vertices B and C:")
+    distances, parents = graph.multi_source_bfs(["B", "C"])
+    print(f"Distances: {distances}")
+    print(f"Parents: {parents}")
+
+    # Answer a point-to-point query with bidirectional BFS
+    print("\nShortest Path From A to F:")
+    print(graph.shortest_path("A", "F"))
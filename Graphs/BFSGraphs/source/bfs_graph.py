@@ -1,4 +1,86 @@
-from collections import defaultdict, deque
+from array import array
+from collections import defaultdict
+from functools import partial
+from itertools import repeat
+
+from Graphs.CSRGraphs.source.csr_graph import CSRGraph
+from Graphs.EdgeLists.source.edge_list import chunked, new_endpoints, split_weights
+from Graphs.ShortestPaths.source.shortest_paths import a_star, dijkstra
+from Graphs.SymbolTables.source.interned_adjacency import InternedAdjacency
+
+
+def bidirectional_shortest_path(source, target, successors, predecessors):
+    """
+    Find a shortest path between two vertices with bidirectional BFS.
+
+    One search runs forward from the source along outgoing edges and one runs backward from the
+    target along incoming edges. Each round expands one full level of whichever frontier is
+    smaller, and the search stops in the round where the two searches first meet. On graphs
+    with branching factor b and distance d this visits about 2 * b^(d/2) vertices instead of b^d.
+
+    Args:
+        source: The first vertex of the path.
+        target: The last vertex of the path.
+        successors (callable): Returns the outgoing neighbors of a vertex.
+        predecessors (callable): Returns the incoming neighbors of a vertex.
+
+    Returns:
+        list: The vertices of a shortest path from source to target, or None if target is
+        not reachable.
+    """
+    if source == target:
+        return [source]
+
+    # Parent pointers and depths of both searches; each side also keeps its current frontier.
+    forward_parents, forward_depths = {source: None}, {source: 0}
+    backward_parents, backward_depths = {target: None}, {target: 0}
+    forward_frontier, backward_frontier = [source], [target]
+
+    while forward_frontier and backward_frontier:
+        # Expand the smaller frontier by one full level.
+        if len(forward_frontier) <= len(backward_frontier):
+            frontier, neighbors_of = forward_frontier, successors
+            parents, depths, other_depths = forward_parents, forward_depths, backward_depths
+        else:
+            frontier, neighbors_of = backward_frontier, predecessors
+            parents, depths, other_depths = backward_parents, backward_depths, forward_depths
+
+        next_frontier = []
+        meeting_vertex = None
+        for vertex in frontier:
+            for neighbor in neighbors_of(vertex):
+                if neighbor in parents:
+                    continue
+                parents[neighbor] = vertex
+                depths[neighbor] = depths[vertex] + 1
+                next_frontier.append(neighbor)
+
+                # Among all meetings of this level, keep the one closest to the other end.
+                if neighbor in other_depths and (meeting_vertex is None
+                                                 or other_depths[neighbor] < other_depths[meeting_vertex]):
+                    meeting_vertex = neighbor
+
+        if meeting_vertex is not None:
+            # Walk back to the source, then forward to the target.
+            path = []
+            vertex = meeting_vertex
+            while vertex is not None:
+                path.append(vertex)
+                vertex = forward_parents[vertex]
+            path.reverse()
+
+            vertex = backward_parents[meeting_vertex]
+            while vertex is not None:
+                path.append(vertex)
+                vertex = backward_parents[vertex]
+            return path
+
+        if frontier is forward_frontier:
+            forward_frontier = next_frontier
+        else:
+            backward_frontier = next_frontier
+
+    return None
 
 
 class BFSGraph:
@@ -7,7 +89,12 @@ class BFSGraph:
 
     Attributes:
         graph (defaultdict): Stores the adjacency list of the graph.
+        reverse_graph (defaultdict): Stores the incoming neighbors of every vertex.
+        weights (defaultdict): Stores the edge weights of every vertex in a float array
+            parallel to its adjacency list.
         vertices (set): A set containing all the vertices in the graph.
+        interned (InternedAdjacency): The adjacency list over integer vertex ids that the
+            traversals run on, built by the first traversal.
     """
 
     def __init__(self):
@@ -15,7 +102,23 @@ class BFSGraph:
         Initialize the graph with an empty adjacency list and an empty set of vertices.
         """
         self.graph = defaultdict(list)  # Adjacency list to store the graph.
+        self.reverse_graph = defaultdict(list)  # Reverse adjacency list, kept in sync by add_edge.
+        self.weights = defaultdict(partial(array, "d"))  # Edge weights, parallel to the adjacency list.
         self.vertices = set()            # Set to store all the vertices in the graph.
+        self._order = {}                 # The vertices in the order they were added (values unused).
+        self._interned = None            # Integer-id mirror of the adjacency list, built on first use.
+        self._snapshot = None            # Cached (forward, reverse) CSR snapshots, reset on change.
+
+    @property
+    def interned(self):
+        """
+        InternedAdjacency: The adjacency list over integer vertex ids that the traversals run
+        on. Built from the adjacency list the first time it is needed, with ids handed out in
+        the order the vertices were added, and kept up to date by every later change.
+        """
+        if self._interned is None:
+            self._interned = InternedAdjacency.from_adjacency(self._order, self.graph)
+        return self._interned
 
     def add_vertex(self, vertex):
         """
@@ -25,8 +128,12 @@ class BFSGraph:
             vertex (str): The vertex to be added.
         """
         self.vertices.add(vertex)  # Add the vertex to the set of vertices.
+        self._order[vertex] = None
+        if self._interned is not None:
+            self._interned.add_vertex(vertex)
+        self._snapshot = None
 
-    def add_edge(self, source, target):
+    def add_edge(self, source, target, weight=1.0):
         """
         Add a directed edge from the source vertex to the target vertex.
 
@@ -35,6 +142,7 @@ class BFSGraph:
         Args:
             source (str): The starting vertex of the edge.
             target (str): The ending vertex of the edge.
+            weight (float, optional): The weight of the edge, used by `dijkstra` and `a_star`.
         """
         # Ensure both the source and target vertices exist in the graph.
         if source not in self.vertices:
@@ -44,11 +152,356 @@ class BFSGraph:
 
         # Add the target to the adjacency list of the source vertex.
         self.graph[source].append(target)
+        self.reverse_graph[target].append(source)
+        self.weights[source].append(weight)
+        if self._interned is not None:
+            self._interned.add_edge(source, target)
+        self._snapshot = None
+
+    def add_edges_from(self, edges):
+        """
+        Add many directed edges at once.
+
+        The edges are consumed in batches. The new vertices of a batch are registered together
+        before its edges are appended, so the per-edge work is just the appends, without the
+        membership checks and method calls of `add_edge`.
+
+        Args:
+            edges (iterable): (source, target) pairs, or (source, target, weight) triples.
+
+        Raises:
+            ValueError: If a batch mixes pairs and triples; that batch is not added.
+        """
+        graph, reverse_graph, edge_weights = self.graph, self.reverse_graph, self.weights
+
+        for chunk in chunked(edges):
+            pairs, weights = split_weights(chunk)
+            for vertex in new_endpoints(pairs, self.vertices):
+                self.add_vertex(vertex)
+            if self._interned is not None:
+                self._interned.add_edges(pairs)
+
+            for (source, target), weight in zip(pairs, weights or repeat(1.0)):
+                graph[source].append(target)
+                reverse_graph[target].append(source)
+                edge_weights[source].append(weight)
+
+        self._snapshot = None
+
+    def remove_edge(self, source, target):
+        """
+        Remove one directed edge from the source vertex to the target vertex.
+
+        If parallel edges exist, only one of them is removed. The vertices stay in the graph.
+
+        Args:
+            source (str): The starting vertex of the edge.
+            target (str): The ending vertex of the edge.
+
+        Raises:
+            ValueError: If the edge does not exist.
+        """
+        if target not in self.graph.get(source, ()):
+            raise ValueError(f"Edge {source} -> {target} does not exist!")
+
+        # Drop the first copy together with the weight stored at the same position
+        position = self.graph[source].index(target)
+        del self.graph[source][position]
+        del self.weights[source][position]
+        self.reverse_graph[target].remove(source)
+        if self._interned is not None:
+            self._interned.remove_edge(source, target)
+        self._snapshot = None
+
+    def remove_vertex(self, vertex):
+        """
+        Remove a vertex together with all its incoming and outgoing edges.
+
+        Only the neighbors of the vertex are touched, found through the adjacency list and the
+        reverse adjacency list. The vertex leaves a tombstone among the interned ids until they
+        are compacted.
+
+        Args:
+            vertex (str): The vertex to remove.
+
+        Raises:
+            ValueError: If the vertex does not exist.
+        """
+        if vertex not in self.vertices:
+            raise ValueError(f"Vertex {vertex} does not exist!")
+
+        self.vertices.remove(vertex)
+        del self._order[vertex]
+        successors = self.graph.pop(vertex, [])
+        predecessors = self.reverse_graph.pop(vertex, [])
+        self.weights.pop(vertex, None)
+
+        for successor in set(successors).difference((vertex,)):
+            incoming = self.reverse_graph[successor]
+            incoming[:] = [predecessor for predecessor in incoming if predecessor != vertex]
+
+        for predecessor in set(predecessors).difference((vertex,)):
+            # Keep the weights aligned with the remaining neighbors
+            neighbors = self.graph[predecessor]
+            weights = self.weights[predecessor]
+            kept = [position for position, neighbor in enumerate(neighbors) if neighbor != vertex]
+            neighbors[:] = [neighbors[position] for position in kept]
+            weights[:] = array("d", map(weights.__getitem__, kept))
+
+        if self._interned is not None:
+            self._interned.remove_vertex(vertex, predecessors)
+        self._snapshot = None
+
+    def bfs_iter(self, start_vertex, details=False):
+        """
+        Lazily perform a Breadth-First Search (BFS) traversal starting from the specified vertex.
+
+        Vertices are produced one at a time, so callers can stop early or stream them into
+        another stage without building a list. Nothing is produced for an unknown vertex.
+
+        Args:
+            start_vertex (str): The vertex from which to start the BFS traversal.
+            details (bool, optional): If True, yield (vertex, depth, parent) tuples instead of
+                bare vertices. The start vertex has depth 0 and parent None.
+
+        Yields:
+            The vertices in the order they are visited, or (vertex, depth, parent) tuples.
+        """
+        if start_vertex not in self.vertices:
+            return
+
+        for vertex, depth, parent in self._bfs_from([start_vertex]):
+            yield (vertex, depth, parent) if details else vertex
+
+    def multi_source_bfs(self, sources):
+        """
+        Compute shortest hop counts from a set of seed vertices in a single BFS pass.
+
+        Every vertex reachable from any seed gets its distance to the nearest seed and the
+        vertex it was first reached from, which lets callers rebuild a shortest path by
+        following parents back to a seed. Unknown seeds are ignored.
+
+        Args:
+            sources (iterable): The seed vertices; each has distance 0.
+
+        Returns:
+            tuple: (distances, parents) dictionaries covering every reached vertex. Seeds have
+            parent None.
+        """
+        distances = {}
+        parents = {}
+        for vertex, depth, parent in self._bfs_from(sources):
+            distances[vertex] = depth
+            parents[vertex] = parent
+        return distances, parents
+
+    def shortest_path(self, source, target):
+        """
+        Find a path with the fewest edges from the source to the target vertex.
+
+        Uses bidirectional BFS over the adjacency list and the reverse adjacency list, so the
+        search stops as soon as the two frontiers meet instead of exploring everything
+        reachable from the source.
+
+        Args:
+            source (str): The first vertex of the path.
+            target (str): The last vertex of the path.
+
+        Returns:
+            list: The vertices of a shortest path, or None if there is no path (or either
+            vertex does not exist).
+        """
+        if source not in self.vertices or target not in self.vertices:
+            return None
+
+        return bidirectional_shortest_path(
+            source, target,
+            lambda vertex: self.graph.get(vertex, ()),
+            lambda vertex: self.reverse_graph.get(vertex, ()),
+        )
+
+    def weighted_neighbors(self, vertex):
+        """
+        Iterate over the outgoing edges of a vertex together with their weights.
+
+        Args:
+            vertex (str): The vertex whose edges are listed.
+
+        Returns:
+            iterator: (neighbor, weight) pairs.
+        """
+        return zip(self.graph.get(vertex, ()), self.weights.get(vertex, ()))
+
+    def dijkstra(self, source, targets=None):
+        """
+        Compute weighted shortest-path distances from a source vertex with Dijkstra's algorithm.
+
+        Args:
+            source (str): The vertex to start from.
+            targets (iterable, optional): Stop once all of these vertices are settled.
+
+        Returns:
+            tuple: (distances, parents) dictionaries covering the settled vertices.
+
+        Raises:
+            ValueError: If a negative edge weight is encountered.
+        """
+        if source not in self.vertices:
+            return {}, {}
+        return dijkstra(self.weighted_neighbors, source, targets)
+
+    def a_star(self, source, target, heuristic):
+        """
+        Find a weighted shortest path between two vertices with the A* algorithm.
+
+        Args:
+            source (str): The first vertex of the path.
+            target (str): The last vertex of the path.
+            heuristic (callable): Estimates the distance from a vertex to the target; the result
+                is optimal when it never overestimates the true remaining distance and is
+                consistent.
+
+        Returns:
+            tuple: (distance, path), or (inf, None) if the target is not reachable.
+
+        Raises:
+            ValueError: If a negative edge weight is encountered.
+        """
+        if source not in self.vertices:
+            return float("inf"), None
+        return a_star(self.weighted_neighbors, source, target, heuristic)
+
+    def direction_optimizing_bfs(self, sources, alpha=14, beta=24):
+        """
+        Compute shortest hop counts from a set of seeds with direction-optimizing BFS.
+
+        Classic (top-down) BFS scans every edge leaving the frontier, which is wasteful on
+        low-diameter graphs where the middle frontiers contain most of the graph and most of
+        those edges lead to vertices that are already visited. This variant (Beamer et al.)
+        switches to a bottom-up step when the frontier becomes large: every unvisited vertex
+        scans its incoming edges and stops at the first parent found in the frontier. It
+        switches back to top-down once the frontier shrinks again.
+
+        The traversal runs on cached CSR snapshots of the graph and its reverse (rebuilt after
+        the graph changes), with the frontier kept as a bytearray bitmap during bottom-up steps.
+        The result is the same as `multi_source_bfs`, although a vertex with several parents at
+        the same depth may record a different one.
+
+        Args:
+            sources (iterable): The seed vertices; unknown ones are ignored.
+            alpha (int, optional): Switch to bottom-up when the edges leaving the frontier exceed
+                1/alpha of the edges leaving unvisited vertices.
+            beta (int, optional): Switch back to top-down when the frontier holds fewer than
+                1/beta of all vertices.
+
+        Returns:
+            tuple: (distances, parents) dictionaries covering every reached vertex.
+        """
+        forward, reverse = self._csr_snapshot()
+        symbols = forward.symbols
+        offsets, targets = forward.offsets, forward.targets
+        in_offsets, in_sources = reverse.offsets, reverse.targets
+        vertex_count = forward.num_vertices()
+
+        parents = array("q", [-1]) * vertex_count
+        distances = array("q", [-1]) * vertex_count
+
+        frontier = []
+        for source in sources:
+            source_id = symbols.get(source)
+            if source_id is not None and distances[source_id] == -1:
+                distances[source_id] = 0
+                frontier.append(source_id)
+
+        unvisited_edges = forward.num_edges() - sum(offsets[v + 1] - offsets[v] for v in frontier)
+        unvisited = None   # Ids not reached yet; only maintained while stepping bottom-up
+        depth = 0
+
+        while frontier:
+            depth += 1
+            frontier_edges = sum(offsets[v + 1] - offsets[v] for v in frontier)
+            bottom_up = frontier_edges * alpha > unvisited_edges and len(frontier) * beta > vertex_count
+            next_frontier = []
+
+            if bottom_up:
+                # Each unvisited vertex looks for any parent among its incoming edges.
+                in_frontier = bytearray(vertex_count)
+                for vertex_id in frontier:
+                    in_frontier[vertex_id] = 1
+                if unvisited is None:
+                    unvisited = [v for v in range(vertex_count) if distances[v] == -1]
+
+                still_unvisited = []
+                for vertex_id in unvisited:
+                    for parent_id in in_sources[in_offsets[vertex_id]:in_offsets[vertex_id + 1]]:
+                        if in_frontier[parent_id]:
+                            parents[vertex_id] = parent_id
+                            distances[vertex_id] = depth
+                            next_frontier.append(vertex_id)
+                            break
+                    else:
+                        still_unvisited.append(vertex_id)
+                unvisited = still_unvisited
+            else:
+                # Each frontier vertex pushes to its unvisited neighbors.
+                for vertex_id in frontier:
+                    for neighbor_id in targets[offsets[vertex_id]:offsets[vertex_id + 1]]:
+                        if distances[neighbor_id] == -1:
+                            parents[neighbor_id] = vertex_id
+                            distances[neighbor_id] = depth
+                            next_frontier.append(neighbor_id)
+                unvisited = None
+
+            unvisited_edges -= sum(offsets[v + 1] - offsets[v] for v in next_frontier)
+            frontier = next_frontier
+
+        labels = symbols.labels
+        distance_map = {}
+        parent_map = {}
+        for vertex_id in range(vertex_count):
+            if distances[vertex_id] != -1:
+                distance_map[labels[vertex_id]] = distances[vertex_id]
+                parent_id = parents[vertex_id]
+                parent_map[labels[vertex_id]] = None if parent_id == -1 else labels[parent_id]
+        return distance_map, parent_map
+
+    def _csr_snapshot(self):
+        """
+        Return CSR snapshots of the graph and of its reverse, building them if needed.
+
+        Returns:
+            tuple: (forward, reverse) CSRGraph instances sharing one symbol table.
+        """
+        if self._snapshot is None:
+            self.interned.compact()  # Drop tombstones so the snapshot is copied from the id rows
+            forward = CSRGraph.from_graph(self)
+            self._snapshot = (forward, forward.transpose())
+        return self._snapshot
+
+    def _bfs_from(self, sources):
+        """
+        Run a BFS from one or more sources, marking vertices as visited when they are enqueued.
+
+        Marking on enqueue (instead of on dequeue) guarantees that every vertex enters the
+        queue at most once, so the queue never holds more than V entries. The search runs on
+        the interned integer ids; labels are only looked up for the yielded tuples.
+
+        Args:
+            sources (iterable): The vertices to start from; unknown ones are skipped.
+
+        Yields:
+            tuple: (vertex, depth, parent) in BFS order.
+        """
+        labels = self.interned.symbols.labels
+        for vertex_id, depth, parent_id in self.interned.bfs(self.interned.ids_of(sources)):
+            yield labels[vertex_id], depth, None if parent_id == -1 else labels[parent_id]
 
     def bfs(self, start_vertex):
         """
         Perform a Breadth-First Search (BFS) traversal starting from the specified vertex.
 
+        This is a printing wrapper around `bfs_iter`.
+
         Args:
             start_vertex (str): The vertex from which to start the BFS traversal.
 
@@ -59,22 +512,8 @@ class BFSGraph:
             print(f"Vertex '{start_vertex}' does not exist in the graph.")
             return
 
-        visited = set()             # Set to keep track of visited vertices.
-        queue = deque([start_vertex])  # Queue to manage the BFS traversal.
-
-        while queue:
-            # Dequeue the first vertex in the queue.
-            current_vertex = queue.popleft()
-
-            # If the vertex hasn't been visited, process it.
-            if current_vertex not in visited:
-                visited.add(current_vertex)  # Mark the vertex as visited.
-                print(current_vertex, end=" ")  # Print the current vertex.
-
-                # Enqueue all unvisited neighbors of the current vertex.
-                for neighbor in self.graph[current_vertex]:
-                    if neighbor not in visited:
-                        queue.append(neighbor)
+        for vertex in self.bfs_iter(start_vertex):
+            print(vertex, end=" ")  # Print the current vertex.
 
         print()  # Print a newline after traversal is complete.
 
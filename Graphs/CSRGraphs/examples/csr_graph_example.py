@@ -0,0 +1,31 @@
+from Graphs.CSRGraphs.source.csr_graph import CSRGraph
+from Graphs.DirectedGraphs.source.directed_graph import DirectedGraph
+
+
+if __name__ == "__main__":
+    # Build a regular adjacency-list graph
+    graph = DirectedGraph()
+    graph.add_edge("A", "B")  # A -> B
+    graph.add_edge("A", "C")  # A -> C
+    graph.add_edge("B", "D")  # B -> D
+    graph.add_edge("C", "D")  # C -> D
+
+    # Freeze it into a compact CSR snapshot
+    csr = CSRGraph.from_graph(graph)
+
+    print("CSR Adjacency List:")
+    csr.print()
+
+    print("\nRaw CSR arrays:")
+    print(f"offsets = {csr.offsets.tolist()}")
+    print(f"targets = {csr.targets.tolist()}")
+
+    # The CSR graph answers the same queries as the original one
+    print("\nChecking if edges exist:")
+    print(f"Does an edge exist from A to B? {'Yes' if csr.has_edge('A', 'B') else 'No'}")
+    print(f"Does an edge exist from A to D? {'Yes' if csr.has_edge('A', 'D') else 'No'}")
+
+    # CSR graphs can also be bulk-built straight from an edge list
+    undirected = CSRGraph.from_edge_list([("A", "B"), ("B", "C"), ("C", "A")], directed=False)
+    print("\nUndirected CSR built from an edge list:")
+    undirected.print()
@@ -0,0 +1,40 @@
+import os
+import tempfile
+import time
+
+from Graphs.CSRGraphs.source.graph_file import open_graph_file, write_graph_file
+from Graphs.DirectedGraphs.source.directed_graph import DirectedGraph
+
+
+if __name__ == "__main__":
+    # Build a directed graph the usual way
+    graph = DirectedGraph()
+    for vertex in range(100_000):
+        graph.add_edge(f"service-{vertex}", f"service-{(vertex * 7 + 1) % 100_000}")
+        graph.add_edge(f"service-{vertex}", f"service-{(vertex * 13 + 5) % 100_000}")
+
+    path = os.path.join(tempfile.mkdtemp(), "services.graph")
+
+    # Write it once in the binary CSR format
+    start = time.perf_counter()
+    write_graph_file(graph, path)
+    print(f"Wrote {os.path.getsize(path)} bytes in {time.perf_counter() - start:.3f}s")
+
+    # Every later process maps the file instead of rebuilding the graph
+    start = time.perf_counter()
+    mapped = open_graph_file(path)
+    print(f"Opened in {time.perf_counter() - start:.6f}s")
+
+    print(f"Vertices: {mapped.num_vertices()}, edges: {mapped.num_edges()}")
+    print(f"Neighbors of service-0: {list(mapped.neighbors('service-0'))}")
+    print(f"Edge service-0 -> service-1? {'Yes' if mapped.has_edge('service-0', 'service-1') else 'No'}")
+
+    # A mapped graph can be iterated and written out again like any other graph
+    print(f"First vertices: {list(mapped)[:3]}")
+    copy_path = os.path.join(os.path.dirname(path), "services-copy.graph")
+    write_graph_file(mapped, copy_path)
+    copy = open_graph_file(copy_path)
+    print(f"Round trip keeps the graph: {copy.num_vertices() == mapped.num_vertices() and copy.num_edges() == mapped.num_edges()}")
+
+    copy.close()
+    mapped.close()
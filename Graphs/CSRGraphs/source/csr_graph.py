@@ -0,0 +1,396 @@
+import gc
+from array import array
+from bisect import bisect_left
+from itertools import chain, repeat
+from operator import itemgetter
+
+from Graphs.EdgeLists.source.edge_list import CHUNK_SIZE, read_endpoint_chunks
+from Graphs.SymbolTables.source.symbol_table import SymbolTable
+from Graphs.UndirectedGraphs.source.undirected_graph import UndirectedGraph
+
+
+def _index_typecode(limit):
+    """
+    Pick the smallest signed array typecode able to hold values up to `limit`.
+
+    Args:
+        limit (int): The largest value that will be stored.
+
+    Returns:
+        str: 'i' for 32-bit storage, 'q' for 64-bit storage.
+    """
+    return "i" if limit < 2 ** 31 else "q"
+
+
+class CSRGraph:
+    """
+    A class to represent a frozen graph in compressed sparse row (CSR) form.
+
+    Vertex labels are interned to dense ids 0..n-1. The neighbors of vertex `i` are the ids
+    stored in `targets[offsets[i]:offsets[i + 1]]`, sorted in ascending order, so the whole
+    edge set lives in two flat machine-integer arrays instead of a dictionary of Python lists.
+    Both arrays support the buffer protocol and can be wrapped by NumPy without copying.
+
+    Attributes:
+        symbols (SymbolTable): Maps vertex labels to ids and back.
+        offsets (array): Row start positions; has one entry more than there are vertices.
+        targets (array): Neighbor ids of all rows, concatenated.
+        directed (bool): False if every edge is stored in both directions.
+    """
+
+    def __init__(self, symbols, offsets, targets, directed=True):
+        """
+        Initialize the graph from already built CSR arrays.
+
+        Most callers should use `from_graph`, `from_edge_list` or `from_edge_file` instead.
+
+        Args:
+            symbols (SymbolTable): The vertex label table.
+            offsets (array): Row start positions, `len(symbols) + 1` entries.
+            targets (array): Concatenated, per-row sorted neighbor ids.
+            directed (bool, optional): Whether the graph is directed.
+        """
+        self.symbols = symbols
+        self.offsets = offsets
+        self.targets = targets
+        self.directed = directed
+        self._mapping = None  # (mmap, views) when opened from a graph file
+
+    @classmethod
+    def from_edge_list(cls, edges, directed=True, vertices=()):
+        """
+        Build a CSR graph from an iterable of (source, target) pairs.
+
+        The edges are consumed once, so a generator reading from a file works without
+        materializing the pairs as Python tuples. Weights of (source, target, weight) triples
+        are ignored.
+
+        Args:
+            edges (iterable): Pairs of vertex labels, or triples with a weight.
+            directed (bool, optional): If False, every edge is stored in both directions.
+            vertices (iterable, optional): Extra vertices to include, e.g. isolated ones.
+
+        Returns:
+            CSRGraph: The frozen graph.
+        """
+        symbols = SymbolTable(vertices)
+        intern = symbols.intern
+
+        # First pass: intern labels and record the edges as two flat id arrays.
+        sources = array("q")
+        targets = array("q")
+        for source, target, *_ in edges:
+            sources.append(intern(source))
+            targets.append(intern(target))
+
+        if not directed:
+            sources, targets = sources + targets, targets + sources
+
+        return cls._from_id_arrays(symbols, sources, targets, directed)
+
+    @classmethod
+    def from_edge_file(cls, path, directed=True, format=None, chunk_size=CHUNK_SIZE, parse=None):
+        """
+        Build a CSR graph straight from an edge file, one batch of endpoints at a time.
+
+        Binary batches arrive as `array.fromfile` arrays and text batches as flat label lists,
+        so no per-edge tuple is built. Each batch is interned as a whole: a set difference
+        finds its new labels, the ids of all its endpoints are looked up by one `itemgetter`
+        and then split into the source and target id arrays by slicing. Weights are ignored,
+        and the garbage collector is paused while reading.
+
+        Args:
+            path (str): The edge file.
+            directed (bool, optional): If False, every edge is stored in both directions.
+            format (str, optional): "csv", "tsv" or "binary"; guessed from the extension
+                if omitted.
+            chunk_size (int, optional): Edges per batch.
+            parse (callable, optional): Converts text labels, e.g. `int`; ignored for
+                binary files.
+
+        Returns:
+            CSRGraph: The frozen graph.
+
+        Raises:
+            ValueError: If the format is unknown, a text line has the wrong number of
+                columns or a binary file is truncated.
+        """
+        symbols = SymbolTable()
+        ids, intern = symbols.ids, symbols.intern
+        sources = array("q")
+        targets = array("q")
+
+        # Text batches allocate a short-lived list per line; see `load_edge_list`.
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            for labels in read_endpoint_chunks(path, format, chunk_size, parse):
+                # Intern the new labels in order of first appearance, as `from_edge_list` does.
+                missing = set(labels).difference(ids)
+                for label in labels:
+                    if not missing:
+                        break
+                    if label in missing:
+                        missing.discard(label)
+                        intern(label)
+
+                endpoints = array("q", itemgetter(*labels)(ids))
+                sources.extend(endpoints[0::2])
+                targets.extend(endpoints[1::2])
+        finally:
+            if collecting:
+                gc.enable()
+
+        if not directed:
+            sources, targets = sources + targets, targets + sources
+
+        return cls._from_id_arrays(symbols, sources, targets, directed)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Build a CSR snapshot of an existing adjacency-list graph.
+
+        Works with any graph class of this package: those exposing `adjacency_list`
+        (DirectedGraph, UndirectedGraph) and those exposing `graph` plus `vertices`
+        (BFSGraph, DFSGraph, DirectedAcyclicGraph). Graphs that keep an `interned` id
+        adjacency are copied from it without hashing any label, and their vertex ids carry
+        over to the snapshot, unless removed vertices left tombstones among the ids.
+
+        Args:
+            graph: The graph to snapshot.
+
+        Returns:
+            CSRGraph: The frozen graph.
+        """
+        directed = not isinstance(graph, UndirectedGraph)
+        interned = getattr(graph, "interned", None)
+        if interned is not None and not interned.symbols.removed:
+            if interned.indexed:
+                # Expand {neighbor id: multiplicity} rows into one entry per edge
+                rows = [sorted(chain.from_iterable(map(repeat, row, row.values())))
+                        for row in interned.rows]
+            else:
+                rows = [sorted(row) for row in interned.rows]
+            return cls._from_rows(interned.symbols.copy(), rows, directed)
+
+        adjacency = getattr(graph, "adjacency_list", None)
+        if adjacency is None:
+            adjacency = graph.graph
+            vertices = graph.vertices
+        else:
+            vertices = adjacency.keys()
+
+        # Indexed-mode graphs store {neighbor: multiplicity}; their `neighbors` expands it.
+        neighbors_of = getattr(graph, "neighbors", None)
+        if neighbors_of is None:
+            def neighbors_of(vertex):
+                return adjacency.get(vertex, ())
+
+        symbols = SymbolTable(vertices)
+        labels = list(symbols.labels)
+
+        # Every neighbor list is copied once; `sorted` turns each row into the CSR order.
+        try:
+            lookup = symbols.ids.__getitem__
+            rows = [sorted(map(lookup, neighbors_of(vertex))) for vertex in labels]
+        except KeyError:
+            # Some neighbor was never registered as a vertex; intern on the fly instead.
+            intern = symbols.intern
+            rows = [sorted(map(intern, neighbors_of(vertex))) for vertex in labels]
+            rows.extend([] for _ in range(len(symbols) - len(rows)))
+
+        return cls._from_rows(symbols, rows, directed)
+
+    @classmethod
+    def _from_rows(cls, symbols, rows, directed):
+        """
+        Build the CSR arrays from one sorted list of neighbor ids per vertex.
+
+        Args:
+            symbols (SymbolTable): The vertex label table.
+            rows (list): Sorted neighbor ids of every vertex, in id order.
+            directed (bool): Whether the graph is directed.
+
+        Returns:
+            CSRGraph: The frozen graph.
+        """
+        offsets = array(_index_typecode(sum(len(row) for row in rows)), [0])
+        targets = array(_index_typecode(len(symbols)))
+        for row in rows:
+            targets.extend(row)
+            offsets.append(len(targets))
+
+        return cls(symbols, offsets, targets, directed)
+
+    @classmethod
+    def _from_id_arrays(cls, symbols, sources, targets, directed):
+        """
+        Build the CSR arrays from parallel source/target id arrays with a counting sort.
+
+        Args:
+            symbols (SymbolTable): The vertex label table.
+            sources (array): Source id of each edge.
+            targets (array): Target id of each edge.
+            directed (bool): Whether the graph is directed.
+
+        Returns:
+            CSRGraph: The frozen graph.
+        """
+        vertex_count = len(symbols)
+        edge_count = len(sources)
+
+        # Count the out-degree of every vertex and turn the counts into row offsets.
+        offsets = array(_index_typecode(edge_count), [0]) * (vertex_count + 1)
+        for source in sources:
+            offsets[source + 1] += 1
+        for vertex_id in range(vertex_count):
+            offsets[vertex_id + 1] += offsets[vertex_id]
+
+        # Scatter each target into the next free slot of its source row.
+        cursor = offsets[:-1]
+        row_targets = array(_index_typecode(vertex_count), [0]) * edge_count
+        for source, target in zip(sources, targets):
+            row_targets[cursor[source]] = target
+            cursor[source] += 1
+
+        # Sort every row so membership tests can use binary search.
+        for vertex_id in range(vertex_count):
+            start, end = offsets[vertex_id], offsets[vertex_id + 1]
+            if end - start > 1:
+                row_targets[start:end] = array(row_targets.typecode, sorted(row_targets[start:end]))
+
+        return cls(symbols, offsets, row_targets, directed)
+
+    def transpose(self):
+        """
+        Build the reverse graph, in which every edge points the other way.
+
+        The result shares the symbol table, so vertex ids are the same in both graphs; row i of
+        the transpose lists the ids of the vertices with an edge into vertex i.
+
+        Returns:
+            CSRGraph: The transposed graph.
+        """
+        sources = array("q")
+        for vertex_id in range(self.num_vertices()):
+            sources.extend([vertex_id] * (self.offsets[vertex_id + 1] - self.offsets[vertex_id]))
+
+        return self._from_id_arrays(self.symbols, array("q", self.targets), sources, self.directed)
+
+    def num_vertices(self):
+        """
+        Return the number of vertices in the graph.
+
+        Returns:
+            int: The vertex count.
+        """
+        return len(self.offsets) - 1
+
+    def num_edges(self):
+        """
+        Return the number of stored edges (undirected edges are stored twice).
+
+        Returns:
+            int: The stored edge count.
+        """
+        return self.offsets[-1]
+
+    def neighbor_ids(self, vertex_id):
+        """
+        Return the sorted neighbor ids of a vertex id as a contiguous slice.
+
+        Args:
+            vertex_id (int): The vertex id.
+
+        Returns:
+            array: The neighbor ids.
+        """
+        return self.targets[self.offsets[vertex_id]:self.offsets[vertex_id + 1]]
+
+    def neighbors(self, vertex):
+        """
+        Iterate over the neighbors of a vertex.
+
+        Args:
+            vertex (hashable): The vertex label.
+
+        Yields:
+            hashable: The label of each neighbor, in ascending id order.
+        """
+        vertex_id = self.symbols.get(vertex)
+        if vertex_id is None:
+            return
+
+        labels = self.symbols.labels
+        for neighbor_id in self.neighbor_ids(vertex_id):
+            yield labels[neighbor_id]
+
+    def degree(self, vertex):
+        """
+        Return the number of stored edges leaving a vertex.
+
+        Args:
+            vertex (hashable): The vertex label.
+
+        Returns:
+            int: The out-degree, or 0 for unknown vertices.
+        """
+        vertex_id = self.symbols.get(vertex)
+        if vertex_id is None:
+            return 0
+        return self.offsets[vertex_id + 1] - self.offsets[vertex_id]
+
+    def has_edge(self, source, target):
+        """
+        Check if an edge exists from the source to the target vertex.
+
+        Uses binary search over the sorted row, so the cost is O(log degree).
+
+        Args:
+            source (hashable): The starting vertex.
+            target (hashable): The vertex to look for among the neighbors of source.
+
+        Returns:
+            bool: True if the edge exists, False otherwise.
+        """
+        source_id = self.symbols.get(source)
+        target_id = self.symbols.get(target)
+        if source_id is None or target_id is None:
+            return False
+
+        end = self.offsets[source_id + 1]
+        position = bisect_left(self.targets, target_id, self.offsets[source_id], end)
+        return position < end and self.targets[position] == target_id
+
+    def close(self):
+        """
+        Release the file mapping of a graph opened with `open_graph_file`.
+
+        Does nothing for graphs built in memory. The graph must not be used afterwards.
+
+        Raises:
+            BufferError: If slices of the mapped arrays (e.g. from `neighbor_ids`) are still alive.
+        """
+        if self._mapping is not None:
+            mapping, views = self._mapping
+            for view in views:
+                view.release()
+            mapping.close()
+            self._mapping = None
+
+    def __len__(self):
+        return self.num_vertices()
+
+    def __contains__(self, vertex):
+        return vertex in self.symbols
+
+    def __iter__(self):
+        return iter(self.symbols)
+
+    def print(self):
+        """
+        Print the adjacency list of the graph to show the vertices and their neighbors.
+        """
+        for vertex in self.symbols:
+            print(f"{vertex} : {list(self.neighbors(vertex))}")
@@ -0,0 +1,267 @@
+import mmap
+import struct
+import sys
+from array import array
+
+from Graphs.CSRGraphs.source.csr_graph import CSRGraph
+from Graphs.SymbolTables.source.symbol_table import SymbolTable
+
+# File layout (all sections start at a multiple of 8 bytes):
+#
+#   header         HEADER struct, see below
+#   label offsets  vertex_count + 1 unsigned 64-bit positions into the label blob
+#   label blob     one record per vertex: a kind byte (LABEL_STR or LABEL_INT) + UTF-8 text
+#   offsets        vertex_count + 1 CSR row offsets (typecode stored in the header)
+#   targets        edge_count CSR neighbor ids (typecode stored in the header)
+#
+# Integers are stored in the byte order of the machine that wrote the file, which is recorded
+# in the header; the arrays can then be mapped and used without any decoding.
+MAGIC = b"TAGCSR01"
+HEADER = struct.Struct("=8s1sB1s1s4xQQQQQQQ")
+LABEL_STR = b"s"
+LABEL_INT = b"i"
+
+
+def _align(position):
+    """
+    Round a file position up to the next multiple of 8.
+
+    Args:
+        position (int): The position.
+
+    Returns:
+        int: The aligned position.
+    """
+    return (position + 7) & ~7
+
+
+def _typecode(sequence):
+    """
+    Return the item typecode of an array or of a cast memoryview.
+
+    Args:
+        sequence (array or memoryview): The sequence.
+
+    Returns:
+        str: The typecode, e.g. 'i' or 'q'.
+    """
+    return sequence.format if isinstance(sequence, memoryview) else sequence.typecode
+
+
+def _encode_label(label):
+    """
+    Encode a vertex label as a kind byte followed by its UTF-8 text.
+
+    Args:
+        label (str or int): The label.
+
+    Returns:
+        bytes: The encoded label.
+
+    Raises:
+        TypeError: If the label is neither a string nor an integer.
+    """
+    if isinstance(label, str):
+        return LABEL_STR + label.encode("utf-8")
+    if isinstance(label, int) and not isinstance(label, bool):
+        return LABEL_INT + str(label).encode("ascii")
+    raise TypeError(f"Only str and int vertex labels can be stored, got {type(label).__name__}!")
+
+
+def _decode_label(record):
+    """
+    Decode a label record produced by `_encode_label`.
+
+    Args:
+        record (bytes): The encoded label.
+
+    Returns:
+        str or int: The label.
+    """
+    text = bytes(record[1:]).decode("utf-8")
+    return int(text) if record[:1] == LABEL_INT else text
+
+
+def write_graph_file(graph, path):
+    """
+    Write a graph to a binary CSR file that `open_graph_file` can map into memory.
+
+    Args:
+        graph: A CSRGraph, or any graph accepted by `CSRGraph.from_graph`.
+        path (str): The file to write.
+
+    Raises:
+        TypeError: If a vertex label is neither a string nor an integer.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_graph(graph)
+
+    vertex_count = graph.num_vertices()
+    edge_count = graph.num_edges()
+
+    # Encode the vertex table up front; it is small compared to the edge arrays.
+    label_offsets = array("Q", [0])
+    label_blob = bytearray()
+    for label in graph.symbols:
+        label_blob += _encode_label(label)
+        label_offsets.append(len(label_blob))
+
+    # Arrays and mapped memoryviews are both written as their raw bytes.
+    offsets_bytes = memoryview(graph.offsets).cast("B")
+    targets_bytes = memoryview(graph.targets).cast("B")
+
+    label_offsets_position = _align(HEADER.size)
+    label_blob_position = label_offsets_position + label_offsets.itemsize * len(label_offsets)
+    offsets_position = _align(label_blob_position + len(label_blob))
+    targets_position = _align(offsets_position + len(offsets_bytes))
+
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(
+            MAGIC, b"<" if sys.byteorder == "little" else b">", int(graph.directed),
+            _typecode(graph.offsets).encode(), _typecode(graph.targets).encode(),
+            vertex_count, edge_count, label_offsets_position, label_blob_position, len(label_blob),
+            offsets_position, targets_position,
+        ))
+
+        file.write(bytes(label_offsets_position - file.tell()))
+        label_offsets.tofile(file)
+        file.write(label_blob)
+
+        file.write(bytes(offsets_position - file.tell()))
+        file.write(offsets_bytes)
+
+        file.write(bytes(targets_position - file.tell()))
+        file.write(targets_bytes)
+
+
+def open_graph_file(path):
+    """
+    Open a graph file written by `write_graph_file` without loading it into memory.
+
+    The file is mapped read-only with mmap and the CSR arrays of the returned graph are
+    memoryviews over the mapping, so opening is O(1) in the number of edges and neighbor
+    scans read directly from the page cache. Processes that open the same file share those
+    pages. Vertex labels are decoded on demand; the label-to-id dictionary is only built the
+    first time a vertex is looked up by label.
+
+    Call `close()` on the returned graph to release the mapping.
+
+    Args:
+        path (str): The file to open.
+
+    Returns:
+        CSRGraph: The mapped, read-only graph.
+
+    Raises:
+        ValueError: If the file is not a graph file or was written on a machine with a
+            different byte order.
+    """
+    with open(path, "rb") as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    (magic, byte_order, directed, offsets_typecode, targets_typecode,
+     vertex_count, edge_count, label_offsets_position, label_blob_position, label_blob_size,
+     offsets_position, targets_position) = HEADER.unpack_from(mapping)
+
+    if magic != MAGIC:
+        mapping.close()
+        raise ValueError(f"{path} is not a graph file!")
+    if byte_order != (b"<" if sys.byteorder == "little" else b">"):
+        mapping.close()
+        raise ValueError(f"{path} was written with a different byte order!")
+
+    view = memoryview(mapping)
+    offsets_typecode = offsets_typecode.decode()
+    targets_typecode = targets_typecode.decode()
+    offsets_size = array(offsets_typecode).itemsize * (vertex_count + 1)
+    targets_size = array(targets_typecode).itemsize * edge_count
+
+    sections = [
+        view[label_offsets_position:label_blob_position].cast("Q"),
+        view[label_blob_position:label_blob_position + label_blob_size],
+        view[offsets_position:offsets_position + offsets_size].cast(offsets_typecode),
+        view[targets_position:targets_position + targets_size].cast(targets_typecode),
+    ]
+    graph = CSRGraph(MappedSymbolTable(sections[0], sections[1]), sections[2], sections[3],
+                     directed=bool(directed))
+    graph._mapping = (mapping, sections + [view])
+    return graph
+
+
+class MappedLabels:
+    """
+    A read-only sequence of vertex labels decoded on demand from a mapped label table.
+
+    Attributes:
+        label_offsets (memoryview): Start of every label record in the blob, plus the end.
+        label_blob (memoryview): The concatenated label records.
+    """
+
+    def __init__(self, label_offsets, label_blob):
+        """
+        Initializes the sequence over mapped label data.
+
+        Args:
+            label_offsets (memoryview): The label offsets section.
+            label_blob (memoryview): The label blob section.
+        """
+        self.label_offsets = label_offsets
+        self.label_blob = label_blob
+
+    def __len__(self):
+        return len(self.label_offsets) - 1
+
+    def __getitem__(self, vertex_id):
+        if not -len(self) <= vertex_id < len(self):
+            raise IndexError("vertex id out of range")
+        vertex_id %= len(self)
+        return _decode_label(self.label_blob[self.label_offsets[vertex_id]:self.label_offsets[vertex_id + 1]])
+
+    def __iter__(self):
+        for vertex_id in range(len(self)):
+            yield self[vertex_id]
+
+
+class MappedSymbolTable(SymbolTable):
+    """
+    A read-only SymbolTable backed by the label table of a mapped graph file.
+
+    Translating ids to labels decodes a single record. The label-to-id dictionary is built on
+    first use, so graphs that are only traversed by id never pay for it.
+    """
+
+    def __init__(self, label_offsets, label_blob):
+        """
+        Initializes the table over mapped label data.
+
+        Args:
+            label_offsets (memoryview): The label offsets section.
+            label_blob (memoryview): The label blob section.
+        """
+        self.labels = MappedLabels(label_offsets, label_blob)
+        self._ids = None
+        self.removed = 0  # Mapped tables cannot remove labels
+
+    @property
+    def ids(self):
+        """
+        dict: Maps each label to its id; built the first time it is needed.
+        """
+        if self._ids is None:
+            self._ids = {label: vertex_id for vertex_id, label in enumerate(self.labels)}
+        return self._ids
+
+    def intern(self, label):
+        """
+        Return the id of a label; mapped tables cannot grow.
+
+        Args:
+            label (hashable): The label to look up.
+
+        Returns:
+            int: The id of the label.
+
+        Raises:
+            KeyError: If the label is not in the table.
+        """
+        return self.ids[label]
@@ -28,4 +28,18 @@ if __name__ == "__main__":
 
     # Perform DFS starting from vertex 'D'
     print("\nDFS Traversal Starting from Vertex D:")
-    graph.dfs("D")
\ No newline at end of file
+    graph.dfs("D")
+
+    # Consume the traversal lazily and stop as soon as 'E' is reached
+    print("\nDFS Traversal From Vertex A Until Vertex E:")
+    for vertex in graph.dfs_iter("A"):
+        print(vertex, end=" ")
+        if vertex == "E":
+            break
+    print()
+
+    # Compute discovery and finish times for every vertex
+    print("\nDFS Discovery and Finish Times From Vertex A:")
+    discovery, finish = graph.dfs_timestamps("A")
+    for vertex in discovery:
+        print(f"{vertex}: discovered at {discovery[vertex]}, finished at {finish[vertex]}")
@@ -1,5 +1,8 @@
 from collections import defaultdict
 
+from Graphs.EdgeLists.source.edge_list import chunked, new_endpoints, split_weights
+from Graphs.SymbolTables.source.interned_adjacency import InternedAdjacency
+
 
 class DFSGraph:
     def __init__(self):
@@ -9,9 +12,25 @@ class DFSGraph:
         Attributes:
             graph (defaultDict): A dictionary where each key is a vertex and the value is a list of adjacent vertices.
             vertices (set): A set containing all vertices in the graph.
+            interned (InternedAdjacency): The adjacency list over integer vertex ids that the
+                traversals run on, built by the first traversal.
         """
         self.graph = defaultdict(list)
         self.vertices = set()
+        self._order = {}  # The vertices in the order they were added (values unused)
+        self._interned = None  # Integer-id mirror of the adjacency list, built on first use
+        self._predecessors = defaultdict(list)  # Reverse adjacency list, used to remove vertices
+
+    @property
+    def interned(self):
+        """
+        InternedAdjacency: The adjacency list over integer vertex ids that the traversals run
+        on. Built from the adjacency list the first time it is needed, with ids handed out in
+        the order the vertices were added, and kept up to date by every later change.
+        """
+        if self._interned is None:
+            self._interned = InternedAdjacency.from_adjacency(self._order, self.graph)
+        return self._interned
 
     def add_vertex(self, vertex):
         """
@@ -21,6 +40,9 @@ class DFSGraph:
             vertex (str): The vertex to be added.
         """
         self.vertices.add(vertex)
+        self._order[vertex] = None
+        if self._interned is not None:
+            self._interned.add_vertex(vertex)
 
     def add_edge(self, u, v):
         """
@@ -39,31 +61,189 @@ class DFSGraph:
             self.add_vertex(v)
 
         self.graph[u].append(v)
+        self._predecessors[v].append(u)
+        if self._interned is not None:
+            self._interned.add_edge(u, v)
         print(f"Edge {u} -> {v} added successfully.")
 
+    def add_edges_from(self, edges):
+        """
+        Add many directed edges at once, without printing a message per edge.
+
+        The edges are consumed in batches. The vertices of a batch are registered together
+        before its edges are appended, so the per-edge work is a single append.
+
+        Args:
+            edges (iterable): (u, v) pairs, or (u, v, weight) triples; the graph is unweighted,
+                so weights are ignored.
+
+        Raises:
+            ValueError: If a batch mixes pairs and triples; that batch is not added.
+        """
+        graph, predecessors = self.graph, self._predecessors
+        for chunk in chunked(edges):
+            pairs, _ = split_weights(chunk)
+            for vertex in new_endpoints(pairs, self.vertices):
+                self.add_vertex(vertex)
+            for u, v in pairs:
+                graph[u].append(v)
+                predecessors[v].append(u)
+            if self._interned is not None:
+                self._interned.add_edges(pairs)
+
+    def remove_edge(self, u, v):
+        """
+        Remove one directed edge from vertex u to vertex v. The vertices stay in the graph.
+
+        Args:
+            u (str): The starting vertex of the edge.
+            v (str): The ending vertex of the edge.
+
+        Raises:
+            ValueError: If the edge does not exist.
+
+        Prints:
+            str: Confirmation message that the edge was removed successfully.
+        """
+        if v not in self.graph.get(u, ()):
+            raise ValueError(f"Edge {u} -> {v} does not exist!")
+
+        self.graph[u].remove(v)
+        self._predecessors[v].remove(u)
+        if self._interned is not None:
+            self._interned.remove_edge(u, v)
+        print(f"Edge {u} -> {v} removed successfully.")
+
+    def remove_vertex(self, vertex):
+        """
+        Remove a vertex together with all its incoming and outgoing edges.
+
+        Only the neighbors of the vertex are touched, found through the adjacency list and the
+        reverse adjacency list. The vertex leaves a tombstone among the interned ids until they
+        are compacted.
+
+        Args:
+            vertex (str): The vertex to remove.
+
+        Raises:
+            ValueError: If the vertex does not exist.
+        """
+        if vertex not in self.vertices:
+            raise ValueError(f"Vertex {vertex} does not exist!")
+
+        self.vertices.remove(vertex)
+        del self._order[vertex]
+        successors = self.graph.pop(vertex, [])
+        predecessors = self._predecessors.pop(vertex, [])
+
+        for successor in set(successors).difference((vertex,)):
+            incoming = self._predecessors[successor]
+            incoming[:] = [u for u in incoming if u != vertex]
+        for predecessor in set(predecessors).difference((vertex,)):
+            neighbors = self.graph[predecessor]
+            neighbors[:] = [v for v in neighbors if v != vertex]
+
+        if self._interned is not None:
+            self._interned.remove_vertex(vertex, predecessors)
+
+    def dfs_iter(self, start_vertex, details=False):
+        """
+        Lazily perform a Depth-First Search (DFS) traversal starting from the specified vertex.
+
+        Vertices are produced one at a time, so callers can stop early or stream them into
+        another stage without building a list. Nothing is produced for an unknown vertex.
+
+        Args:
+            start_vertex (str): The vertex from which to start the DFS traversal.
+            details (bool, optional): If True, yield (vertex, depth, parent) tuples instead of
+                bare vertices. The start vertex has depth 0 and parent None.
+
+        Yields:
+            The vertices in the order they are visited, or (vertex, depth, parent) tuples.
+        """
+        if start_vertex not in self.vertices:
+            return
+
+        # The search runs on interned ids; labels are looked up only for what is yielded
+        labels = self.interned.symbols.labels
+        for vertex_id, depth, parent_id in self.interned.dfs(self.interned.symbols.id_of(start_vertex)):
+            if details:
+                yield labels[vertex_id], depth, None if parent_id == -1 else labels[parent_id]
+            else:
+                yield labels[vertex_id]
+
+    def dfs_events(self, start_vertex=None):
+        """
+        Lazily perform a DFS traversal and report when each vertex is entered and exited.
+
+        A vertex is entered when it is first discovered and exited once every vertex reachable
+        through it has been explored, so the exit events form a post-order. The traversal keeps
+        an explicit stack of neighbor iterators instead of recursing, so it works on graphs of
+        any depth. Neighbors are explored in the same order as `dfs_iter`.
+
+        Args:
+            start_vertex (str, optional): The vertex to start from. If omitted, the traversal
+                restarts from every vertex not reached yet, covering the whole graph.
+
+        Yields:
+            tuple: (vertex, event) pairs where event is "enter" or "exit".
+        """
+        interned = self.interned
+        if start_vertex is None:
+            interned.compact()  # Every id must be a live vertex
+            root_ids = range(len(interned))  # Every vertex, in the order it was added
+        elif start_vertex in self.vertices:
+            root_ids = [interned.symbols.id_of(start_vertex)]
+        else:
+            return
+
+        labels = interned.symbols.labels
+        for vertex_id, entered in interned.dfs_events(root_ids):
+            yield labels[vertex_id], "enter" if entered else "exit"
+
+    def dfs_timestamps(self, start_vertex=None):
+        """
+        Compute DFS discovery and finish times.
+
+        Every enter or exit event advances a shared clock by one, so for vertices u and v,
+        v is a descendant of u in the DFS forest exactly when
+        discovery[u] < discovery[v] < finish[v] < finish[u].
+
+        Args:
+            start_vertex (str, optional): The vertex to start from; defaults to the whole graph.
+
+        Returns:
+            tuple: (discovery, finish) dictionaries mapping each reached vertex to its time.
+        """
+        discovery = {}
+        finish = {}
+        for time, (vertex, event) in enumerate(self.dfs_events(start_vertex), start=1):
+            if event == "enter":
+                discovery[vertex] = time
+            else:
+                finish[vertex] = time
+        return discovery, finish
+
     def dfs(self, start_vertex):
         """
         Perform a Depth-First Search (DFS) traversal starting from the specified vertex.
 
+        This is a printing wrapper around `dfs_iter`.
+
         Args:
             start_vertex (str): The vertex from which to start the DFS traversal.
 
         Prints:
             str: The vertices visited during the DFS traversal in the order they are visited.
         """
-        visited = set()
-        stack = list(start_vertex)
+        if start_vertex not in self.vertices:
+            print(f"Vertex '{start_vertex}' does not exist in the graph.")
+            return
 
-        while len(stack) != 0:
-            current_vertex = stack.pop()
-            if current_vertex not in visited:
-                visited.add(current_vertex)
-                print(current_vertex, end=" ")
+        for vertex in self.dfs_iter(start_vertex):
+            print(vertex, end=" ")
 
-                # Add neighbors in reverse order to maintain order of traversal
-                for neighbor in reversed(self.graph.get(current_vertex, [])):
-                    if neighbor not in visited:
-                        stack.append(neighbor)
+        print()
 
     def display(self):
         """
@@ -0,0 +1,38 @@
+import time
+
+from Graphs.DirectedAcyclicGraphs.source.dag_executor import DAGExecutor
+from Graphs.DirectedAcyclicGraphs.source.directed_acyclic_graph import DirectedAcyclicGraph
+
+
+def build_step(vertex):
+    """Pretend to build a target; the "broken" target always fails."""
+    time.sleep(0.1)
+    if vertex == "broken":
+        raise RuntimeError(f"{vertex} failed to build")
+    return f"{vertex} built"
+
+
+if __name__ == "__main__":
+    # Model build targets: an edge A -> B means B needs A to be built first
+    dag = DirectedAcyclicGraph.from_edge_list([
+        ("fetch", "compile_a"),
+        ("fetch", "compile_b"),
+        ("fetch", "broken"),
+        ("compile_a", "link"),
+        ("compile_b", "link"),
+        ("broken", "package_docs"),
+        ("link", "package"),
+    ])
+
+    # Run every step on a thread pool, as soon as its dependencies are done
+    executor = DAGExecutor(dag, max_workers=4)
+    results = executor.run(build_step)
+
+    print("Task results:")
+    for vertex in dag.topological_sort():
+        task_result = results[vertex]
+        duration = "-" if task_result.duration is None else f"{task_result.duration:.2f}s"
+        print(f"{vertex:>12}: {task_result.status:<8} {duration}")
+
+    print("\nSummary:")
+    print(DAGExecutor.summary(results))
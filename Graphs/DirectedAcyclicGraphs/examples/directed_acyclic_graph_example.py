@@ -28,6 +28,10 @@ if __name__ == "__main__":
     print("\nTopological Sort:")
     print(dag.topological_sort())
 
+    # Group the vertices into levels that can be processed in parallel
+    print("\nTopological Levels:")
+    print(dag.topological_sort(levels=True))
+
     # Perform iterative DFS traversal starting from vertex 'A'
     print("\nDFS Traversal Starting from Vertex A:")
     dag.dfs_iterative("A", process=lambda v: print(v, end=" "))
@@ -37,3 +41,33 @@ if __name__ == "__main__":
     print("\nDFS Traversal Starting from Vertex C:")
     dag.dfs_iterative("C", process=lambda v: print(v, end=" "))
     print()
+
+    # Build a DAG from an edge list with a single cycle check at the end
+    print("\nBulk-loaded DAG:")
+    bulk_dag = DirectedAcyclicGraph.from_edge_list([("A", "B"), ("B", "C"), ("A", "C")])
+    bulk_dag.display()
+
+    # A bulk load that closes a cycle is rolled back completely
+    try:
+        bulk_dag.add_edges_from([("C", "D"), ("D", "A")])
+    except ValueError as e:
+        print(e)
+
+    # Dependency queries are answered from a reachability index built on first use
+    print("\nDoes A lead to E?", "Yes" if dag.reaches("A", "E") else "No")
+    print("Does E lead to A?", "Yes" if dag.reaches("E", "A") else "No")
+
+    # Critical path of a build: vertex weights are durations, edge weights extra delays
+    print("\nBuild schedule:")
+    build = DirectedAcyclicGraph.from_edge_list([("fetch", "compile"), ("fetch", "docs"),
+                                                 ("compile", "test"), ("docs", "package"),
+                                                 ("test", "package", 0.5)])
+    for task, duration in [("fetch", 2), ("compile", 10), ("docs", 3), ("test", 6), ("package", 1)]:
+        build.set_vertex_weight(task, duration)
+    length, path = build.critical_path()
+    print(f"Critical path ({length}): {' -> '.join(path)}")
+    print("Slack of docs:", build.schedule().slack("docs"))
+
+    # Changing one duration updates the schedule incrementally
+    build.set_vertex_weight("test", 2)
+    print("After speeding up the tests:", build.critical_path())
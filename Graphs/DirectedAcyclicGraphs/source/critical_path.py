@@ -0,0 +1,322 @@
+from array import array
+from heapq import heappop, heappush
+from itertools import accumulate
+
+
+class CriticalPath:
+    """
+    A class to compute the critical path schedule of a weighted DirectedAcyclicGraph.
+
+    Vertex weights are durations and edge weights are extra delays between the end of a
+    vertex and the start of its successor. With every vertex starting as early as its
+    predecessors allow:
+
+    * earliest_start(v) is the largest earliest_finish(u) + weight(u, v) over the edges
+      (u, v), or 0 for a vertex without predecessors;
+    * earliest_finish(v) = earliest_start(v) + weight(v);
+    * the length of the schedule is the largest earliest finish;
+    * latest_start(v) is the latest start that does not delay the schedule, computed the
+      same way backwards from the length;
+    * slack(v) = latest_start(v) - earliest_start(v). Vertices without slack are critical,
+      and the longest path through the DAG runs through them.
+
+    Both passes visit the vertices once in topological order and every edge once, reading
+    the weights from the DAG's id-indexed arrays and writing the times into float arrays
+    indexed by the same ids.
+
+    When a single weight changes, `update_vertex` and `update_edge` only revisit the vertices
+    whose times actually move, processed in topological order through a heap. The latest
+    times are recomputed in full only if the length of the schedule changes.
+
+    Attributes:
+        dag (DirectedAcyclicGraph): The scheduled graph.
+        length (float): The length of the schedule, i.e. the weight of the longest path.
+    """
+
+    def __init__(self, dag):
+        """
+        Compute the schedule for the current state of a DAG.
+
+        Args:
+            dag (DirectedAcyclicGraph): The graph to schedule.
+        """
+        self.dag = dag
+        self._build()
+
+    def _build(self):
+        """
+        (Re)compute every time from scratch.
+        """
+        order, _ = self.dag._kahn_ids()
+        self._order = order
+        self._position = array("q", [0]) * len(order)
+        for position, vertex_id in enumerate(order):
+            self._position[vertex_id] = position
+        self._reverse = None  # Built by the first incremental update
+
+        self._forward()
+        self._backward()
+
+    def _forward(self):
+        """
+        Compute the earliest start and finish of every vertex, pushing finishes along the edges.
+        """
+        rows = self.dag.interned.rows
+        durations = self.dag._vertex_weights
+        delays = self.dag._edge_weights
+        start = array("d", bytes(8 * len(rows)))
+        finish = array("d", bytes(8 * len(rows)))
+
+        for vertex_id in self._order:
+            end = start[vertex_id] + durations[vertex_id]
+            finish[vertex_id] = end
+            for neighbor_id, delay in zip(rows[vertex_id], delays[vertex_id]):
+                if end + delay > start[neighbor_id]:
+                    start[neighbor_id] = end + delay
+
+        self._start = start
+        self._finish = finish
+        self.length = max(finish, default=0.0)
+
+    def _backward(self):
+        """
+        Compute the latest start of every vertex, pulling from its successors.
+        """
+        rows = self.dag.interned.rows
+        durations = self.dag._vertex_weights
+        delays = self.dag._edge_weights
+        length = self.length
+        latest = array("d", [length]) * len(rows)
+
+        for vertex_id in reversed(self._order):
+            end = length
+            for neighbor_id, delay in zip(rows[vertex_id], delays[vertex_id]):
+                if latest[neighbor_id] - delay < end:
+                    end = latest[neighbor_id] - delay
+            latest[vertex_id] = end - durations[vertex_id]
+
+        self._latest = latest
+
+    def _reverse_index(self):
+        """
+        Return the incoming edges of every vertex in compressed form, building them once.
+
+        Returns:
+            tuple: (offsets, sources, delays) arrays; the edges into vertex v are at
+            positions offsets[v] to offsets[v + 1] of sources and delays.
+        """
+        if self._reverse is None:
+            rows = self.dag.interned.rows
+            edge_weights = self.dag._edge_weights
+            offsets = array("q", [0])
+            offsets.extend(accumulate(self.dag._in_degrees()))
+            cursor = offsets[:-1]
+            sources = array("q", [0]) * offsets[-1]
+            delays = array("d", bytes(8 * offsets[-1]))
+
+            for vertex_id, row in enumerate(rows):
+                for neighbor_id, delay in zip(row, edge_weights[vertex_id]):
+                    slot = cursor[neighbor_id]
+                    sources[slot] = vertex_id
+                    delays[slot] = delay
+                    cursor[neighbor_id] = slot + 1
+
+            self._reverse = offsets, sources, delays
+        return self._reverse
+
+    def update_vertex(self, vertex_id):
+        """
+        Update the schedule after the weight of one vertex changed.
+
+        Args:
+            vertex_id (int): The id of the vertex whose weight changed.
+        """
+        self._propagate(vertex_id, vertex_id)
+
+    def update_edge(self, source_id, target_id):
+        """
+        Update the schedule after the weight of the edges between two vertices changed.
+
+        Args:
+            source_id (int): The id of the edge's source.
+            target_id (int): The id of the edge's target.
+        """
+        # Copy the new weights into the incoming edges of the target; both hold the parallel
+        # edges in the same order
+        offsets, sources, delays = self._reverse_index()
+        weights = (weight for neighbor_id, weight in zip(self.dag.interned.rows[source_id],
+                                                         self.dag._edge_weights[source_id])
+                   if neighbor_id == target_id)
+        for slot in range(offsets[target_id], offsets[target_id + 1]):
+            if sources[slot] == source_id:
+                delays[slot] = next(weights)
+        self._propagate(target_id, source_id)
+
+    def _propagate(self, forward_id, backward_id):
+        """
+        Recompute the times that depend on a changed weight.
+
+        Args:
+            forward_id (int): The first vertex whose earliest times may change.
+            backward_id (int): The first vertex whose latest start may change.
+        """
+        rows = self.dag.interned.rows
+        durations = self.dag._vertex_weights
+        delays = self.dag._edge_weights
+        offsets, sources, source_delays = self._reverse_index()
+        position = self._position
+        start, finish, latest = self._start, self._finish, self._latest
+
+        # Forward, in topological order: a vertex is final once all its predecessors are
+        heap = [(position[forward_id], forward_id)]
+        queued = {forward_id}
+        while heap:
+            _, vertex_id = heappop(heap)
+            earliest = 0.0
+            for slot in range(offsets[vertex_id], offsets[vertex_id + 1]):
+                if finish[sources[slot]] + source_delays[slot] > earliest:
+                    earliest = finish[sources[slot]] + source_delays[slot]
+            start[vertex_id] = earliest
+            if earliest + durations[vertex_id] != finish[vertex_id]:
+                finish[vertex_id] = earliest + durations[vertex_id]
+                for neighbor_id in rows[vertex_id]:
+                    if neighbor_id not in queued:
+                        queued.add(neighbor_id)
+                        heappush(heap, (position[neighbor_id], neighbor_id))
+
+        length = max(finish, default=0.0)
+        if length != self.length:
+            # Every latest time is measured from the end of the schedule
+            self.length = length
+            self._backward()
+            return
+
+        # Backward, in reverse topological order, under an unchanged length
+        heap = [(-position[backward_id], backward_id)]
+        queued = {backward_id}
+        while heap:
+            _, vertex_id = heappop(heap)
+            end = length
+            for neighbor_id, delay in zip(rows[vertex_id], delays[vertex_id]):
+                if latest[neighbor_id] - delay < end:
+                    end = latest[neighbor_id] - delay
+            if end - durations[vertex_id] != latest[vertex_id]:
+                latest[vertex_id] = end - durations[vertex_id]
+                for slot in range(offsets[vertex_id], offsets[vertex_id + 1]):
+                    if sources[slot] not in queued:
+                        queued.add(sources[slot])
+                        heappush(heap, (-position[sources[slot]], sources[slot]))
+
+    def _tolerance(self):
+        """
+        Return the largest slack still treated as none, absorbing float rounding.
+
+        Returns:
+            float: The tolerance, relative to the length of the schedule.
+        """
+        return 1e-9 * max(1.0, abs(self.length))
+
+    def earliest_start(self, vertex):
+        """
+        Return the earliest time a vertex can start.
+
+        Args:
+            vertex (str): The vertex.
+
+        Returns:
+            float: The earliest start.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        return self._start[self.dag.interned.symbols.ids[vertex]]
+
+    def earliest_finish(self, vertex):
+        """
+        Return the earliest time a vertex can finish.
+
+        Args:
+            vertex (str): The vertex.
+
+        Returns:
+            float: The earliest start plus the vertex weight.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        return self._finish[self.dag.interned.symbols.ids[vertex]]
+
+    def latest_start(self, vertex):
+        """
+        Return the latest time a vertex can start without delaying the schedule.
+
+        Args:
+            vertex (str): The vertex.
+
+        Returns:
+            float: The latest start.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        return self._latest[self.dag.interned.symbols.ids[vertex]]
+
+    def slack(self, vertex):
+        """
+        Return how long a vertex can be delayed without delaying the schedule.
+
+        Args:
+            vertex (str): The vertex.
+
+        Returns:
+            float: The latest minus the earliest start; 0 for critical vertices.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        vertex_id = self.dag.interned.symbols.ids[vertex]
+        return self._latest[vertex_id] - self._start[vertex_id]
+
+    def is_critical(self, vertex):
+        """
+        Check if a vertex lies on a critical path.
+
+        Args:
+            vertex (str): The vertex.
+
+        Returns:
+            bool: True if the vertex has no slack.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        return self.slack(vertex) <= self._tolerance()
+
+    def path(self):
+        """
+        Return one critical path, i.e. a longest path through the DAG.
+
+        The path starts at a critical vertex that starts at time 0 and follows edges to
+        critical successors that start exactly when the previous vertex finishes (plus the
+        edge weight) until it reaches a vertex finishing at the end of the schedule.
+
+        Returns:
+            list: The vertices of the path, empty for an empty graph.
+        """
+        rows = self.dag.interned.rows
+        labels = self.dag.interned.symbols.labels
+        delays = self.dag._edge_weights
+        start, finish, latest = self._start, self._finish, self._latest
+        tolerance = self._tolerance()
+
+        vertex_id = next((vertex_id for vertex_id in self._order
+                          if start[vertex_id] <= tolerance
+                          and latest[vertex_id] - start[vertex_id] <= tolerance), None)
+        path = []
+        while vertex_id is not None:
+            path.append(labels[vertex_id])
+            end = finish[vertex_id]
+            vertex_id = next((neighbor_id for neighbor_id, delay in zip(rows[vertex_id], delays[vertex_id])
+                              if latest[neighbor_id] - start[neighbor_id] <= tolerance
+                              and abs(start[neighbor_id] - end - delay) <= tolerance), None)
+        return path
@@ -0,0 +1,216 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+
+def _run_timed(function, args):
+    """
+    Call a task and measure it, turning exceptions into a failure result.
+
+    Defined at module level so that it can be pickled for process pools.
+
+    Args:
+        function (callable): The task to call.
+        args (tuple): Positional arguments for the task.
+
+    Returns:
+        tuple: (succeeded, result or exception, wall-clock start time, duration in seconds).
+    """
+    started = time.time()
+    start = time.perf_counter()
+    try:
+        result = function(*args)
+    except Exception as error:
+        return False, error, started, time.perf_counter() - start
+    return True, result, started, time.perf_counter() - start
+
+
+class TaskResult:
+    """
+    A class representing the outcome of one vertex task run by a DAGExecutor.
+
+    Attributes:
+        vertex (any): The vertex the task belongs to.
+        status (str): "done", "failed", or "skipped" (a predecessor failed).
+        result (any): The task's return value, if it succeeded.
+        error (Exception): The exception raised by the task, if it failed.
+        started (float): Wall-clock time (time.time()) the task started, or None if skipped.
+        duration (float): Seconds the task ran, or None if skipped.
+    """
+
+    def __init__(self, vertex, status, result=None, error=None, started=None, duration=None):
+        """
+        Initializes a TaskResult.
+
+        Args:
+            vertex (any): The vertex the task belongs to.
+            status (str): "done", "failed", or "skipped".
+            result (any, optional): The task's return value.
+            error (Exception, optional): The exception raised by the task.
+            started (float, optional): Wall-clock start time.
+            duration (float, optional): Run time in seconds.
+        """
+        self.vertex = vertex
+        self.status = status
+        self.result = result
+        self.error = error
+        self.started = started
+        self.duration = duration
+
+    def __repr__(self):
+        """
+        Returns a string representation of the TaskResult instance.
+
+        Returns:
+            str: A string representing the TaskResult.
+        """
+        return f"TaskResult({self.vertex!r}, {self.status})"
+
+
+class DAGExecutor:
+    """
+    A class that runs one task per vertex of a DirectedAcyclicGraph on a worker pool.
+
+    An edge source -> target means that the target's task may only start once the source's task
+    has finished. Each task is dispatched as soon as all of its predecessors are done, so the pool
+    is kept as busy as the width of the graph allows instead of waiting for whole levels. If a
+    task fails, every task that depends on it (directly or transitively) is skipped; independent
+    branches keep running.
+
+    Attributes:
+        dag (DirectedAcyclicGraph): The dependency graph.
+        max_workers (int): Maximum number of tasks running at the same time.
+        use_processes (bool): Run tasks in a process pool instead of a thread pool.
+    """
+
+    def __init__(self, dag, max_workers=None, use_processes=False):
+        """
+        Initializes the executor.
+
+        Args:
+            dag (DirectedAcyclicGraph): The dependency graph.
+            max_workers (int, optional): Maximum concurrency; defaults to the pool's default.
+            use_processes (bool, optional): If True, use a ProcessPoolExecutor. Tasks and their
+                results must then be picklable.
+        """
+        self.dag = dag
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+
+    def run(self, tasks):
+        """
+        Run the tasks of all vertices, respecting the dependencies of the DAG.
+
+        Args:
+            tasks (callable or dict): Either a single callable invoked as `tasks(vertex)` for
+                every vertex, or a dictionary mapping vertices to zero-argument callables.
+                Vertices missing from the dictionary count as finished immediately.
+
+        Returns:
+            dict: Maps every vertex to its TaskResult.
+        """
+        dag = self.dag
+        results = {}
+        # Remaining unfinished predecessors of each vertex, in stable insertion order
+        in_degree = {vertex: dag.in_degree(vertex) for vertex in dag._order}
+        ready = [vertex for vertex, degree in in_degree.items() if degree == 0]
+        pool_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+
+        with pool_class(max_workers=self.max_workers) as pool:
+            pending = {}  # future -> vertex
+
+            while ready or pending:
+                # Dispatch everything whose dependencies are satisfied; vertices without a
+                # task finish at once and may append more ready vertices to the list being walked
+                for vertex in ready:
+                    if isinstance(tasks, dict):
+                        if vertex not in tasks:
+                            results[vertex] = TaskResult(vertex, "done", started=time.time(), duration=0.0)
+                            ready.extend(self._release(vertex, in_degree, results))
+                            continue
+                        future = pool.submit(_run_timed, tasks[vertex], ())
+                    else:
+                        future = pool.submit(_run_timed, tasks, (vertex,))
+                    pending[future] = vertex
+                ready = []
+
+                if not pending:
+                    continue
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    vertex = pending.pop(future)
+                    succeeded, value, started, duration = future.result()
+
+                    if succeeded:
+                        results[vertex] = TaskResult(vertex, "done", result=value,
+                                                     started=started, duration=duration)
+                        ready.extend(self._release(vertex, in_degree, results))
+                    else:
+                        results[vertex] = TaskResult(vertex, "failed", error=value,
+                                                     started=started, duration=duration)
+                        self._skip_dependents(vertex, results)
+
+        return results
+
+    def _release(self, vertex, in_degree, results):
+        """
+        Mark one predecessor of each successor as finished and collect the newly ready ones.
+
+        Args:
+            vertex (any): The vertex that just finished.
+            in_degree (dict): Remaining unfinished predecessors per vertex.
+            results (dict): Results so far; skipped vertices are never released.
+
+        Returns:
+            list: The successors whose predecessors are now all finished.
+        """
+        released = []
+        for neighbor in self.dag.graph.get(vertex, ()):
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0 and neighbor not in results:
+                released.append(neighbor)
+        return released
+
+    def _skip_dependents(self, vertex, results):
+        """
+        Mark every vertex reachable from a failed vertex as skipped.
+
+        Args:
+            vertex (any): The vertex whose task failed.
+            results (dict): Results so far; updated in place.
+        """
+        stack = [vertex]
+        while stack:
+            current_vertex = stack.pop()
+            for neighbor in self.dag.graph.get(current_vertex, ()):
+                if neighbor not in results:
+                    results[neighbor] = TaskResult(neighbor, "skipped")
+                    stack.append(neighbor)
+
+    @staticmethod
+    def summary(results):
+        """
+        Summarize a run: task counts per status and the total busy time.
+
+        Args:
+            results (dict): The value returned by `run`.
+
+        Returns:
+            dict: Counts for "done", "failed" and "skipped", plus "busy_time" (sum of durations)
+            and "wall_time" (first start to last finish).
+        """
+        counts = {"done": 0, "failed": 0, "skipped": 0}
+        busy_time = 0.0
+        first_start = last_finish = None
+
+        for task_result in results.values():
+            counts[task_result.status] += 1
+            if task_result.started is not None:
+                busy_time += task_result.duration
+                finish = task_result.started + task_result.duration
+                first_start = task_result.started if first_start is None else min(first_start, task_result.started)
+                last_finish = finish if last_finish is None else max(last_finish, finish)
+
+        counts["busy_time"] = busy_time
+        counts["wall_time"] = 0.0 if first_start is None else last_finish - first_start
+        return counts
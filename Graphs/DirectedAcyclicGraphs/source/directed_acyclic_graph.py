@@ -1,10 +1,29 @@
+from array import array
 from collections import defaultdict, deque
 
+from Graphs.DirectedAcyclicGraphs.source.critical_path import CriticalPath
+from Graphs.DirectedAcyclicGraphs.source.reachability_index import ReachabilityIndex
+from Graphs.SymbolTables.source.interned_adjacency import InternedAdjacency
+
 
 class DirectedAcyclicGraph:
     """
     A class to represent a Directed Acyclic Graph (DAG) and perform operations like adding edges,
     detecting cycles, performing iterative DFS traversal, and topological sorting.
+
+    The DAG maintains a topological order of its vertices online (Pearce-Kelly algorithm):
+    adding an edge only searches the vertices whose positions lie between the target and the
+    source, instead of re-checking the whole graph for cycles.
+
+    Vertices and edges carry weights for scheduling: a vertex weight is the duration of the
+    vertex (1.0 unless set) and an edge weight an extra delay between the end of its source
+    and the start of its target (0.0 unless set). They are kept in float arrays indexed by
+    interned id, which `critical_path` and `schedule` run on.
+
+    The incoming edges are indexed too: a predecessor list per vertex and in- and out-degree
+    counters per interned id, all updated with every edge. Kahn's algorithm starts from the
+    counters instead of counting edges, and predecessor and impact queries (`predecessors`,
+    `ancestors`) touch only the incoming edges they follow.
     """
 
     def __init__(self):
@@ -14,29 +33,58 @@ class DirectedAcyclicGraph:
         Attributes:
             graph (defaultdict): A dictionary where each key is a vertex, and the value is a list of adjacent vertices.
             vertices (set): A set containing all vertices in the graph.
+            interned (InternedAdjacency): The adjacency list over integer vertex ids that
+                whole-graph passes such as Kahn's algorithm run on.
         """
         self.graph = defaultdict(list)  # Adjacency list to store the graph
         self.vertices = set()            # Set to store all unique vertices
+        self.interned = InternedAdjacency(degrees=True)  # Integer-id mirror with degree counters
+        self._predecessors = defaultdict(list)  # Reverse adjacency list used by the backward search
+        self._order = {}                 # Position of each vertex in the maintained topological order
+        self._next_order = 0             # Next free position for a new vertex
+        self._reachability = None        # ReachabilityIndex, built by the first `reaches` query
+        self._vertex_weights = array("d")  # Weight of every vertex, indexed by interned id
+        self._edge_weights = []          # Float arrays parallel to the interned rows
+        self._schedule = None            # CriticalPath, built by the first `schedule` call
 
     def add_vertex(self, vertex):
         """
         Add a vertex to the DAG.
 
+        New vertices are placed at the end of the maintained topological order.
+
         Args:
             vertex (str): The vertex to be added.
         """
-        self.vertices.add(vertex)
+        if vertex not in self.vertices:
+            self.vertices.add(vertex)
+            vertex_id = self.interned.add_vertex(vertex)
+            self._order[vertex] = self._next_order
+            self._next_order += 1
+            self._vertex_weights.append(1.0)
+            self._edge_weights.append(array("d"))
+            self._schedule = None
+            if self._reachability is not None:
+                self._reachability.add_vertex(vertex_id)
 
-    def add_edge(self, source, target):
+    def add_edge(self, source, target, weight=0.0):
         """
         Add a directed edge from the source vertex to the target vertex.
 
         Ensures that adding the edge does not introduce a cycle. If a cycle is detected,
         the edge is not added, and a ValueError is raised.
 
+        If the source already precedes the target in the maintained topological order the edge
+        is accepted immediately. Otherwise only the affected region is searched: vertices
+        reachable from the target and vertices reaching the source whose positions lie between
+        the two. If the forward search reaches the source, the edge closes a cycle; if not, the
+        two regions are reordered so that the order stays topological.
+
         Args:
             source (str): The starting vertex of the edge.
             target (str): The ending vertex of the edge.
+            weight (float, optional): The delay between the end of the source and the
+                start of the target.
 
         Raises:
             ValueError: If adding the edge introduces a cycle.
@@ -46,11 +94,566 @@ class DirectedAcyclicGraph:
         if target not in self.vertices:
             self.add_vertex(target)
 
-        # Temporarily add the edge to check for a cycle
+        lower_bound = self._order[target]
+        upper_bound = self._order[source]
+        if lower_bound <= upper_bound:
+            # A self-loop, or an edge against the current order: search the affected region
+            forward = self._search_forward(target, upper_bound)
+            if forward is None:
+                raise ValueError(f"Adding edge {source} -> {target} introduces a cycle!")
+            backward = self._search_backward(source, lower_bound)
+            self._reorder(forward, backward)
+
         self.graph[source].append(target)
-        if self._has_cycle():
-            self.graph[source].pop()  # Remove the edge if a cycle is detected
-            raise ValueError(f"Adding edge {source} -> {target} introduces a cycle!")
+        self._predecessors[target].append(source)
+        self.interned.add_edge(source, target)
+        ids = self.interned.symbols.ids
+        self._edge_weights[ids[source]].append(weight)
+        self._schedule = None
+        if self._reachability is not None:
+            self._reachability.add_edge(ids[source], ids[target])
+
+    def add_edges_from(self, edges):
+        """
+        Add many directed edges at once, validating acyclicity with a single pass at the end.
+
+        The edges are consumed lazily, so a generator streaming them from a file is never
+        materialized. Once all of them are in, one Kahn pass over the graph checks for cycles
+        and rebuilds the maintained topological order. The operation is atomic: if the new
+        edges close a cycle (or the iterable raises), every edge and vertex added by this
+        call is removed again before the error propagates.
+
+        Args:
+            edges (iterable): (source, target) pairs, or (source, target, weight) triples.
+
+        Raises:
+            ValueError: If the edges introduce a cycle; the message lists the cycle's vertices.
+        """
+        self._compact()    # The rollback truncates the ids, so there must be no tombstones
+        new_vertices = []  # Vertices created by this call, for rollback
+        new_edges = []     # Edges appended by this call, for rollback
+        next_order = self._next_order
+        vertex_count = len(self.interned)
+        ids = self.interned.symbols.ids
+        edge_weights = self._edge_weights
+        self._reachability = None  # Rebuilt by the next query; cheaper than per-edge updates
+        self._schedule = None
+
+        try:
+            for source, target, *weight in edges:
+                for vertex in (source, target):
+                    if vertex not in self.vertices:
+                        self.add_vertex(vertex)
+                        new_vertices.append(vertex)
+
+                self.graph[source].append(target)
+                self._predecessors[target].append(source)
+                self.interned.add_edge(source, target)
+                edge_weights[ids[source]].append(weight[0] if weight else 0.0)
+                new_edges.append((source, target))
+
+            order, remaining = self._kahn_order()
+            if remaining:
+                cycle = self._find_cycle(remaining)
+                raise ValueError(f"Adding edges introduces a cycle: {cycle}!")
+        except BaseException:
+            # Undo in reverse order; every edge was appended to the end of its lists.
+            for source, target in reversed(new_edges):
+                self.graph[source].pop()
+                self._predecessors[target].pop()
+                self.interned.pop_edge(source)
+                edge_weights[ids[source]].pop()
+            self.interned.truncate(vertex_count)
+            del self._vertex_weights[vertex_count:]
+            del edge_weights[vertex_count:]
+            for vertex in new_vertices:
+                self.vertices.discard(vertex)
+                del self._order[vertex]
+                self.graph.pop(vertex, None)
+                self._predecessors.pop(vertex, None)
+            self._next_order = next_order
+            raise
+
+        # The Kahn order is a valid topological order for the whole graph; adopt it.
+        self._order = {vertex: position for position, vertex in enumerate(order)}
+        self._next_order = len(order)
+
+    def remove_edge(self, source, target):
+        """
+        Remove one directed edge from the source vertex to the target vertex.
+
+        If parallel edges exist, only one of them is removed. The vertices stay in the graph.
+        Removing an edge cannot break the maintained topological order, so it is kept as is.
+        The reachability index and the schedule are rebuilt by their next query.
+
+        Args:
+            source (str): The starting vertex of the edge.
+            target (str): The ending vertex of the edge.
+
+        Raises:
+            ValueError: If the edge does not exist.
+        """
+        if target not in self.graph.get(source, ()):
+            raise ValueError(f"Edge {source} -> {target} does not exist!")
+
+        # The id row lists the edges in the same order, so the weight sits at the same position
+        position = self.graph[source].index(target)
+        del self.graph[source][position]
+        del self._edge_weights[self.interned.symbols.ids[source]][position]
+        self._predecessors[target].remove(source)
+        self.interned.remove_edge(source, target)
+        self._reachability = None
+        self._schedule = None
+
+    def remove_vertex(self, vertex):
+        """
+        Remove a vertex together with all its incoming and outgoing edges.
+
+        Only the neighbors of the vertex are touched, found through the adjacency list and the
+        predecessor lists. The remaining vertices keep their positions in the maintained
+        topological order. The vertex leaves a tombstone among the interned ids until they are
+        compacted; the reachability index and the schedule are rebuilt by their next query.
+
+        Args:
+            vertex (str): The vertex to remove.
+
+        Raises:
+            ValueError: If the vertex does not exist.
+        """
+        if vertex not in self.vertices:
+            raise ValueError(f"Vertex {vertex} does not exist!")
+
+        ids = self.interned.symbols.ids
+        rows = self.interned.rows
+        vertex_id = ids[vertex]
+        self.vertices.remove(vertex)
+        del self._order[vertex]
+        successors = self.graph.pop(vertex, [])
+        predecessors = self._predecessors.pop(vertex, [])
+
+        for successor in set(successors):
+            incoming = self._predecessors[successor]
+            incoming[:] = [predecessor for predecessor in incoming if predecessor != vertex]
+
+        for predecessor in set(predecessors):
+            neighbors = self.graph[predecessor]
+            neighbors[:] = [neighbor for neighbor in neighbors if neighbor != vertex]
+            # Keep the weights aligned with the id row, which loses the same positions
+            predecessor_id = ids[predecessor]
+            weights = self._edge_weights[predecessor_id]
+            weights[:] = array("d", [weight for neighbor_id, weight in zip(rows[predecessor_id], weights)
+                                     if neighbor_id != vertex_id])
+
+        self._edge_weights[vertex_id] = array("d")
+        self._reachability = None
+        self._schedule = None
+        kept = self.interned.remove_vertex(vertex, predecessors)
+        if kept is not None:
+            self._remap(kept)
+
+    def _compact(self):
+        """
+        Drop the tombstones of removed vertices from the interned ids.
+
+        Passes over every vertex id call this first, so that each id is a live vertex.
+        """
+        kept = self.interned.compact()
+        if kept is not None:
+            self._remap(kept)
+
+    def _remap(self, kept):
+        """
+        Renumber the weight arrays after the interned ids were compacted.
+
+        Args:
+            kept (list): The old id of every vertex, indexed by its new id.
+        """
+        self._vertex_weights = array("d", map(self._vertex_weights.__getitem__, kept))
+        self._edge_weights = list(map(self._edge_weights.__getitem__, kept))
+
+    @classmethod
+    def from_edge_list(cls, edges):
+        """
+        Build a DAG from an iterable of (source, target) pairs with a single cycle check.
+
+        Args:
+            edges (iterable): (source, target) pairs.
+
+        Returns:
+            DirectedAcyclicGraph: The new DAG.
+
+        Raises:
+            ValueError: If the edges contain a cycle.
+        """
+        dag = cls()
+        dag.add_edges_from(edges)
+        return dag
+
+    def vertex_weight(self, vertex):
+        """
+        Return the weight (duration) of a vertex.
+
+        Args:
+            vertex (str): The vertex.
+
+        Returns:
+            float: The weight, or None if the vertex does not exist.
+        """
+        vertex_id = self.interned.symbols.get(vertex)
+        return None if vertex_id is None else self._vertex_weights[vertex_id]
+
+    def edge_weight(self, source, target):
+        """
+        Return the weight (delay) of the edge from the source to the target vertex.
+
+        Args:
+            source (str): The starting vertex of the edge.
+            target (str): The ending vertex of the edge.
+
+        Returns:
+            float: The largest weight among the parallel edges, or None if there is no edge.
+        """
+        ids = self.interned.symbols.ids
+        if source not in ids or target not in ids:
+            return None
+        target_id = ids[target]
+        source_id = ids[source]
+        return max((weight for neighbor_id, weight in zip(self.interned.rows[source_id],
+                                                         self._edge_weights[source_id])
+                    if neighbor_id == target_id), default=None)
+
+    def set_vertex_weight(self, vertex, weight):
+        """
+        Set the weight (duration) of a vertex, adding the vertex if it does not exist.
+
+        A schedule computed earlier is updated incrementally.
+
+        Args:
+            vertex (str): The vertex.
+            weight (float): The new weight.
+        """
+        self.add_vertex(vertex)
+        vertex_id = self.interned.symbols.ids[vertex]
+        if self._vertex_weights[vertex_id] != weight:
+            self._vertex_weights[vertex_id] = weight
+            if self._schedule is not None:
+                self._schedule.update_vertex(vertex_id)
+
+    def set_edge_weight(self, source, target, weight):
+        """
+        Set the weight (delay) of the edge from the source to the target vertex.
+
+        Parallel edges all get the new weight. A schedule computed earlier is updated
+        incrementally.
+
+        Args:
+            source (str): The starting vertex of the edge.
+            target (str): The ending vertex of the edge.
+            weight (float): The new weight.
+
+        Raises:
+            ValueError: If the edge does not exist.
+        """
+        ids = self.interned.symbols.ids
+        if target not in self.graph.get(source, ()):
+            raise ValueError(f"Edge {source} -> {target} does not exist!")
+
+        source_id = ids[source]
+        target_id = ids[target]
+        weights = self._edge_weights[source_id]
+        for position, neighbor_id in enumerate(self.interned.rows[source_id]):
+            if neighbor_id == target_id:
+                weights[position] = weight
+        if self._schedule is not None:
+            self._schedule.update_edge(source_id, target_id)
+
+    def schedule(self):
+        """
+        Return the critical path schedule of the DAG under the current weights.
+
+        The first call computes a CriticalPath in two linear passes over the topological
+        order. Changing a single weight with `set_vertex_weight` or `set_edge_weight` updates
+        it incrementally; adding vertices or edges drops it and the next call recomputes it.
+
+        Returns:
+            CriticalPath: The earliest and latest start, slack and critical path of every vertex.
+        """
+        if self._schedule is None:
+            self._compact()
+            self._schedule = CriticalPath(self)
+        return self._schedule
+
+    def critical_path(self):
+        """
+        Find a longest path through the DAG, counting both vertex and edge weights.
+
+        Returns:
+            tuple: (length, path) where length is the total weight of the path and path lists
+            its vertices, empty for an empty graph.
+        """
+        schedule = self.schedule()
+        return schedule.length, schedule.path()
+
+    def reaches(self, source, target):
+        """
+        Check if there is a path from the source to the target vertex ("does source lead to
+        target?"). Every vertex reaches itself.
+
+        The first call builds a ReachabilityIndex: the full transitive closure as bitsets for
+        graphs up to ReachabilityIndex.BITSET_LIMIT vertices, interval labels above that.
+        `add_vertex` and `add_edge` keep the index up to date; `add_edges_from` drops it and
+        the next query rebuilds it.
+
+        Args:
+            source (str): The vertex the path starts at.
+            target (str): The vertex the path ends at.
+
+        Returns:
+            bool: True if the target is reachable from the source, False otherwise (or if
+            either vertex does not exist).
+        """
+        if self._reachability is None:
+            self._compact()
+            self._reachability = ReachabilityIndex(self)
+        return self._reachability.reaches(source, target)
+
+    def _kahn_order(self):
+        """
+        Run Kahn's algorithm over the whole graph.
+
+        Vertices whose in-degree drops to zero are emitted first-in first-out, starting from
+        the sources in the order they were added, so the result is deterministic.
+
+        Returns:
+            tuple: (order, remaining) where order lists the emitted vertices and remaining maps
+            every vertex that could not be emitted (it lies on or behind a cycle) to its
+            leftover in-degree.
+        """
+        labels = self.interned.symbols.labels
+        order, in_degree = self._kahn_ids()
+        remaining = {labels[vertex_id]: degree
+                     for vertex_id, degree in enumerate(in_degree) if degree}
+        return [labels[vertex_id] for vertex_id in order], remaining
+
+    def _kahn_ids(self):
+        """
+        The id-based kernel of `_kahn_order`.
+
+        Returns:
+            tuple: (order, in_degree) where order lists the emitted vertex ids and in_degree
+            holds the leftover in-degree of every id, nonzero only for ids that were not emitted.
+        """
+        self._compact()
+        rows = self.interned.rows
+        in_degree = self._in_degrees()
+        queue = deque(vertex_id for vertex_id, degree in enumerate(in_degree) if degree == 0)
+        order = []
+
+        while queue:
+            vertex_id = queue.popleft()
+            order.append(vertex_id)
+            for neighbor_id in rows[vertex_id]:
+                in_degree[neighbor_id] -= 1
+                if in_degree[neighbor_id] == 0:
+                    queue.append(neighbor_id)
+
+        return order, in_degree
+
+    def _in_degrees(self):
+        """
+        Copy the in-degree counters, for algorithms that count them down.
+
+        Returns:
+            array: The in-degree of every vertex, indexed by interned id.
+        """
+        return self.interned.in_degree[:]
+
+    def predecessors(self, vertex):
+        """
+        Return the vertices with an edge into a vertex.
+
+        Args:
+            vertex (str): The vertex.
+
+        Returns:
+            list: The predecessors, once per edge, in the order the edges were added.
+        """
+        return list(self._predecessors.get(vertex, ()))
+
+    def in_degree(self, vertex):
+        """
+        Count the edges entering a vertex in O(1).
+
+        Args:
+            vertex (str): The vertex.
+
+        Returns:
+            int: The in-degree, or 0 if the vertex does not exist.
+        """
+        vertex_id = self.interned.symbols.get(vertex)
+        return 0 if vertex_id is None else self.interned.in_degree[vertex_id]
+
+    def out_degree(self, vertex):
+        """
+        Count the edges leaving a vertex in O(1).
+
+        Args:
+            vertex (str): The vertex.
+
+        Returns:
+            int: The out-degree, or 0 if the vertex does not exist.
+        """
+        vertex_id = self.interned.symbols.get(vertex)
+        return 0 if vertex_id is None else self.interned.out_degree[vertex_id]
+
+    def ancestors(self, vertex):
+        """
+        Find every vertex from which a vertex can be reached.
+
+        If edges point from a task to the tasks that depend on it, these are the tasks the
+        vertex waits for; if they point from a dependent to its dependency, these are all the
+        vertices affected when the vertex changes. The search walks the predecessor lists
+        backwards, so it only touches the ancestors and their incoming edges.
+
+        Args:
+            vertex (str): The vertex.
+
+        Returns:
+            set: The ancestors, without the vertex itself.
+        """
+        return self._closure(vertex, self._predecessors)
+
+    def descendants(self, vertex):
+        """
+        Find every vertex that can be reached from a vertex.
+
+        Args:
+            vertex (str): The vertex.
+
+        Returns:
+            set: The descendants, without the vertex itself.
+        """
+        return self._closure(vertex, self.graph)
+
+    @staticmethod
+    def _closure(vertex, adjacency):
+        """
+        Collect every vertex reachable from a vertex in an adjacency mapping.
+
+        Args:
+            vertex (str): The vertex to start from.
+            adjacency (dict): Maps every vertex to its neighbors in the searched direction.
+
+        Returns:
+            set: The reached vertices, without the start vertex.
+        """
+        found = set()
+        stack = [vertex]
+        while stack:
+            for neighbor in adjacency.get(stack.pop(), ()):
+                if neighbor not in found:
+                    found.add(neighbor)
+                    stack.append(neighbor)
+        return found
+
+    def _find_cycle(self, remaining):
+        """
+        Extract one cycle from the vertices left over by Kahn's algorithm.
+
+        Every leftover vertex has a leftover predecessor, so walking predecessors from any of
+        them must eventually revisit a vertex; the revisited stretch is a cycle.
+
+        Args:
+            remaining (dict): The leftover vertices returned by `_kahn_order`.
+
+        Returns:
+            list: The cycle's vertices in edge direction, with the first vertex repeated at the end.
+        """
+        vertex = next(iter(remaining))
+        path = []
+        position = {}
+
+        while vertex not in position:
+            position[vertex] = len(path)
+            path.append(vertex)
+            vertex = next(predecessor for predecessor in self._predecessors[vertex]
+                          if predecessor in remaining)
+
+        cycle = path[position[vertex]:]
+        cycle.reverse()  # The walk followed edges backwards
+        cycle.append(cycle[0])
+        return cycle
+
+    def _search_forward(self, start_vertex, upper_bound):
+        """
+        Collect the vertices reachable from start_vertex whose order is below upper_bound.
+
+        Args:
+            start_vertex (str): The target of the new edge.
+            upper_bound (int): The order of the source of the new edge.
+
+        Returns:
+            list: The vertices found, or None if the source itself is reachable (a cycle).
+        """
+        order = self._order
+        visited = {start_vertex}
+        stack = [start_vertex]
+
+        while stack:
+            vertex = stack.pop()
+            if order[vertex] == upper_bound:
+                return None  # The source is reachable from the target
+
+            for neighbor in self.graph.get(vertex, ()):
+                if neighbor not in visited and order[neighbor] <= upper_bound:
+                    visited.add(neighbor)
+                    stack.append(neighbor)
+
+        return list(visited)
+
+    def _search_backward(self, start_vertex, lower_bound):
+        """
+        Collect the vertices reaching start_vertex whose order is above lower_bound.
+
+        Args:
+            start_vertex (str): The source of the new edge.
+            lower_bound (int): The order of the target of the new edge.
+
+        Returns:
+            list: The vertices found.
+        """
+        order = self._order
+        visited = {start_vertex}
+        stack = [start_vertex]
+
+        while stack:
+            vertex = stack.pop()
+            for predecessor in self._predecessors.get(vertex, ()):
+                if predecessor not in visited and order[predecessor] > lower_bound:
+                    visited.add(predecessor)
+                    stack.append(predecessor)
+
+        return list(visited)
+
+    def _reorder(self, forward, backward):
+        """
+        Reassign the positions of the affected vertices so that the order stays topological.
+
+        The vertices reaching the source are moved in front of the vertices reachable from the
+        target, reusing the same set of positions and keeping the relative order within each group.
+
+        Args:
+            forward (list): Vertices reachable from the target of the new edge.
+            backward (list): Vertices reaching the source of the new edge.
+        """
+        order = self._order
+        forward.sort(key=order.__getitem__)
+        backward.sort(key=order.__getitem__)
+
+        affected = backward + forward
+        positions = sorted(order[vertex] for vertex in affected)
+        for vertex, position in zip(affected, positions):
+            order[vertex] = position
 
     def dfs_iterative(self, start_vertex, visited=None, process=None, record_stack=None, detect_cycle=False):
         """
@@ -59,9 +662,14 @@ class DirectedAcyclicGraph:
         This method can be customized to process vertices, record traversal for topological sorting,
         or detect cycles.
 
+        The traversal runs on the interned integer ids. Unless a `visited` set is passed in, the
+        visited vertices are tracked in a pooled VisitedMarker, so repeated traversals neither
+        hash labels nor allocate a new set.
+
         Args:
             start_vertex (str): The vertex from which to start the DFS traversal.
-            visited (set, optional): A set to keep track of visited vertices.
+            visited (set, optional): A set to keep track of visited vertices. Vertices already in
+                it are skipped, and every vertex visited by this call is added to it.
             process (function, optional): A function to process each vertex during traversal.
             record_stack (deque, optional): A deque to record vertices for topological sorting.
             detect_cycle (bool, optional): If True, checks for cycles during traversal.
@@ -69,19 +677,65 @@ class DirectedAcyclicGraph:
         Returns:
             bool: Returns True if a cycle is detected (when detect_cycle is True), otherwise None.
         """
-        if visited is None:
-            visited = set()
+        interned = self.interned
+        start_id = interned.symbols.get(start_vertex)
+        if start_id is None:
+            # A vertex outside the graph has no edges, so it is the only one visited
+            if visited is None or start_vertex not in visited:
+                if visited is not None:
+                    visited.add(start_vertex)
+                if process:
+                    process(start_vertex)
+                if record_stack is not None:
+                    record_stack.appendleft(start_vertex)
+            return False if detect_cycle else None
+
+        marker = interned.acquire_marker()
+        marks, stamp = marker.marks, marker.stamp
+        if visited:
+            for vertex_id in interned.ids_of(visited):
+                marks[vertex_id] = stamp
+
+        try:
+            cycle = self._dfs_ids(start_id, marks, stamp, process, record_stack, detect_cycle, visited)
+        finally:
+            interned.release_marker(marker)
+
+        if detect_cycle:
+            return cycle  # True if a cycle was detected, False otherwise
+
+    def _dfs_ids(self, start_id, marks, stamp, process, record_stack, detect_cycle, visited):
+        """
+        The id-based kernel of `dfs_iterative`.
+
+        Args:
+            start_id (int): The id to start from.
+            marks (bytearray): The visited marks; ids whose mark equals `stamp` are visited.
+            stamp (int): The stamp of the current traversal.
+            process (function): Called with the label of every visited vertex, or None.
+            record_stack (deque): Receives the label of every visited vertex, or None.
+            detect_cycle (bool): Whether to check for cycles.
+            visited (set): Receives the label of every visited vertex, or None.
+
+        Returns:
+            bool: True if a cycle was detected, False otherwise.
+        """
+        rows = self.interned.rows
+        labels = self.interned.symbols.labels
         rec_stack = set()  # Used only if detect_cycle is True
-        stack = [start_vertex]  # Stack to manage DFS traversal
+        stack = [start_id]  # Stack to manage DFS traversal
 
         while stack:
-            vertex = stack.pop()
+            vertex_id = stack.pop()
 
             # Process the vertex if it hasn't been visited
-            if vertex not in visited:
-                visited.add(vertex)  # Mark the vertex as visited
+            if marks[vertex_id] != stamp:
+                marks[vertex_id] = stamp  # Mark the vertex as visited
+                vertex = labels[vertex_id]
+                if visited is not None:
+                    visited.add(vertex)
                 if detect_cycle:
-                    rec_stack.add(vertex)  # Add to recursion stack for cycle detection
+                    rec_stack.add(vertex_id)  # Add to recursion stack for cycle detection
 
                 if process:
                     process(vertex)  # Process the vertex (e.g., print)
@@ -91,48 +745,86 @@ class DirectedAcyclicGraph:
                     record_stack.appendleft(vertex)  # Record the vertex in stack
 
                 # Add neighbors to the stack for further traversal
-                for neighbor in reversed(self.graph[vertex]):
-                    if detect_cycle and neighbor in rec_stack:
+                for neighbor_id in reversed(rows[vertex_id]):
+                    if detect_cycle and neighbor_id in rec_stack:
                         return True  # Cycle detected
-                    if neighbor not in visited:
-                        stack.append(neighbor)
+                    if marks[neighbor_id] != stamp:
+                        stack.append(neighbor_id)
 
                 # Remove from recursion stack after processing (for cycle detection)
                 if detect_cycle:
-                    rec_stack.remove(vertex)
+                    rec_stack.remove(vertex_id)
 
-        if detect_cycle:
-            return False  # No cycle detected
+        return False
 
     def _has_cycle(self):
         """
         Check if the graph contains a cycle using iterative DFS traversal.
 
+        A single VisitedMarker is shared by the traversals from all roots.
+
         Returns:
             bool: True if a cycle is detected, False otherwise.
         """
-        visited = set()
-        for vertex in self.vertices:
-            if vertex not in visited:
-                if self.dfs_iterative(vertex, visited, detect_cycle=True):
-                    return True  # Cycle detected
-        return False  # No cycle found
+        self._compact()
+        interned = self.interned
+        marker = interned.acquire_marker()
+        marks, stamp = marker.marks, marker.stamp
+        try:
+            for vertex_id in range(len(interned)):
+                if marks[vertex_id] != stamp:
+                    if self._dfs_ids(vertex_id, marks, stamp, None, None, True, None):
+                        return True  # Cycle detected
+            return False  # No cycle found
+        finally:
+            interned.release_marker(marker)
 
-    def topological_sort(self):
+    def topological_sort(self, levels=False):
         """
-        Perform a topological sort on the DAG.
+        Perform a topological sort on the DAG using Kahn's algorithm.
+
+        Vertices without predecessors come first, in the order they were added to the DAG,
+        and ties are always broken the same way, so the result is stable between runs.
+
+        Args:
+            levels (bool, optional): If True, group the vertices into levels (see
+                `topological_levels`) instead of returning a flat list.
 
         Returns:
-            list: A list of vertices in topologically sorted order.
+            list: A list of vertices in topologically sorted order, or a list of levels.
         """
-        visited = set()
-        stack = deque()  # Stack to store the topological order
+        if levels:
+            return list(self.topological_levels())
+        return [vertex for level in self.topological_levels() for vertex in level]
 
-        for vertex in self.vertices:
-            if vertex not in visited:
-                self.dfs_iterative(vertex, visited, record_stack=stack)
+    def topological_levels(self):
+        """
+        Yield the vertices of the DAG level by level.
+
+        Level 0 holds the vertices without predecessors and level k + 1 holds the vertices whose
+        last predecessor is in level k. No two vertices of a level depend on each other, so each
+        level can be processed in parallel once the previous levels are done. Concatenating the
+        levels gives the order returned by `topological_sort`.
+
+        Yields:
+            list: The vertices of each level, in a stable order.
+        """
+        self._compact()
+        rows = self.interned.rows
+        labels = self.interned.symbols.labels
+        in_degree = self._in_degrees()
+        level = [vertex_id for vertex_id, degree in enumerate(in_degree) if degree == 0]
+
+        while level:
+            yield [labels[vertex_id] for vertex_id in level]
 
-        return list(stack)  # Convert the deque to a list and return
+            next_level = []
+            for vertex_id in level:
+                for neighbor_id in rows[vertex_id]:
+                    in_degree[neighbor_id] -= 1
+                    if in_degree[neighbor_id] == 0:
+                        next_level.append(neighbor_id)
+            level = next_level
 
     def display(self):
         """
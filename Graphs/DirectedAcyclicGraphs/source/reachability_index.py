@@ -0,0 +1,327 @@
+import random
+from array import array
+
+
+class ReachabilityIndex:
+    """
+    A class answering "is there a path from u to v?" queries on a DirectedAcyclicGraph.
+
+    Two strategies are available, chosen by graph size unless one is requested:
+
+    * "bitset": the full transitive closure, one Python integer per vertex whose bit v is set
+      when v is reachable. Queries are a single bit test. Memory grows with V^2 / 8 bytes,
+      so this is used up to BITSET_LIMIT vertices.
+    * "interval": GRAIL-style interval labels. Every vertex gets one [low, high] interval per
+      labeling, built from a randomized post-order, such that u reaches v only if each
+      interval of v lies inside the matching interval of u. Most negative queries are answered
+      by the labels alone. The spanning tree of the first traversal also proves many positive
+      queries: every tree descendant is reachable. The rest run a DFS that prunes every vertex
+      whose intervals do not contain the target's and stops at the first vertex whose tree
+      contains it. Memory is O(V) per labeling.
+
+    The index works on the DAG's interned vertex ids and is kept up to date as vertices and
+    edges are added through `add_vertex` and `add_edge`.
+
+    Attributes:
+        dag (DirectedAcyclicGraph): The indexed graph.
+        method (str): "bitset" or "interval".
+    """
+
+    BITSET_LIMIT = 10_000  # Largest vertex count for which the full closure is kept
+
+    def __init__(self, dag, method=None, labelings=2, seed=0):
+        """
+        Build the index for the current state of a DAG.
+
+        Args:
+            dag (DirectedAcyclicGraph): The graph to index.
+            method (str, optional): "bitset" or "interval"; chosen by size if omitted.
+            labelings (int, optional): Number of interval labelings for the "interval" method.
+                More labelings answer more negative queries without a search.
+            seed (int, optional): Seed for the randomized traversal orders.
+
+        Raises:
+            ValueError: If the method is unknown or labelings is smaller than 1.
+        """
+        if method not in (None, "bitset", "interval"):
+            raise ValueError(f"Unknown reachability method {method!r}!")
+        if labelings < 1:
+            raise ValueError("At least one interval labeling is needed!")
+
+        self.dag = dag
+        self._requested_method = method
+        self._labelings = labelings
+        self._random = random.Random(seed)
+        self._build()
+
+    def _build(self):
+        """
+        (Re)build the index from scratch for the current graph.
+        """
+        vertex_count = len(self.dag.interned)
+        self.method = self._requested_method or (
+            "bitset" if vertex_count <= self.BITSET_LIMIT else "interval")
+
+        if self.method == "bitset":
+            self._build_closure()
+        else:
+            self._build_intervals()
+
+    def _reverse_topological_ids(self):
+        """
+        Return the vertex ids in reverse topological order.
+
+        Returns:
+            list: Every vertex id, each after all vertices it can reach.
+        """
+        order, _ = self.dag._kahn_ids()
+        order.reverse()
+        return order
+
+    def _build_closure(self):
+        """
+        Compute the transitive closure as one bitset per vertex.
+
+        Vertices are processed so that all successors come first; the reachable set of a
+        vertex is then its own bit plus the union of its successors' sets.
+        """
+        rows = self.dag.interned.rows
+        reach = [0] * len(rows)
+        for vertex_id in self._reverse_topological_ids():
+            bits = 1 << vertex_id
+            for neighbor_id in rows[vertex_id]:
+                bits |= reach[neighbor_id]
+            reach[vertex_id] = bits
+        self._reach = reach
+
+    def _build_intervals(self):
+        """
+        Compute the interval labels from randomized post-order traversals.
+
+        For every labeling, `high[v]` is the post-order rank of v and `low[v]` the smallest
+        rank among the vertices v can reach. A descendant is finished before its ancestors
+        and its own descendants are descendants of the ancestor as well, so its interval is
+        always contained in the ancestor's.
+
+        The first traversal also records, for every vertex, the first rank handed out inside
+        its DFS subtree; the tree descendants of u are exactly the vertices whose own rank
+        lies between that rank and the rank of u.
+        """
+        interned = self.dag.interned
+        rows = interned.rows
+        vertex_count = len(rows)
+        self._low = []
+        self._high = []
+        self._tree_start = array("q", [0]) * vertex_count  # First rank inside each DFS subtree
+
+        for labeling in range(self._labelings):
+            low = array("q", [0]) * vertex_count
+            high = array("q", [0]) * vertex_count
+            if labeling == 0:
+                # Start from the sources so that the spanning trees are deep and prove a lot
+                roots = self._reverse_topological_ids()[::-1]
+            else:
+                roots = list(range(vertex_count))
+                self._random.shuffle(roots)
+            reverse_children = labeling % 2 == 1  # Alternate the child order between labelings
+
+            def children(vertex_id):
+                return iter(reversed(rows[vertex_id]) if reverse_children else rows[vertex_id])
+
+            marker = interned.acquire_marker()
+            marks, stamp = marker.marks, marker.stamp
+            rank = 0
+            try:
+                for root_id in roots:
+                    if marks[root_id] == stamp:
+                        continue
+                    marks[root_id] = stamp
+                    if labeling == 0:
+                        self._tree_start[root_id] = rank
+                    stack = [(root_id, children(root_id))]
+
+                    while stack:
+                        vertex_id, neighbors = stack[-1]
+                        for neighbor_id in neighbors:
+                            if marks[neighbor_id] != stamp:
+                                marks[neighbor_id] = stamp
+                                if labeling == 0:
+                                    self._tree_start[neighbor_id] = rank
+                                stack.append((neighbor_id, children(neighbor_id)))
+                                break
+                        else:
+                            # Post-order: every descendant already has its final label
+                            stack.pop()
+                            smallest = rank
+                            for neighbor_id in rows[vertex_id]:
+                                if low[neighbor_id] < smallest:
+                                    smallest = low[neighbor_id]
+                            low[vertex_id] = smallest
+                            high[vertex_id] = rank
+                            rank += 1
+            finally:
+                interned.release_marker(marker)
+
+            self._low.append(low)
+            self._high.append(high)
+
+        # The tree intervals must not widen with later edges, so keep the ranks separately
+        self._tree_rank = array("q", self._high[0]) if self._high else array("q")
+
+    def _contains(self, outer_id, inner_id):
+        """
+        Check if every interval of one vertex contains the matching interval of another.
+
+        Args:
+            outer_id (int): The possible ancestor.
+            inner_id (int): The possible descendant.
+
+        Returns:
+            bool: False if outer_id certainly cannot reach inner_id.
+        """
+        for low, high in zip(self._low, self._high):
+            if low[inner_id] < low[outer_id] or high[inner_id] > high[outer_id]:
+                return False
+        return True
+
+    def _tree_contains(self, ancestor_id, descendant_id):
+        """
+        Check if a vertex lies in the DFS subtree of another, which proves reachability.
+
+        Args:
+            ancestor_id (int): The possible ancestor.
+            descendant_id (int): The possible descendant.
+
+        Returns:
+            bool: True if descendant_id certainly is reachable from ancestor_id.
+        """
+        rank = self._tree_rank[descendant_id]
+        return self._tree_start[ancestor_id] <= rank <= self._tree_rank[ancestor_id]
+
+    def reaches(self, source, target):
+        """
+        Check if there is a path from the source to the target vertex.
+
+        Every vertex reaches itself.
+
+        Args:
+            source (hashable): The vertex the path starts at.
+            target (hashable): The vertex the path ends at.
+
+        Returns:
+            bool: True if the target is reachable from the source, False otherwise (or if
+            either vertex does not exist).
+        """
+        ids = self.dag.interned.symbols.ids
+        source_id = ids.get(source)
+        target_id = ids.get(target)
+        if source_id is None or target_id is None:
+            return False
+        return self.reaches_id(source_id, target_id)
+
+    def reaches_id(self, source_id, target_id):
+        """
+        Check if there is a path between two vertex ids.
+
+        Args:
+            source_id (int): The id the path starts at.
+            target_id (int): The id the path ends at.
+
+        Returns:
+            bool: True if the target is reachable from the source.
+        """
+        if self.method == "bitset":
+            return (self._reach[source_id] >> target_id) & 1 == 1
+
+        if not self._contains(source_id, target_id):
+            return False
+        if self._tree_contains(source_id, target_id):
+            return True
+
+        # The labels cannot decide; search, skipping vertices that cannot reach the target
+        rows = self.dag.interned.rows
+        marker = self.dag.interned.acquire_marker()
+        marks, stamp = marker.marks, marker.stamp
+        try:
+            marks[source_id] = stamp
+            stack = [source_id]
+            while stack:
+                for neighbor_id in rows[stack.pop()]:
+                    if marks[neighbor_id] != stamp and self._contains(neighbor_id, target_id):
+                        if self._tree_contains(neighbor_id, target_id):
+                            return True
+                        marks[neighbor_id] = stamp
+                        stack.append(neighbor_id)
+            return False
+        finally:
+            self.dag.interned.release_marker(marker)
+
+    def add_vertex(self, vertex_id):
+        """
+        Register a vertex that was just added to the DAG.
+
+        Crossing BITSET_LIMIT while the strategy was chosen by size rebuilds the index with
+        interval labels.
+
+        Args:
+            vertex_id (int): The id of the new vertex.
+        """
+        if self.method == "bitset":
+            if self._requested_method is None and vertex_id >= self.BITSET_LIMIT:
+                self._build()
+            else:
+                self._reach.append(1 << vertex_id)
+        else:
+            # An isolated vertex gets an interval of its own above every existing one
+            rank = len(self._tree_rank)
+            for low, high in zip(self._low, self._high):
+                low.append(rank)
+                high.append(rank)
+            self._tree_start.append(rank)
+            self._tree_rank.append(rank)
+
+    def add_edge(self, source_id, target_id):
+        """
+        Update the index for an edge that was just added to the DAG.
+
+        Only the ancestors of the source whose labels do not yet cover the target are
+        visited, walking the predecessor lists backwards from the source.
+
+        Args:
+            source_id (int): The id of the edge's source.
+            target_id (int): The id of the edge's target.
+        """
+        labels = self.dag.interned.symbols.labels
+        ids = self.dag.interned.symbols.ids
+        predecessors = self.dag._predecessors
+
+        def predecessor_ids(vertex_id):
+            return [ids[predecessor] for predecessor in predecessors.get(labels[vertex_id], ())]
+
+        stack = [source_id]
+
+        if self.method == "bitset":
+            reach = self._reach
+            added = reach[target_id]
+            while stack:
+                vertex_id = stack.pop()
+                if (reach[vertex_id] >> target_id) & 1:
+                    continue  # Already reaches the target, and so do all its ancestors
+                reach[vertex_id] |= added
+                stack.extend(predecessor_ids(vertex_id))
+        else:
+            # Widen the intervals of the ancestors so they contain the target's intervals
+            labelings = list(zip(self._low, self._high))
+            bounds = [(low[target_id], high[target_id]) for low, high in labelings]
+            while stack:
+                vertex_id = stack.pop()
+                widened = False
+                for (low, high), (target_low, target_high) in zip(labelings, bounds):
+                    if target_low < low[vertex_id]:
+                        low[vertex_id] = target_low
+                        widened = True
+                    if target_high > high[vertex_id]:
+                        high[vertex_id] = target_high
+                        widened = True
+                if widened:
+                    stack.extend(predecessor_ids(vertex_id))
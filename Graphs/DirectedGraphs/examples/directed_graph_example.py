@@ -1,3 +1,7 @@
+import os
+import random
+import time
+
 from Graphs.DirectedGraphs.source.directed_graph import DirectedGraph
 
 if __name__ == "__main__":
@@ -26,3 +30,46 @@ if __name__ == "__main__":
     print(f"Does an edge exist from A to D? {'Yes' if graph.has_edge('A', 'D') else 'No'}")
     print(f"Does an edge exist from B to D? {'Yes' if graph.has_edge('B', 'D') else 'No'}")
     print(f"Does an edge exist from C to D? {'Yes' if graph.has_edge('C', 'D') else 'No'}")
+
+    # Query the incoming edges; with edges pointing to dependencies, the ancestors of D are
+    # everything affected by a change to D
+    print(f"\nPredecessors of D: {list(graph.predecessors('D'))}, in-degree {graph.in_degree('D')}")
+    print(f"Affected by a change to D: {sorted(graph.ancestors('D'))}")
+
+    # Find a shortest path with bidirectional BFS
+    print(f"\nShortest path from A to D: {graph.shortest_path('A', 'D')}")
+
+    # Close a cycle and collapse it with the strongly connected components
+    graph.add_edge('D', 'A')  # D -> A
+    graph.add_edge('D', 'E')  # D -> E
+    print(f"\nStrongly connected components: {graph.strongly_connected_components()}")
+
+    condensed, components = graph.condensation()
+    print("Condensation DAG:")
+    condensed.display()
+
+    # Rank the vertices, globally and from the point of view of A
+    ranks = graph.pagerank()
+    print("\nPageRank:", {vertex: round(rank, 3) for vertex, rank in ranks.items()})
+    ranks = graph.pagerank(personalization={'A': 1})
+    print("PageRank personalized to A:", {vertex: round(rank, 3) for vertex, rank in ranks.items()})
+
+    # Time PageRank on a larger random graph, serially and split across a process pool. Every
+    # iteration only sends the range bounds to the workers; the ranks go through shared memory.
+    # A pool cannot beat the serial run on a machine with a single CPU.
+    rng = random.Random(42)
+    large = DirectedGraph(reverse=False)
+    large.add_edges_from((rng.randrange(20000), rng.randrange(20000)) for _ in range(200000))
+    processes = max(os.cpu_count() or 1, 2)
+
+    start = time.perf_counter()
+    serial_ranks = large.pagerank()
+    serial_time = time.perf_counter() - start
+    start = time.perf_counter()
+    pool_ranks = large.pagerank(processes=processes)
+    pool_time = time.perf_counter() - start
+
+    difference = max(abs(serial_ranks[vertex] - pool_ranks[vertex]) for vertex in serial_ranks)
+    print(f"\nPageRank of 200000 edges: serial {serial_time:.2f}s, {processes} processes "
+          f"{pool_time:.2f}s ({serial_time / pool_time:.2f}x, {os.cpu_count()} CPUs), "
+          f"largest rank difference {difference:.1e}")
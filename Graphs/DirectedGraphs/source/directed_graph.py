@@ -1,19 +1,74 @@
+from array import array
+from itertools import repeat
+
+from Graphs.BFSGraphs.source.bfs_graph import bidirectional_shortest_path
+from Graphs.CSRGraphs.source.csr_graph import CSRGraph
+from Graphs.DirectedAcyclicGraphs.source.directed_acyclic_graph import DirectedAcyclicGraph
+from Graphs.DirectedGraphs.source.pagerank import pagerank
+from Graphs.EdgeLists.source.edge_list import chunked, new_endpoints, split_weights
+from Graphs.ShortestPaths.source.shortest_paths import a_star, dijkstra
+from Graphs.SymbolTables.source.interned_adjacency import InternedAdjacency
+
+
 class DirectedGraph:
     """
     A class to represent a directed graph using an adjacency list.
 
-    The graph allows adding vertices, adding directed edges, checking if an edge exists,
-    and printing the adjacency list.
+    The graph allows adding vertices, adding and removing directed edges, checking if an edge
+    exists, and printing the adjacency list.
+
+    Two adjacency modes are available. In the default list mode every vertex maps to a list of
+    neighbors. In indexed mode every vertex maps to an insertion-ordered dictionary from neighbor
+    to the number of parallel edges, which makes `has_edge` and `remove_edge` O(1) regardless
+    of the vertex degree.
+
+    Every edge has a weight (1.0 unless given). In list mode the weights of a vertex are kept
+    in a float array parallel to its neighbor list; in indexed mode every neighbor maps to the
+    list of weights of its parallel edges, in insertion order. Weight queries and shortest
+    paths use the smallest weight among parallel edges.
+
+    Whole-graph algorithms run on an adjacency list over dense integer vertex ids (`interned`).
+    It is built the first time such an algorithm runs and kept up to date from then on.
+
+    By default the incoming edges are indexed as well: a reverse adjacency list, plus in- and
+    out-degree counters per vertex id in the id mirror, all maintained incrementally, so
+    predecessor, degree and ancestor queries cost O(in-degree) instead of a scan over every
+    edge. Graphs that never ask such questions can switch the index off to save memory and
+    insertion time.
     """
 
-    def __init__(self):
+    def __init__(self, indexed=False, reverse=True):
         """
         Initialize the graph with an empty adjacency list.
 
         The adjacency list is a dictionary where each key is a vertex,
-        and the associated value is a list of neighboring vertices (outgoing edges).
+        and the associated value is a list of neighboring vertices (outgoing edges),
+        or a {neighbor: multiplicity} dictionary in indexed mode.
+        The reverse adjacency list has the same shape and holds the incoming edges; it stays
+        empty if the reverse index is switched off.
+        The weights dictionary maps each vertex to the weights of its outgoing edges.
+
+        :param indexed: If True, keep a hashed neighbor index instead of plain lists.
+        :param reverse: If True, maintain the reverse adjacency list and the degree counters.
         """
+        self.indexed = indexed
+        self.reverse = reverse
         self.adjacency_list = {}
+        self.reverse_adjacency_list = {}
+        self.weights = {}
+        self._interned = None  # Integer-id mirror of the adjacency list, built on first use
+
+    @property
+    def interned(self):
+        """
+        InternedAdjacency: The adjacency list over integer vertex ids that whole-graph
+        algorithms run on, with degree counters if the reverse index is on. Built from the
+        adjacency list the first time it is needed and kept up to date by every later change.
+        """
+        if self._interned is None:
+            self._interned = InternedAdjacency.from_adjacency(self.adjacency_list, self.adjacency_list,
+                                                              self.indexed, degrees=self.reverse)
+        return self._interned
 
     def add_vertex(self, vertex):
         """
@@ -22,16 +77,24 @@ class DirectedGraph:
         :param vertex: The vertex to be added to the graph.
         """
         if vertex not in self.adjacency_list:
-            self.adjacency_list[vertex] = []  # Initialize the vertex with an empty list of neighbors
+            # Initialize the vertex with empty collections of outgoing and incoming neighbors
+            self.adjacency_list[vertex] = {} if self.indexed else []
+            if self.reverse:
+                self.reverse_adjacency_list[vertex] = {} if self.indexed else []
+            self.weights[vertex] = {} if self.indexed else array("d")
+            if self._interned is not None:
+                self._interned.add_vertex(vertex)
 
-    def add_edge(self, source, target):
+    def add_edge(self, source, target, weight=1.0):
         """
         Add a directed edge from the source vertex to the target vertex.
 
         If the vertices do not exist in the graph, they are added automatically.
+        Adding an edge that already exists creates a parallel edge.
 
         :param source: The source vertex of the edge.
         :param target: The target vertex of the edge.
+        :param weight: The weight of the edge.
         """
         # If source is not present, add it to the graph
         if source not in self.adjacency_list:
@@ -41,7 +104,155 @@ class DirectedGraph:
             self.add_vertex(target)
 
         # Add the edge only from source to target to represent a directed connection
-        self.adjacency_list[source].append(target)
+        neighbors = self.adjacency_list[source]
+        weights = self.weights[source]
+        if self.indexed:
+            neighbors[target] = neighbors.get(target, 0) + 1
+            weights.setdefault(target, []).append(weight)
+        else:
+            neighbors.append(target)
+            weights.append(weight)
+        if self.reverse:
+            predecessors = self.reverse_adjacency_list[target]
+            if self.indexed:
+                predecessors[source] = predecessors.get(source, 0) + 1
+            else:
+                predecessors.append(source)
+        if self._interned is not None:
+            self._interned.add_edge(source, target)
+
+    def add_edges_from(self, edges):
+        """
+        Add many directed edges at once.
+
+        The edges are consumed in batches. The new vertices of a batch are registered together
+        before its edges are appended, so the per-edge work is just the appends, without the
+        membership checks and method calls of `add_edge`. The result is the same as calling
+        `add_edge` for every edge in order.
+
+        :param edges: (source, target) pairs, or (source, target, weight) triples.
+        :raises ValueError: If a batch mixes pairs and triples; that batch is not added.
+        """
+        adjacency = self.adjacency_list
+        reverse_adjacency = self.reverse_adjacency_list
+        edge_weights = self.weights
+
+        for chunk in chunked(edges):
+            pairs, weights = split_weights(chunk)
+            for vertex in new_endpoints(pairs, adjacency):
+                self.add_vertex(vertex)
+
+            if self.indexed:
+                for (source, target), weight in zip(pairs, weights or repeat(1.0)):
+                    neighbors = adjacency[source]
+                    neighbor_weights = edge_weights[source]
+                    neighbors[target] = neighbors.get(target, 0) + 1
+                    neighbor_weights.setdefault(target, []).append(weight)
+            elif weights is None:
+                for source, target in pairs:
+                    adjacency[source].append(target)
+                    edge_weights[source].append(1.0)
+            else:
+                for (source, target), weight in zip(pairs, weights):
+                    adjacency[source].append(target)
+                    edge_weights[source].append(weight)
+
+            if self.reverse and self.indexed:
+                for source, target in pairs:
+                    predecessors = reverse_adjacency[target]
+                    predecessors[source] = predecessors.get(source, 0) + 1
+            elif self.reverse:
+                for source, target in pairs:
+                    reverse_adjacency[target].append(source)
+
+            if self._interned is not None:
+                self._interned.add_edges(pairs)
+
+    def remove_edge(self, source, target):
+        """
+        Remove one directed edge from the source vertex to the target vertex.
+
+        If parallel edges exist, only one of them is removed. The vertices stay in the graph.
+        Runs in O(1) in indexed mode and O(degree) in list mode.
+
+        :param source: The source vertex of the edge.
+        :param target: The target vertex of the edge.
+        :raises ValueError: If the edge does not exist.
+        """
+        if not self.has_edge(source, target):
+            raise ValueError(f"Edge {source} -> {target} does not exist!")
+
+        neighbors = self.adjacency_list[source]
+        weights = self.weights[source]
+        if self.indexed:
+            # Drop the first copy together with its weight, as in list mode
+            if neighbors[target] == 1:
+                del neighbors[target]
+                del weights[target]
+            else:
+                neighbors[target] -= 1
+                del weights[target][0]
+        else:
+            # Drop the first copy together with the weight stored at the same position
+            position = neighbors.index(target)
+            del neighbors[position]
+            del weights[position]
+
+        if self.reverse:
+            predecessors = self.reverse_adjacency_list[target]
+            if not self.indexed:
+                predecessors.remove(source)
+            elif predecessors[source] == 1:
+                del predecessors[source]
+            else:
+                predecessors[source] -= 1
+        if self._interned is not None:
+            self._interned.remove_edge(source, target)
+
+    def remove_vertex(self, vertex):
+        """
+        Remove a vertex together with all its incoming and outgoing edges.
+
+        Only the neighbors of the vertex are touched, through the adjacency list and the
+        reverse adjacency list: O(degree) in indexed mode, O(degree of the neighbors) in list
+        mode. Without the reverse index the predecessors are found by scanning every vertex.
+        The vertex leaves a tombstone among the interned ids until they are compacted.
+
+        :param vertex: The vertex to remove.
+        :raises ValueError: If the vertex does not exist.
+        """
+        if vertex not in self.adjacency_list:
+            raise ValueError(f"Vertex {vertex} does not exist!")
+
+        if self.reverse:
+            predecessors = self.reverse_adjacency_list.pop(vertex)
+        else:
+            predecessors = [other for other, neighbors in self.adjacency_list.items() if vertex in neighbors]
+        successors = self.adjacency_list.pop(vertex)
+        del self.weights[vertex]
+
+        if self.reverse:
+            for successor in set(successors).difference((vertex,)):
+                incoming = self.reverse_adjacency_list[successor]
+                if self.indexed:
+                    del incoming[vertex]
+                else:
+                    incoming[:] = [predecessor for predecessor in incoming if predecessor != vertex]
+
+        for predecessor in set(predecessors).difference((vertex,)):
+            neighbors = self.adjacency_list[predecessor]
+            weights = self.weights[predecessor]
+            if self.indexed:
+                del neighbors[vertex]
+                del weights[vertex]
+            else:
+                # Keep the weights aligned with the remaining neighbors
+                kept = [position for position, neighbor in enumerate(neighbors) if neighbor != vertex]
+                neighbors[:] = [neighbors[position] for position in kept]
+                weights[:] = array("d", map(weights.__getitem__, kept))
+
+        if self._interned is not None:
+            self._interned.remove_vertex(vertex, predecessors)
 
     def has_edge(self, source, target):
         """
@@ -52,11 +263,373 @@ class DirectedGraph:
         :return: True if there is a directed edge from source to target, False otherwise.
         """
         # Use get() to avoid KeyError if the source vertex is not in the graph
-        return target in self.adjacency_list.get(source, [])
+        return target in self.adjacency_list.get(source, ())
+
+    def edge_count(self, source, target):
+        """
+        Count the parallel edges from the source to the target vertex.
+
+        :param source: The starting vertex.
+        :param target: The ending vertex.
+        :return: The number of edges from source to target (0 if there is none).
+        """
+        neighbors = self.adjacency_list.get(source)
+        if neighbors is None:
+            return 0
+        if self.indexed:
+            return neighbors.get(target, 0)
+        return neighbors.count(target)
+
+    def neighbors(self, vertex):
+        """
+        Iterate over the outgoing neighbors of a vertex.
+
+        Parallel edges are reported once per edge in both modes. In indexed mode the copies
+        of a neighbor are reported together, at the position where it was first added.
+
+        :param vertex: The vertex whose neighbors are listed.
+        :return: An iterator over the neighbors of the vertex.
+        """
+        neighbors = self.adjacency_list.get(vertex, ())
+        if self.indexed and neighbors:
+            for neighbor, multiplicity in neighbors.items():
+                for _ in range(multiplicity):
+                    yield neighbor
+        else:
+            yield from neighbors
+
+    def predecessors(self, vertex):
+        """
+        Iterate over the incoming neighbors of a vertex.
+
+        Parallel edges are reported once per edge, as in `neighbors`. Runs in O(in-degree)
+        with the reverse index and scans every edge without it.
+
+        :param vertex: The vertex whose predecessors are listed.
+        :return: An iterator over the vertices with an edge into the vertex.
+        """
+        if not self.reverse:
+            for other, neighbors in self.adjacency_list.items():
+                for _ in range(neighbors.get(vertex, 0) if self.indexed else neighbors.count(vertex)):
+                    yield other
+            return
+
+        predecessors = self.reverse_adjacency_list.get(vertex, ())
+        if self.indexed and predecessors:
+            for predecessor, multiplicity in predecessors.items():
+                for _ in range(multiplicity):
+                    yield predecessor
+        else:
+            yield from predecessors
+
+    def in_degree(self, vertex):
+        """
+        Count the edges entering a vertex, parallel edges included.
+
+        O(1) with the reverse index once the id mirror is built, a scan over every edge without it.
+
+        :param vertex: The vertex.
+        :return: The in-degree, or 0 if the vertex does not exist.
+        """
+        if vertex not in self.adjacency_list:
+            return 0
+        if self.reverse:
+            return self.interned.in_degree[self.interned.symbols.id_of(vertex)]
+        return sum(1 for _ in self.predecessors(vertex))
+
+    def out_degree(self, vertex):
+        """
+        Count the edges leaving a vertex, parallel edges included.
+
+        :param vertex: The vertex.
+        :return: The out-degree, or 0 if the vertex does not exist.
+        """
+        if vertex not in self.adjacency_list:
+            return 0
+        if self.reverse:
+            return self.interned.out_degree[self.interned.symbols.id_of(vertex)]
+        neighbors = self.adjacency_list[vertex]
+        return sum(neighbors.values()) if self.indexed else len(neighbors)
+
+    def ancestors(self, vertex):
+        """
+        Find every vertex from which the given vertex can be reached.
+
+        This is the impact analysis of a change: if edges point from a vertex to the vertices
+        it depends on, the ancestors are everything that depends on the vertex, directly or
+        transitively, and may break when it changes. The search follows the reverse adjacency
+        list, so it touches only the ancestors and their incoming edges. Without the reverse
+        index one is built for the call.
+
+        :param vertex: The vertex.
+        :return: The set of ancestors, not including the vertex unless it lies on a cycle.
+        """
+        if vertex not in self.adjacency_list:
+            return set()
+
+        if self.reverse:
+            incoming = self.reverse_adjacency_list
+        else:
+            incoming = {}
+            for other, neighbors in self.adjacency_list.items():
+                for neighbor in neighbors:
+                    incoming.setdefault(neighbor, []).append(other)
+
+        found = set()
+        stack = [vertex]
+        while stack:
+            for predecessor in incoming.get(stack.pop(), ()):
+                if predecessor not in found:
+                    found.add(predecessor)
+                    stack.append(predecessor)
+        return found
+
+    def descendants(self, vertex):
+        """
+        Find every vertex that can be reached from the given vertex.
+
+        :param vertex: The vertex.
+        :return: The set of descendants, not including the vertex unless it lies on a cycle.
+        """
+        if vertex not in self.adjacency_list:
+            return set()
+
+        found = set()
+        stack = [vertex]
+        while stack:
+            for successor in self.adjacency_list[stack.pop()]:
+                if successor not in found:
+                    found.add(successor)
+                    stack.append(successor)
+        return found
+
+    def weight(self, source, target):
+        """
+        Return the weight of the edge from the source to the target vertex.
+
+        :param source: The starting vertex.
+        :param target: The ending vertex.
+        :return: The smallest weight among the parallel edges from source to target, or None
+                 if there is no such edge.
+        """
+        if not self.has_edge(source, target):
+            return None
+        weights = self.weights[source]
+        if self.indexed:
+            return min(weights[target])
+        return min(weight for neighbor, weight in zip(self.adjacency_list[source], weights)
+                   if neighbor == target)
+
+    def weighted_neighbors(self, vertex):
+        """
+        Iterate over the outgoing edges of a vertex together with their weights.
+
+        :param vertex: The vertex whose edges are listed.
+        :return: An iterator over (neighbor, weight) pairs.
+        """
+        if self.indexed:
+            # One entry per neighbor, carrying the smallest parallel-edge weight
+            return ((neighbor, min(weights)) for neighbor, weights in self.weights.get(vertex, {}).items())
+        return zip(self.adjacency_list.get(vertex, ()), self.weights.get(vertex, ()))
+
+    def dijkstra(self, source, targets=None):
+        """
+        Compute weighted shortest-path distances from a source vertex with Dijkstra's algorithm.
+
+        :param source: The vertex to start from.
+        :param targets: Optional vertices; the search stops once all of them are settled.
+        :return: A tuple (distances, parents) of dictionaries covering the settled vertices.
+        :raises ValueError: If a negative edge weight is encountered.
+        """
+        if source not in self.adjacency_list:
+            return {}, {}
+        return dijkstra(self.weighted_neighbors, source, targets)
+
+    def a_star(self, source, target, heuristic):
+        """
+        Find a weighted shortest path between two vertices with the A* algorithm.
+
+        :param source: The first vertex of the path.
+        :param target: The last vertex of the path.
+        :param heuristic: A function estimating the distance from a vertex to the target; the
+                          result is optimal when it never overestimates the true remaining
+                          distance and is consistent.
+        :return: A tuple (distance, path), or (inf, None) if the target is not reachable.
+        :raises ValueError: If a negative edge weight is encountered.
+        """
+        if source not in self.adjacency_list:
+            return float("inf"), None
+        return a_star(self.weighted_neighbors, source, target, heuristic)
+
+    def shortest_path(self, source, target):
+        """
+        Find a path with the fewest edges from the source to the target vertex.
+
+        Uses bidirectional BFS over the adjacency list and the reverse adjacency list, so the
+        search stops as soon as the two frontiers meet.
+
+        :param source: The first vertex of the path.
+        :param target: The last vertex of the path.
+        :return: The vertices of a shortest path, or None if there is no path (or either
+                 vertex does not exist).
+        """
+        if source not in self.adjacency_list or target not in self.adjacency_list:
+            return None
+
+        if not self.reverse:
+            # No incoming edges to search backwards along; run a plain BFS from the source
+            parents = {source: None}
+            frontier = [source]
+            while frontier and target not in parents:
+                next_frontier = []
+                for vertex in frontier:
+                    for neighbor in self.adjacency_list[vertex]:
+                        if neighbor not in parents:
+                            parents[neighbor] = vertex
+                            next_frontier.append(neighbor)
+                frontier = next_frontier
+            if target not in parents:
+                return None
+            path = [target]
+            while parents[path[-1]] is not None:
+                path.append(parents[path[-1]])
+            return path[::-1]
+
+        return bidirectional_shortest_path(
+            source, target,
+            self.adjacency_list.__getitem__,
+            self.reverse_adjacency_list.__getitem__,
+        )
+
+    def pagerank(self, damping=0.85, personalization=None, tolerance=1e-6, max_iterations=100,
+                 processes=None):
+        """
+        Rank the vertices with PageRank, or personalized PageRank if a personalization is given.
+
+        The graph is snapshotted into CSR arrays and ranked by power iteration over them,
+        vectorized with NumPy when it is installed. Edge weights are ignored; every parallel edge
+        counts separately.
+
+        :param damping: The probability of following an edge instead of jumping to a vertex.
+        :param personalization: Optional {vertex: weight} dictionary giving the probability of
+                                jumping to each vertex; uniform over all vertices if omitted.
+        :param tolerance: Stop once the ranks change by less than this in total between two
+                          iterations.
+        :param max_iterations: The number of iterations after which to give up.
+        :param processes: Optional number of worker processes to split every iteration across.
+        :return: A dictionary mapping every vertex to its rank; the ranks sum to 1.
+        :raises ValueError: If the damping factor or the personalization is invalid.
+        :raises RuntimeError: If the ranks do not converge within max_iterations.
+        """
+        self.interned.compact()  # Drop tombstones so the snapshot is copied from the id rows
+        return pagerank(CSRGraph.from_graph(self), damping, personalization, tolerance,
+                        max_iterations, processes)
+
+    def strongly_connected_components(self):
+        """
+        Find the strongly connected components of the graph with Tarjan's algorithm.
+
+        Two vertices belong to the same component if each can reach the other. The algorithm
+        runs iteratively over a CSR snapshot of the graph, with per-vertex state kept in flat
+        integer arrays, so it needs O(V + E) time and has no recursion limit.
+
+        :return: A list of components, each a list of vertices. Components are listed in
+                 topological order of the condensation: no edge leads from a later component
+                 to an earlier one.
+        """
+        self.interned.compact()  # Drop tombstones left by removed vertices
+        csr = CSRGraph.from_graph(self)  # Copied from the interned rows, ids are unchanged
+        offsets, targets = csr.offsets, csr.targets
+        vertex_count = csr.num_vertices()
+
+        index = array("q", [-1]) * vertex_count    # Discovery index of each vertex
+        low_link = array("q", [0]) * vertex_count  # Smallest index reachable from its subtree
+        next_edge = array("q", offsets[:-1])       # Next outgoing edge to explore per vertex
+        on_stack = bytearray(vertex_count)
+        component_stack = []
+        components = []
+        counter = 0
+
+        for root in range(vertex_count):
+            if index[root] != -1:
+                continue
+
+            index[root] = low_link[root] = counter
+            counter += 1
+            component_stack.append(root)
+            on_stack[root] = 1
+            call_stack = [root]
+
+            while call_stack:
+                vertex = call_stack[-1]
+                edge = next_edge[vertex]
+
+                if edge < offsets[vertex + 1]:
+                    # Explore the next outgoing edge of the vertex on top of the call stack
+                    next_edge[vertex] = edge + 1
+                    neighbor = targets[edge]
+                    if index[neighbor] == -1:
+                        index[neighbor] = low_link[neighbor] = counter
+                        counter += 1
+                        component_stack.append(neighbor)
+                        on_stack[neighbor] = 1
+                        call_stack.append(neighbor)
+                    elif on_stack[neighbor] and index[neighbor] < low_link[vertex]:
+                        low_link[vertex] = index[neighbor]
+                    continue
+
+                # All edges explored: return to the caller and propagate the low link
+                call_stack.pop()
+                if call_stack and low_link[vertex] < low_link[call_stack[-1]]:
+                    low_link[call_stack[-1]] = low_link[vertex]
+
+                if low_link[vertex] == index[vertex]:
+                    # The vertex is the root of a component; pop the whole component
+                    component = []
+                    while True:
+                        member = component_stack.pop()
+                        on_stack[member] = 0
+                        component.append(csr.symbols.labels[member])
+                        if member == vertex:
+                            break
+                    components.append(component)
+
+        # Tarjan emits components in reverse topological order
+        components.reverse()
+        return components
+
+    def condensation(self):
+        """
+        Collapse every strongly connected component into a single vertex.
+
+        The result is always acyclic. It is built in bulk: all component vertices are added
+        first and the deduplicated edges between components are loaded with one call to
+        `add_edges_from`, instead of one cycle-checked `add_edge` per edge.
+
+        :return: A tuple (dag, components) where dag is a DirectedAcyclicGraph whose vertices are
+                 the component numbers 0..k-1 and components[i] lists the vertices of component i.
+        """
+        components = self.strongly_connected_components()
+        component_of = {vertex: number for number, component in enumerate(components)
+                        for vertex in component}
+
+        edges = set()
+        for vertex, neighbors in self.adjacency_list.items():
+            source = component_of[vertex]
+            for neighbor in neighbors:
+                target = component_of[neighbor]
+                if source != target:
+                    edges.add((source, target))
+
+        dag = DirectedAcyclicGraph()
+        for number in range(len(components)):
+            dag.add_vertex(number)
+        dag.add_edges_from(sorted(edges))
+        return dag, components
 
     def print(self):
         """
         Print the adjacency list of the graph to show the vertices and their outgoing edges.
         """
-        for vertex, neighbors in self.adjacency_list.items():
-            print(f"{vertex} : {neighbors}")  # Print each vertex with its list of neighbors
+        for vertex in self.adjacency_list:
+            print(f"{vertex} : {list(self.neighbors(vertex))}")  # Print each vertex with its list of neighbors
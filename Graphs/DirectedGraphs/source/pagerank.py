@@ -0,0 +1,285 @@
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import RawArray
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python kernel is used without it
+    np = None
+
+
+class _PullKernel:
+    """
+    Sums, for a range of vertex ids, the rank shares sent along their incoming edges.
+
+    Works on the transpose of a CSR graph, whose row v lists the sources of the edges into v.
+    With NumPy the row sums are one `bincount` over the edge range; without it every row is
+    summed in Python.
+    """
+
+    def __init__(self, offsets, sources):
+        """
+        Prepare the kernel for a transposed CSR graph.
+
+        Args:
+            offsets (array): Row start positions of the transpose.
+            sources (array): Concatenated rows of the transpose.
+        """
+        if np is None:
+            self.offsets = offsets
+            self.sources = sources
+        else:
+            self.offsets = np.asarray(offsets, dtype=np.int64)
+            self.sources = np.asarray(sources, dtype=np.int64)
+            # The row of every edge, so that a whole range of rows is summed in one call
+            self.rows = np.repeat(np.arange(len(offsets) - 1), np.diff(self.offsets))
+
+    def __call__(self, share, first, last):
+        """
+        Sum the shares of the in-neighbors of the vertex ids first..last-1.
+
+        Args:
+            share: The rank of every vertex divided by its out-degree, indexed by id.
+            first (int): The first vertex id of the range.
+            last (int): One past the last vertex id of the range.
+
+        Returns:
+            The sums, one per vertex id of the range (a NumPy array, or an array of floats).
+        """
+        offsets, sources = self.offsets, self.sources
+        if np is not None:
+            begin, end = offsets[first], offsets[last]
+            return np.bincount(self.rows[begin:end] - first, weights=np.asarray(share)[sources[begin:end]],
+                               minlength=last - first)
+
+        lookup = share.__getitem__
+        return array("d", [sum(map(lookup, sources[offsets[vertex_id]:offsets[vertex_id + 1]]))
+                           for vertex_id in range(first, last)])
+
+
+# The state of a pool worker process, set once by _init_worker: its _PullKernel, and views of
+# the shared buffers it reads the rank shares from and writes its sums into.
+_worker_kernel = None
+_worker_share = None
+_worker_pulled = None
+
+
+def _float_view(buffer):
+    """
+    View a shared buffer of C doubles as a float vector, without copying it.
+
+    Args:
+        buffer (RawArray): The shared buffer.
+
+    Returns:
+        A NumPy array, or a memoryview of doubles without NumPy.
+    """
+    if np is not None:
+        return np.frombuffer(buffer, dtype=np.float64)
+    return memoryview(buffer).cast("B").cast("d")
+
+
+def _init_worker(offsets, sources, share, pulled):
+    """
+    Set up a pool worker, so the graph and the shared buffers reach every process only once.
+
+    Defined at module level so that it can be pickled for process pools.
+
+    Args:
+        offsets (array): Row start positions of the transpose.
+        sources (array): Concatenated rows of the transpose.
+        share (RawArray): The shared buffer holding the rank shares of all vertices.
+        pulled (RawArray): The shared buffer receiving the sums of all vertices.
+    """
+    global _worker_kernel, _worker_share, _worker_pulled
+    _worker_kernel = _PullKernel(offsets, sources)
+    _worker_share = _float_view(share)
+    _worker_pulled = _float_view(pulled)
+
+
+def _pull_chunk(first, last):
+    """
+    Run the worker's kernel over one range of vertex ids, reading and writing shared memory.
+
+    Args:
+        first (int): The first vertex id of the range.
+        last (int): One past the last vertex id of the range.
+    """
+    _worker_pulled[first:last] = _worker_kernel(_worker_share, first, last)
+
+
+def _edge_balanced_bounds(offsets, chunk_count):
+    """
+    Split the vertex ids into consecutive ranges holding about the same number of edges.
+
+    Args:
+        offsets (array): Row start positions of a CSR graph.
+        chunk_count (int): The number of ranges wanted.
+
+    Returns:
+        list: The range boundaries, starting with 0 and ending with the vertex count.
+    """
+    vertex_count = len(offsets) - 1
+    edge_count = offsets[-1]
+    bounds = [0]
+    for chunk in range(1, chunk_count):
+        bound = bisect_left(offsets, edge_count * chunk // chunk_count, bounds[-1], vertex_count)
+        if bound > bounds[-1]:
+            bounds.append(bound)
+    bounds.append(vertex_count)
+    return bounds
+
+
+def _teleport_vector(symbols, personalization):
+    """
+    Build the probability of jumping to every vertex.
+
+    Args:
+        symbols (SymbolTable): The vertex label table.
+        personalization (dict): Maps vertices to non-negative weights, or None for uniform.
+
+    Returns:
+        list: The jump probability of every vertex id, summing to 1.
+
+    Raises:
+        ValueError: If a weight is negative or no known vertex has a positive weight.
+    """
+    vertex_count = len(symbols)
+    if personalization is None:
+        return [1.0 / vertex_count] * vertex_count
+
+    teleport = [0.0] * vertex_count
+    for vertex, weight in personalization.items():
+        if weight < 0:
+            raise ValueError(f"Personalization weights must be non-negative, got {weight}!")
+        vertex_id = symbols.get(vertex)
+        if vertex_id is not None:
+            teleport[vertex_id] = float(weight)
+
+    total = sum(teleport)
+    if total <= 0:
+        raise ValueError("The personalization must give a positive weight to some vertex!")
+    return [weight / total for weight in teleport]
+
+
+def pagerank(csr, damping=0.85, personalization=None, tolerance=1e-6, max_iterations=100,
+             processes=None):
+    """
+    Compute the PageRank of every vertex of a directed CSR graph by power iteration.
+
+    Every iteration pulls, for each vertex, the rank of its in-neighbors divided by their
+    out-degree from the transposed graph: a sparse matrix-vector product. With NumPy the
+    product and the vector updates are vectorized; without it they run in plain Python.
+    The rank of vertices without outgoing edges is spread according to the personalization
+    (uniformly by default), so the ranks always sum to 1. Every parallel edge counts
+    separately.
+
+    Args:
+        csr (CSRGraph): The graph.
+        damping (float, optional): The probability of following an edge instead of jumping.
+        personalization (dict, optional): Maps vertices to the weight of jumping to them;
+            vertices left out get no jumps. Uniform over all vertices if omitted.
+        tolerance (float, optional): Stop once the ranks change by less than this in total
+            (L1 norm) between two iterations.
+        max_iterations (int, optional): The number of iterations after which to give up.
+        processes (int, optional): If given, split every product into ranges of vertices
+            with about the same number of edges and compute them in a process pool of this
+            size. The transposed graph is sent to every worker only once. The rank shares
+            and the sums live in two shared memory buffers of V doubles each: per iteration,
+            the parent copies the V shares into one and reads the V sums from the other,
+            and only two integers per range are sent to the workers, nothing is sent back.
+
+    Returns:
+        dict: Maps every vertex to its rank.
+
+    Raises:
+        ValueError: If the damping factor is outside [0, 1] or the personalization is invalid.
+        RuntimeError: If the ranks do not converge within max_iterations.
+    """
+    if not 0 <= damping <= 1:
+        raise ValueError(f"The damping factor must lie between 0 and 1, got {damping}!")
+
+    vertex_count = csr.num_vertices()
+    if vertex_count == 0:
+        return {}
+
+    teleport = _teleport_vector(csr.symbols, personalization)
+    offsets = csr.offsets
+    out_degree = [offsets[vertex_id + 1] - offsets[vertex_id] for vertex_id in range(vertex_count)]
+    transpose = csr.transpose()
+
+    if processes is None:
+        kernel = _PullKernel(transpose.offsets, transpose.targets)
+        return _power_iteration(kernel, vertex_count, out_degree, teleport, damping, tolerance,
+                                max_iterations, csr.symbols.labels)
+
+    bounds = _edge_balanced_bounds(transpose.offsets, 4 * processes)
+    shared_share, shared_pulled = RawArray("d", vertex_count), RawArray("d", vertex_count)
+    share_view, pulled_view = _float_view(shared_share), _float_view(shared_pulled)
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                             initargs=(transpose.offsets, transpose.targets, shared_share,
+                                       shared_pulled)) as pool:
+
+        def pull(share, first, last):
+            share_view[:] = share
+            for _ in pool.map(_pull_chunk, bounds[:-1], bounds[1:]):
+                pass  # Wait for every range; the sums are written to pulled_view
+            return pulled_view
+
+        return _power_iteration(pull, vertex_count, out_degree, teleport, damping, tolerance,
+                                max_iterations, csr.symbols.labels)
+
+
+def _power_iteration(pull, vertex_count, out_degree, teleport, damping, tolerance,
+                     max_iterations, labels):
+    """
+    Run the PageRank iterations with a given in-neighbor summation.
+
+    Args:
+        pull (callable): Called as pull(share, 0, vertex_count); returns the summed shares.
+        vertex_count (int): The number of vertices.
+        out_degree (list): The out-degree of every vertex id.
+        teleport (list): The jump probability of every vertex id.
+        damping (float): The probability of following an edge.
+        tolerance (float): The L1 change below which the ranks have converged.
+        max_iterations (int): The number of iterations after which to give up.
+        labels (list): The vertex label of every id.
+
+    Returns:
+        dict: Maps every vertex to its rank.
+
+    Raises:
+        RuntimeError: If the ranks do not converge within max_iterations.
+    """
+    if np is not None:
+        teleport = np.asarray(teleport)
+        degree = np.asarray(out_degree, dtype=np.float64)
+        dangling = degree == 0
+        inverse_degree = np.divide(1.0, degree, out=np.zeros(vertex_count), where=~dangling)
+        rank = np.full(vertex_count, 1.0 / vertex_count)
+
+        for _ in range(max_iterations):
+            jump = damping * rank[dangling].sum() + 1 - damping
+            new_rank = damping * pull(rank * inverse_degree, 0, vertex_count) + jump * teleport
+            error = np.abs(new_rank - rank).sum()
+            rank = new_rank
+            if error < tolerance:
+                return dict(zip(labels, rank.tolist()))
+    else:
+        dangling = [vertex_id for vertex_id, degree in enumerate(out_degree) if degree == 0]
+        inverse_degree = [1.0 / degree if degree else 0.0 for degree in out_degree]
+        rank = [1.0 / vertex_count] * vertex_count
+
+        for _ in range(max_iterations):
+            jump = damping * sum(rank[vertex_id] for vertex_id in dangling) + 1 - damping
+            share = array("d", map(float.__mul__, rank, inverse_degree))
+            pulled = pull(share, 0, vertex_count)
+            new_rank = [damping * total + jump * probability
+                        for total, probability in zip(pulled, teleport)]
+            error = sum(abs(new - old) for new, old in zip(new_rank, rank))
+            rank = new_rank
+            if error < tolerance:
+                return dict(zip(labels, rank))
+
+    raise RuntimeError(f"PageRank did not converge within {max_iterations} iterations!")
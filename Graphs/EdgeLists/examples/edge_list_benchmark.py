@@ -0,0 +1,93 @@
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+from Graphs.CSRGraphs.source.csr_graph import CSRGraph
+from Graphs.DirectedGraphs.source.directed_graph import DirectedGraph
+from Graphs.EdgeLists.source.edge_list import load_edge_list, write_binary_edge_list
+
+
+def random_edges(vertex_count, edge_count, seed=42):
+    """
+    Generate random directed edges between integer vertices.
+
+    Args:
+        vertex_count (int): Number of vertices.
+        edge_count (int): Number of edges.
+        seed (int, optional): Random seed, for reproducible runs.
+
+    Returns:
+        list: (source, target) pairs.
+    """
+    rng = random.Random(seed)
+    return [(rng.randrange(vertex_count), rng.randrange(vertex_count)) for _ in range(edge_count)]
+
+
+def load_per_edge(path):
+    """
+    Load a CSV edge file the straightforward way, with one `add_edge` call per line.
+
+    Args:
+        path (str): The edge file.
+
+    Returns:
+        DirectedGraph: The loaded graph.
+    """
+    graph = DirectedGraph()
+    with open(path, newline="") as file:
+        for source, target in csv.reader(file):
+            graph.add_edge(int(source), int(target))
+    return graph
+
+
+def timed(function, *args, **kwargs):
+    """
+    Call a function once and measure it.
+
+    Returns:
+        tuple: (seconds, result).
+    """
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    # Usage: python edge_list_benchmark.py [edge_count] [vertex_count]
+    edge_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    vertex_count = int(sys.argv[2]) if len(sys.argv) > 2 else edge_count // 10
+
+    directory = tempfile.mkdtemp()
+    csv_path = os.path.join(directory, "edges.csv")
+    binary_path = os.path.join(directory, "edges.bin")
+
+    edges = random_edges(vertex_count, edge_count)
+    with open(csv_path, "w", newline="") as file:
+        csv.writer(file).writerows(edges)
+    write_binary_edge_list(edges, binary_path)
+    del edges
+
+    per_edge_time, reference = timed(load_per_edge, csv_path)
+    csv_time, from_csv = timed(load_edge_list, csv_path, DirectedGraph(), parse=int)
+    binary_time, from_binary = timed(load_edge_list, binary_path, DirectedGraph())
+    csr_csv_time, csr_from_csv = timed(CSRGraph.from_edge_file, csv_path, parse=int)
+    csr_binary_time, csr_from_binary = timed(CSRGraph.from_edge_file, binary_path)
+
+    assert reference.adjacency_list == from_csv.adjacency_list == from_binary.adjacency_list
+    # Both build the vertex ids in order of first appearance, so the CSR arrays match exactly.
+    snapshot = CSRGraph.from_graph(reference)
+    for csr in (csr_from_csv, csr_from_binary):
+        assert csr.symbols.labels == snapshot.symbols.labels
+        assert csr.offsets == snapshot.offsets and csr.targets == snapshot.targets
+
+    print(f"Edges: {edge_count}, vertices: {len(reference.adjacency_list)}")
+    for name, seconds in (("CSV, add_edge per line", per_edge_time),
+                          ("CSV, load_edge_list", csv_time),
+                          ("binary, load_edge_list", binary_time),
+                          ("CSV, CSR from_edge_file", csr_csv_time),
+                          ("binary, CSR from_edge_file", csr_binary_time)):
+        print(f"{name:<27} {seconds:.3f}s  {edge_count / seconds / 1e6:.2f}M edges/s"
+              f"  ({per_edge_time / seconds:.2f}x)")
@@ -0,0 +1,368 @@
+import csv
+import gc
+import os
+from array import array
+from itertools import chain, dropwhile, islice, takewhile
+from operator import itemgetter
+
+# Edges handed to a graph's `add_edges_from` or read from a file per batch.
+CHUNK_SIZE = 65536
+
+# Binary edge files are a flat sequence of (source, target) pairs of signed 64-bit integers
+# in the byte order of the machine that wrote them.
+BINARY_TYPECODE = "q"
+
+FORMATS = {".csv": "csv", ".tsv": "tsv", ".txt": "tsv", ".bin": "binary"}
+
+
+def chunked(iterable, size=CHUNK_SIZE):
+    """
+    Split an iterable into lists of at most `size` items.
+
+    Args:
+        iterable (iterable): The items; consumed lazily.
+        size (int, optional): The maximum length of each list.
+
+    Yields:
+        list: The next batch of items.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def split_weights(chunk):
+    """
+    Separate the weights from a batch of edges.
+
+    The whole batch is checked before anything is returned, so a graph calling this before
+    it mutates itself rejects a malformed batch without adding any of its edges.
+
+    Args:
+        chunk (list): (source, target) pairs or (source, target, weight) triples; not empty.
+
+    Returns:
+        tuple: (pairs, weights), where weights is None if the batch holds plain pairs.
+
+    Raises:
+        ValueError: If the batch mixes pairs and triples, or holds any other kind of edge;
+            the message names the first offending edge.
+    """
+    width = len(chunk[0])
+    if width not in (2, 3):
+        raise ValueError(f"Edge {chunk[0]!r} has {width} items, expected a pair or a triple!")
+    if set(map(len, chunk)) != {width}:
+        edge = next(edge for edge in chunk if len(edge) != width)
+        raise ValueError(f"Edge {edge!r} has {len(edge)} items, but the batch started "
+                         f"with {width}-item edges!")
+    if width == 2:
+        return chunk, None
+    return list(map(itemgetter(0, 1), chunk)), list(map(itemgetter(2), chunk))
+
+
+def new_endpoints(pairs, known):
+    """
+    Collect the endpoints of a batch of edges that are not yet vertices of a graph.
+
+    Membership is tested once per distinct endpoint with a set difference done in C, so a
+    bulk load only pays a Python-level step for the vertices that are actually new.
+
+    Args:
+        pairs (list): (source, target) pairs.
+        known (container): The existing vertices, e.g. an adjacency dict or a vertex set.
+
+    Returns:
+        list: The new endpoints, in the order they first appear in the batch.
+    """
+    missing = set(chain.from_iterable(pairs)).difference(known)
+    if not missing:
+        return []
+
+    ordered = []
+    for vertex in chain.from_iterable(pairs):
+        if vertex in missing:
+            missing.discard(vertex)
+            ordered.append(vertex)
+            if not missing:
+                break
+    return ordered
+
+
+def _format_of(path):
+    """
+    Guess the edge file format from the file extension.
+
+    Args:
+        path (str): The edge file.
+
+    Returns:
+        str: "csv", "tsv" or "binary".
+
+    Raises:
+        ValueError: If the extension is not known.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"Cannot tell the format of {path}; pass format='csv', 'tsv' or 'binary'!")
+    return FORMATS[extension]
+
+
+def _read_text_chunks(path, delimiter, chunk_size, parse):
+    """
+    Read a delimited text edge file in batches.
+
+    Leading lines starting with '#' (a comment header, as in the SNAP datasets) and blank
+    lines are skipped. A third column, if present, is read as the edge weight; every line
+    must then have the same number of columns as the first one.
+
+    Args:
+        path (str): The edge file.
+        delimiter (str): The field separator.
+        chunk_size (int): Lines per batch.
+        parse (callable): Converts a label field to a vertex, or None to keep the string.
+
+    Yields:
+        list: (source, target) pairs or (source, target, weight) triples.
+
+    Raises:
+        ValueError: If a line does not have 2 or 3 columns, or not as many as the first line.
+    """
+    parse = parse or str
+    for width, chunk in _read_text_rows(path, delimiter, chunk_size):
+        if width == 3:
+            yield [(parse(source), parse(target), float(weight)) for source, target, weight in chunk]
+        else:
+            yield [(parse(source), parse(target)) for source, target in chunk]
+
+
+def _read_text_rows(path, delimiter, chunk_size):
+    """
+    Read the split lines of a delimited text edge file in batches, checking their columns.
+
+    Args:
+        path (str): The edge file.
+        delimiter (str): The field separator.
+        chunk_size (int): Lines per batch.
+
+    Yields:
+        tuple: (width, rows), where rows is a list of lists of `width` string fields.
+
+    Raises:
+        ValueError: If a line does not have 2 or 3 columns, or not as many as the first line.
+    """
+    width = None  # Column count of the first line, which every other line must match
+    with open(path, newline="") as file:
+        lines = dropwhile(lambda line: line.startswith("#"), file)
+        # The csv module splits the lines in C and handles quoted labels.
+        rows = filter(None, csv.reader(lines, delimiter=delimiter))
+        for chunk in chunked(rows, chunk_size):
+            if width is None:
+                width = len(chunk[0]) if len(chunk[0]) in (2, 3) else 2
+            if set(map(len, chunk)) != {width}:
+                _raise_bad_line(path, delimiter, width)
+            yield width, chunk
+
+
+def _raise_bad_line(path, delimiter, width):
+    """
+    Report the first line of a text edge file that does not have the expected column count.
+
+    Only called once a batch is known to hold such a line, so the file is scanned a second
+    time instead of tracking line numbers while reading.
+
+    Args:
+        path (str): The edge file.
+        delimiter (str): The field separator.
+        width (int): The expected number of columns.
+
+    Raises:
+        ValueError: Naming the line and its column count.
+    """
+    with open(path, newline="") as file:
+        header = sum(1 for _ in takewhile(lambda line: line.startswith("#"), file))
+        file.seek(0)
+        reader = csv.reader(islice(file, header, None), delimiter=delimiter)
+        for row in reader:
+            if row and len(row) != width:
+                raise ValueError(f"{path}, line {header + reader.line_num}: expected {width} columns, "
+                                 f"found {len(row)}!")
+
+
+def _read_binary_chunks(path, chunk_size):
+    """
+    Read a binary edge file written by `write_binary_edge_list` in batches.
+
+    Args:
+        path (str): The edge file.
+        chunk_size (int): Edges per batch.
+
+    Yields:
+        list: (source, target) pairs of integers.
+
+    Raises:
+        ValueError: If the file ends in the middle of an edge.
+    """
+    for values in _read_binary_arrays(path, chunk_size):
+        yield list(zip(values[0::2], values[1::2]))
+
+
+def _read_binary_arrays(path, chunk_size):
+    """
+    Read a binary edge file in batches of raw integer arrays.
+
+    Args:
+        path (str): The edge file.
+        chunk_size (int): Edges per batch.
+
+    Yields:
+        array: The next batch as source, target, source, target, ... values.
+
+    Raises:
+        ValueError: If the file ends in the middle of an edge.
+    """
+    with open(path, "rb") as file:
+        while True:
+            values = array(BINARY_TYPECODE)
+            try:
+                values.fromfile(file, 2 * chunk_size)
+            except EOFError:
+                pass  # The last batch is shorter; fromfile keeps what it read.
+
+            if len(values) % 2:
+                raise ValueError(f"{path} ends in the middle of an edge!")
+            if not values:
+                return
+            yield values
+
+
+def read_edge_chunks(path, format=None, chunk_size=CHUNK_SIZE, parse=None):
+    """
+    Stream the edges of an edge file in batches.
+
+    Text formats hold one edge per line: source and target label, optionally followed by a
+    weight. The binary format holds (source, target) pairs of 64-bit integers and is the
+    fastest to read, since each batch is loaded with a single `array.fromfile` call.
+
+    Args:
+        path (str): The edge file.
+        format (str, optional): "csv", "tsv" or "binary"; guessed from the extension if omitted.
+        chunk_size (int, optional): Edges per batch.
+        parse (callable, optional): Converts text labels, e.g. `int`; ignored for binary files.
+
+    Yields:
+        list: The next batch of (source, target) pairs or (source, target, weight) triples.
+
+    Raises:
+        ValueError: If the format is unknown, a text line has the wrong number of columns or
+            a binary file is truncated.
+    """
+    format = format or _format_of(path)
+    if format == "binary":
+        return _read_binary_chunks(path, chunk_size)
+    if format in ("csv", "tsv"):
+        return _read_text_chunks(path, "," if format == "csv" else "\t", chunk_size, parse)
+    raise ValueError(f"Unknown edge file format {format!r}!")
+
+
+def read_endpoint_chunks(path, format=None, chunk_size=CHUNK_SIZE, parse=None):
+    """
+    Stream the edge endpoints of an edge file in flat batches, without building edge tuples.
+
+    Binary batches are the arrays filled by `array.fromfile` as they are; text batches are
+    flattened into one list. Weights are dropped. This feeds bulk consumers such as
+    `CSRGraph.from_edge_file`, which intern a whole batch at once.
+
+    Args:
+        path (str): The edge file.
+        format (str, optional): See `read_edge_chunks`.
+        chunk_size (int, optional): Edges per batch.
+        parse (callable, optional): See `read_edge_chunks`.
+
+    Yields:
+        array or list: The next batch as source, target, source, target, ... labels.
+
+    Raises:
+        ValueError: See `read_edge_chunks`.
+    """
+    format = format or _format_of(path)
+    if format == "binary":
+        yield from _read_binary_arrays(path, chunk_size)
+        return
+    if format not in ("csv", "tsv"):
+        raise ValueError(f"Unknown edge file format {format!r}!")
+
+    parse = parse or str
+    for width, chunk in _read_text_rows(path, "," if format == "csv" else "\t", chunk_size):
+        if width == 3:
+            chunk = map(itemgetter(0, 1), chunk)
+        yield list(map(parse, chain.from_iterable(chunk)))
+
+
+def iter_edges(path, format=None, chunk_size=CHUNK_SIZE, parse=None):
+    """
+    Iterate over the edges of an edge file one by one, reading it in batches.
+
+    Useful for consumers that take a single edge iterable, such as `CSRGraph.from_edge_list`,
+    which ignores the weights of 3-column files. To build a CSR graph from a file,
+    `CSRGraph.from_edge_file` is faster.
+
+    Args:
+        path (str): The edge file.
+        format (str, optional): See `read_edge_chunks`.
+        chunk_size (int, optional): Edges per batch.
+        parse (callable, optional): See `read_edge_chunks`.
+
+    Returns:
+        iterator: The edges as (source, target) or (source, target, weight) tuples.
+    """
+    return chain.from_iterable(read_edge_chunks(path, format, chunk_size, parse))
+
+
+def load_edge_list(path, graph, format=None, chunk_size=CHUNK_SIZE, parse=None):
+    """
+    Load an edge file into a graph through its bulk `add_edges_from` path.
+
+    The file is read in batches and never held in memory as a whole. The graph registers the
+    new vertices of every batch at once and then appends the edges without per-edge
+    membership checks or method calls. The garbage collector is paused while loading.
+
+    Args:
+        path (str): The edge file.
+        graph: A DirectedGraph, UndirectedGraph, BFSGraph, DFSGraph or DirectedAcyclicGraph.
+        format (str, optional): See `read_edge_chunks`.
+        chunk_size (int, optional): Edges per batch.
+        parse (callable, optional): See `read_edge_chunks`.
+
+    Returns:
+        The graph, for chaining.
+    """
+    # Every batch allocates tens of thousands of short-lived tuples; with the collector on,
+    # they keep triggering full collections that rescan the whole, ever growing graph.
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        graph.add_edges_from(iter_edges(path, format, chunk_size, parse))
+    finally:
+        if collecting:
+            gc.enable()
+    return graph
+
+
+def write_binary_edge_list(edges, path, chunk_size=CHUNK_SIZE):
+    """
+    Write (source, target) pairs of integers to a binary edge file.
+
+    Args:
+        edges (iterable): Pairs of integer vertex ids.
+        path (str): The file to write.
+        chunk_size (int, optional): Edges encoded per write.
+
+    Raises:
+        OverflowError: If an id does not fit in a signed 64-bit integer.
+    """
+    with open(path, "wb") as file:
+        for chunk in chunked(edges, chunk_size):
+            array(BINARY_TYPECODE, chain.from_iterable(chunk)).tofile(file)
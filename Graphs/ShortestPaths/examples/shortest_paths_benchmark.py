@@ -0,0 +1,69 @@
+import random
+import sys
+import time
+
+from Graphs.UndirectedGraphs.source.undirected_graph import UndirectedGraph
+
+
+def road_network(side, seed=7):
+    """
+    Generate a road-network-like grid: side x side intersections, each connected to its right
+    and lower neighbor by a road whose length is between 1 and 2.
+
+    Args:
+        side (int): Number of intersections per row and per column.
+        seed (int, optional): Random seed, for reproducible runs.
+
+    Returns:
+        UndirectedGraph: The generated graph; vertices are (row, column) tuples.
+    """
+    rng = random.Random(seed)
+    graph = UndirectedGraph()
+    for row in range(side):
+        for column in range(side):
+            if column + 1 < side:
+                graph.add_edge((row, column), (row, column + 1), 1.0 + rng.random())
+            if row + 1 < side:
+                graph.add_edge((row, column), (row + 1, column), 1.0 + rng.random())
+    return graph
+
+
+def timed(label, function, *args):
+    """
+    Run a function once, print how long it took and return its result.
+
+    Args:
+        label (str): Description printed next to the timing.
+        function (callable): The function to time.
+        *args: Arguments for the function.
+
+    Returns:
+        any: The result of the function.
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    print(f"{label:<40} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+if __name__ == "__main__":
+    # Usage: python shortest_paths_benchmark.py [side]; the default builds ~1M vertices
+    side = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    graph = timed(f"Build {side}x{side} road network", road_network, side)
+    source = (0, 0)
+    target = (side - 1, side - 1)
+    nearby = (side // 10, side // 10)
+
+    def manhattan(vertex):
+        # Every road is at least 1 long, so the grid distance never overestimates
+        return abs(vertex[0] - target[0]) + abs(vertex[1] - target[1])
+
+    distances, _ = timed("Dijkstra, all vertices", graph.dijkstra, source)
+    early, _ = timed("Dijkstra, stop at far corner", graph.dijkstra, source, [target])
+    timed("Dijkstra, stop at nearby vertex", graph.dijkstra, source, [nearby])
+    timed("Dijkstra, multi-target (3 targets)", graph.dijkstra, source, [nearby, target, (0, side - 1)])
+    distance, path = timed("A*, far corner (Manhattan heuristic)", graph.a_star, source, target, manhattan)
+
+    assert abs(distance - distances[target]) < 1e-9 and abs(early[target] - distance) < 1e-9
+    print(f"\nShortest distance to {target}: {distance:.3f} over {len(path) - 1} roads")
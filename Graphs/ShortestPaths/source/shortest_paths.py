@@ -0,0 +1,128 @@
+from heapq import heappop, heappush
+from itertools import count
+
+
+def dijkstra(weighted_neighbors, source, targets=None):
+    """
+    Compute weighted shortest-path distances from a source vertex with Dijkstra's algorithm.
+
+    The frontier is a binary heap with lazy deletion: when a shorter distance to a vertex is
+    found, a new heap entry is pushed and the outdated one is skipped when it is popped, which
+    is cheaper than a decrease-key operation. A vertex is settled (its distance is final) when
+    it is popped for the first time.
+
+    Args:
+        weighted_neighbors (callable): Returns (neighbor, weight) pairs for a vertex.
+        source: The vertex to start from.
+        targets (iterable, optional): If given, stop as soon as all of these vertices are
+            settled. Distances of vertices settled until then are still returned.
+
+    Returns:
+        tuple: (distances, parents) dictionaries covering the settled vertices. The source has
+        distance 0 and parent None.
+
+    Raises:
+        ValueError: If a negative edge weight is encountered.
+    """
+    remaining = None if targets is None else set(targets)
+    tie_breaker = count()  # Keeps heap entries comparable without comparing vertices
+
+    distances = {}
+    parents = {source: None}
+    best = {source: 0.0}   # Best tentative distance of every discovered vertex
+    heap = [(0.0, next(tie_breaker), source)]
+
+    while heap:
+        distance, _, vertex = heappop(heap)
+        if vertex in distances:
+            continue  # Outdated entry (lazy deletion)
+        distances[vertex] = distance
+
+        if remaining is not None:
+            remaining.discard(vertex)
+            if not remaining:
+                break
+
+        for neighbor, weight in weighted_neighbors(vertex):
+            if weight < 0:
+                raise ValueError(f"Dijkstra's algorithm requires non-negative weights, got {weight}!")
+            candidate = distance + weight
+            if neighbor not in distances and candidate < best.get(neighbor, float("inf")):
+                best[neighbor] = candidate
+                parents[neighbor] = vertex
+                heappush(heap, (candidate, next(tie_breaker), neighbor))
+
+    return distances, {vertex: parents[vertex] for vertex in distances}
+
+
+def a_star(weighted_neighbors, source, target, heuristic):
+    """
+    Find a weighted shortest path between two vertices with the A* algorithm.
+
+    A* is Dijkstra's algorithm ordered by distance-so-far plus a heuristic estimate of the
+    remaining distance, which steers the search towards the target. The result is optimal when
+    the heuristic never overestimates the true remaining distance and is consistent (for example
+    the straight-line distance on a road network). A heuristic of 0 makes it plain Dijkstra.
+
+    Args:
+        weighted_neighbors (callable): Returns (neighbor, weight) pairs for a vertex.
+        source: The first vertex of the path.
+        target: The last vertex of the path.
+        heuristic (callable): Estimates the distance from a vertex to the target.
+
+    Returns:
+        tuple: (distance, path) where path lists the vertices from source to target, or
+        (inf, None) if the target is not reachable.
+
+    Raises:
+        ValueError: If a negative edge weight is encountered.
+    """
+    tie_breaker = count()
+
+    settled = set()
+    parents = {source: None}
+    best = {source: 0.0}
+    heap = [(heuristic(source), next(tie_breaker), 0.0, source)]
+
+    while heap:
+        _, _, distance, vertex = heappop(heap)
+        if vertex in settled:
+            continue  # Outdated entry (lazy deletion)
+        if vertex == target:
+            return distance, build_path(parents, target)
+        settled.add(vertex)
+
+        for neighbor, weight in weighted_neighbors(vertex):
+            if weight < 0:
+                raise ValueError(f"A* requires non-negative weights, got {weight}!")
+            candidate = distance + weight
+            if neighbor not in settled and candidate < best.get(neighbor, float("inf")):
+                best[neighbor] = candidate
+                parents[neighbor] = vertex
+                heappush(heap, (candidate + heuristic(neighbor), next(tie_breaker), candidate, neighbor))
+
+    return float("inf"), None
+
+
+def build_path(parents, target):
+    """
+    Rebuild a path by following parent pointers back from the target.
+
+    Args:
+        parents (dict): Parent of every reached vertex; the start vertex has parent None.
+        target: The last vertex of the path.
+
+    Returns:
+        list: The vertices from the start vertex to the target, or None if the target was
+        not reached.
+    """
+    if target not in parents:
+        return None
+
+    path = []
+    vertex = target
+    while vertex is not None:
+        path.append(vertex)
+        vertex = parents[vertex]
+    path.reverse()
+    return path
@@ -0,0 +1,454 @@
+from array import array
+from collections import deque
+
+from Graphs.SymbolTables.source.symbol_table import SymbolTable
+from Graphs.SymbolTables.source.visited_marker import VisitedMarker
+
+
+class InternedAdjacency:
+    """
+    A class to keep an adjacency list over dense integer vertex ids next to a labeled graph.
+
+    The graph classes of this package store their public adjacency keyed by the original
+    vertex labels. The first time one of them is traversed or snapshotted, it builds an
+    InternedAdjacency from that adjacency (`from_adjacency`) and from then on feeds it every
+    vertex and edge change, so graphs that are only built and queried by label never pay for
+    it. The DirectedAcyclicGraph keeps its weights by id and maintains one from the start.
+
+    The mirror interns the labels once and records the edges as rows of integer ids.
+    Traversals then run entirely on ints, marking vertices in a bytearray indexed by id instead
+    of hashing labels into a set, and only translate ids back to labels for their results.
+
+    The bytearrays are VisitedMarkers taken from a pool and handed back when a traversal
+    ends, so repeated traversals of the same graph neither allocate nor clear a visited array.
+
+    Removing a vertex leaves a tombstone: its label is dropped from the symbol table and its row
+    emptied, while the other ids stay valid, so the removal costs O(degree) instead of a
+    renumbering. Tombstones are unreachable, so traversals from live vertices never see them.
+    Once they outnumber the live vertices the ids are compacted; whole-graph passes that
+    enumerate every id compact first. Owners that keep their own arrays indexed by id remap
+    them with the list returned by `compact`.
+
+    Attributes:
+        symbols (SymbolTable): Maps vertex labels to ids and back.
+        rows (list): rows[i] holds the neighbor ids of vertex i: a list with one entry per
+            edge, or a {neighbor id: multiplicity} dictionary in indexed mode.
+        indexed (bool): Whether the rows are dictionaries.
+        in_degree (array): The number of edges entering every vertex id, or None if degrees
+            are not tracked.
+        out_degree (array): The number of edges leaving every vertex id, or None if degrees
+            are not tracked.
+    """
+
+    def __init__(self, indexed=False, degrees=False):
+        """
+        Initialize an empty id adjacency.
+
+        Args:
+            indexed (bool, optional): Keep every row as a {neighbor id: multiplicity}
+                dictionary, so that edge removal is O(1).
+            degrees (bool, optional): Maintain in- and out-degree counters, so that degree
+                queries and Kahn's algorithm do not have to count edges.
+        """
+        self.symbols = SymbolTable()
+        self.rows = []
+        self.indexed = indexed
+        self.in_degree = array("q") if degrees else None
+        self.out_degree = array("q") if degrees else None
+        self._markers = []  # Idle VisitedMarkers, reused by later traversals
+
+    @classmethod
+    def from_adjacency(cls, vertices, adjacency, indexed=False, degrees=False):
+        """
+        Build an id adjacency from a label-keyed adjacency in a single pass.
+
+        Args:
+            vertices (iterable): Every vertex label, in the order the ids are handed out.
+            adjacency (dict): Maps vertex labels to their neighbors: a list with one entry per
+                edge, or a {neighbor: multiplicity} dictionary in indexed mode. Vertices
+                without an entry have no neighbors.
+            indexed (bool, optional): See `__init__`.
+            degrees (bool, optional): See `__init__`.
+
+        Returns:
+            InternedAdjacency: The mirror of the adjacency.
+        """
+        interned = cls(indexed, degrees)
+        symbols = interned.symbols
+        for vertex in vertices:
+            symbols.intern(vertex)
+
+        ids = symbols.ids
+        if indexed:
+            interned.rows = [{ids[neighbor]: multiplicity for neighbor, multiplicity in adjacency.get(vertex, {}).items()}
+                             for vertex in symbols.labels]
+        else:
+            interned.rows = [[ids[neighbor] for neighbor in adjacency.get(vertex, ())] for vertex in symbols.labels]
+
+        if degrees:
+            rows = interned.rows
+            interned.out_degree = array("q", map(sum, map(dict.values, rows)) if indexed else map(len, rows))
+            in_degree = interned.in_degree = array("q", [0]) * len(rows)
+            for row in rows:
+                for neighbor_id in row:
+                    in_degree[neighbor_id] += row[neighbor_id] if indexed else 1
+        return interned
+
+    def add_vertex(self, label):
+        """
+        Intern a vertex label, creating an empty row for it if it is new.
+
+        Args:
+            label (hashable): The vertex label.
+
+        Returns:
+            int: The id of the vertex.
+        """
+        vertex_id = self.symbols.intern(label)
+        if vertex_id == len(self.rows):
+            self.rows.append({} if self.indexed else [])
+            if self.in_degree is not None:
+                self.in_degree.append(0)
+                self.out_degree.append(0)
+        return vertex_id
+
+    def add_edge(self, source, target):
+        """
+        Record an edge between two vertices that have already been added.
+
+        Args:
+            source (hashable): The source label.
+            target (hashable): The target label.
+        """
+        ids = self.symbols.ids
+        source_id = ids[source]
+        target_id = ids[target]
+        row = self.rows[source_id]
+        if self.indexed:
+            row[target_id] = row.get(target_id, 0) + 1
+        else:
+            row.append(target_id)
+        if self.in_degree is not None:
+            self.in_degree[target_id] += 1
+            self.out_degree[source_id] += 1
+
+    def add_edges(self, pairs):
+        """
+        Record many edges between vertices that have already been added.
+
+        Args:
+            pairs (iterable): (source, target) label pairs.
+        """
+        ids = self.symbols.ids
+        rows = self.rows
+        if self.in_degree is not None:
+            # Count while appending; the plain loops below stay free of the extra work
+            in_degree, out_degree = self.in_degree, self.out_degree
+            for source, target in pairs:
+                source_id = ids[source]
+                target_id = ids[target]
+                row = rows[source_id]
+                if self.indexed:
+                    row[target_id] = row.get(target_id, 0) + 1
+                else:
+                    row.append(target_id)
+                in_degree[target_id] += 1
+                out_degree[source_id] += 1
+        elif self.indexed:
+            for source, target in pairs:
+                row = rows[ids[source]]
+                target_id = ids[target]
+                row[target_id] = row.get(target_id, 0) + 1
+        else:
+            for source, target in pairs:
+                rows[ids[source]].append(ids[target])
+
+    def remove_edge(self, source, target):
+        """
+        Forget one recorded edge between two vertices.
+
+        Args:
+            source (hashable): The source label.
+            target (hashable): The target label.
+
+        Raises:
+            KeyError: If a vertex is unknown.
+            ValueError: If the edge was not recorded.
+        """
+        ids = self.symbols.ids
+        source_id = ids[source]
+        target_id = ids[target]
+        row = self.rows[source_id]
+        if not self.indexed:
+            row.remove(target_id)
+        elif target_id not in row:
+            raise ValueError(f"Edge {source} -> {target} was not recorded!")
+        elif row[target_id] == 1:
+            del row[target_id]
+        else:
+            row[target_id] -= 1
+        if self.in_degree is not None:
+            self.in_degree[target_id] -= 1
+            self.out_degree[source_id] -= 1
+
+    def pop_edge(self, source):
+        """
+        Forget the most recently recorded edge leaving a vertex, in list mode.
+
+        Used to roll back a failed bulk insertion edge by edge, in reverse order.
+
+        Args:
+            source (hashable): The source label.
+        """
+        source_id = self.symbols.ids[source]
+        target_id = self.rows[source_id].pop()
+        if self.in_degree is not None:
+            self.in_degree[target_id] -= 1
+            self.out_degree[source_id] -= 1
+
+    def remove_vertex(self, label, referrers):
+        """
+        Remove a vertex and every recorded edge to or from it, leaving a tombstone.
+
+        Args:
+            label (hashable): The vertex label.
+            referrers (iterable): The labels of the vertices whose rows may hold the vertex,
+                i.e. its in-neighbors (or its neighbors in an undirected graph). Duplicates
+                and the vertex itself are fine.
+
+        Returns:
+            list: If the removal triggered a compaction, the old id of every vertex indexed by
+            its new id (see `compact`); None otherwise.
+
+        Raises:
+            KeyError: If the vertex is unknown.
+        """
+        ids = self.symbols.ids
+        rows = self.rows
+        vertex_id = ids[label]
+
+        in_degree, out_degree = self.in_degree, self.out_degree
+
+        for referrer_id in {ids[referrer] for referrer in referrers}:
+            row = rows[referrer_id]
+            if self.indexed:
+                dropped = row.pop(vertex_id, 0)
+            elif vertex_id in row:
+                length = len(row)
+                row[:] = [neighbor_id for neighbor_id in row if neighbor_id != vertex_id]
+                dropped = length - len(row)
+            else:
+                dropped = 0
+            if in_degree is not None:
+                out_degree[referrer_id] -= dropped
+
+        if in_degree is not None:
+            row = rows[vertex_id]
+            for neighbor_id in row:
+                in_degree[neighbor_id] -= row[neighbor_id] if self.indexed else 1
+            in_degree[vertex_id] = out_degree[vertex_id] = 0
+
+        rows[vertex_id] = {} if self.indexed else []
+        self.symbols.remove(label)
+
+        if 2 * self.symbols.removed > len(rows):
+            return self.compact()
+        return None
+
+    def compact(self):
+        """
+        Drop the tombstones and renumber the live vertices densely, keeping their order.
+
+        The symbol table and the rows are updated in place.
+
+        Returns:
+            list: The old id of every vertex indexed by its new id, or None if there were no
+            tombstones and the ids are unchanged.
+        """
+        if not self.symbols.removed:
+            return None
+
+        kept = self.symbols.compact()
+        new_ids = {old_id: new_id for new_id, old_id in enumerate(kept)}
+        rows = self.rows
+        if self.indexed:
+            rows[:] = [{new_ids[neighbor_id]: multiplicity for neighbor_id, multiplicity in rows[old_id].items()}
+                       for old_id in kept]
+        else:
+            rows[:] = [list(map(new_ids.__getitem__, rows[old_id])) for old_id in kept]
+        if self.in_degree is not None:
+            self.in_degree = array("q", map(self.in_degree.__getitem__, kept))
+            self.out_degree = array("q", map(self.out_degree.__getitem__, kept))
+        return kept
+
+    def truncate(self, vertex_count):
+        """
+        Drop the most recently added vertices, keeping the first `vertex_count`.
+
+        Used to roll back a failed bulk insertion. Edges from the kept vertices to the dropped
+        ones must have been removed already.
+
+        Args:
+            vertex_count (int): The number of vertices to keep.
+        """
+        symbols = self.symbols
+        for label in symbols.labels[vertex_count:]:
+            del symbols.ids[label]
+        del symbols.labels[vertex_count:]
+        del self.rows[vertex_count:]
+        if self.in_degree is not None:
+            del self.in_degree[vertex_count:]
+            del self.out_degree[vertex_count:]
+
+    def acquire_marker(self):
+        """
+        Take a VisitedMarker from the pool, reset for a new traversal of this graph.
+
+        Every traversal running at the same time (e.g. nested generators) gets its own
+        marker. Hand it back with `release_marker` when the traversal ends.
+
+        Returns:
+            VisitedMarker: A marker covering every vertex id, with no vertex marked.
+        """
+        marker = self._markers.pop() if self._markers else VisitedMarker()
+        marker.reset(len(self.rows))
+        return marker
+
+    def release_marker(self, marker):
+        """
+        Return a marker obtained from `acquire_marker` to the pool.
+
+        Args:
+            marker (VisitedMarker): The marker; it must not be used afterwards.
+        """
+        self._markers.append(marker)
+
+    def ids_of(self, labels):
+        """
+        Translate labels to ids, skipping unknown labels and duplicates.
+
+        Args:
+            labels (iterable): The vertex labels.
+
+        Returns:
+            list: The ids, in the order of their first occurrence.
+        """
+        ids = self.symbols.ids
+        return list(dict.fromkeys(ids[label] for label in labels if label in ids))
+
+    def bfs(self, source_ids):
+        """
+        Run a BFS from one or more vertex ids, marking vertices when they are enqueued.
+
+        Vertices and edges may be added while the traversal is suspended; the marks grow to
+        cover the new ids, and edges out of vertices not expanded yet are followed.
+
+        Args:
+            source_ids (list): The ids to start from, without duplicates.
+
+        Yields:
+            tuple: (vertex id, depth, parent id) in BFS order; sources have parent -1.
+        """
+        rows = self.rows
+        marker = self.acquire_marker()
+        marks, stamp = marker.marks, marker.stamp
+        queue = deque()
+        for source_id in source_ids:
+            marks[source_id] = stamp
+            queue.append((source_id, 0, -1))
+
+        try:
+            while queue:
+                vertex_id, depth, parent_id = queue.popleft()
+                yield vertex_id, depth, parent_id
+
+                if len(marks) < len(rows):
+                    marker.cover(len(rows))  # Vertices were added while suspended
+                for neighbor_id in rows[vertex_id]:
+                    if marks[neighbor_id] != stamp:
+                        marks[neighbor_id] = stamp
+                        queue.append((neighbor_id, depth + 1, vertex_id))
+        finally:
+            self.release_marker(marker)
+
+    def dfs(self, start_id):
+        """
+        Run a preorder DFS from a vertex id, exploring neighbors in row order.
+
+        Like `bfs`, the traversal keeps working if vertices and edges are added while it is
+        suspended.
+
+        Args:
+            start_id (int): The id to start from.
+
+        Yields:
+            tuple: (vertex id, depth, parent id) in DFS order; the start has parent -1.
+        """
+        rows = self.rows
+        marker = self.acquire_marker()
+        marks, stamp = marker.marks, marker.stamp
+        stack = [(start_id, 0, -1)]
+
+        try:
+            while stack:
+                vertex_id, depth, parent_id = stack.pop()
+                if marks[vertex_id] != stamp:
+                    marks[vertex_id] = stamp
+                    yield vertex_id, depth, parent_id
+
+                    if len(marks) < len(rows):
+                        marker.cover(len(rows))  # Vertices were added while suspended
+                    # Push in reverse so that the first neighbor is explored first
+                    for neighbor_id in reversed(rows[vertex_id]):
+                        if marks[neighbor_id] != stamp:
+                            stack.append((neighbor_id, depth + 1, vertex_id))
+        finally:
+            self.release_marker(marker)
+
+    def dfs_events(self, root_ids):
+        """
+        Run a DFS from each root id not reached yet, reporting entries and exits.
+
+        Like `bfs`, the traversal keeps working if vertices and edges are added while it is
+        suspended; in list mode, edges appended to a vertex still on the stack are followed.
+
+        Args:
+            root_ids (iterable): The ids to start from, in order.
+
+        Yields:
+            tuple: (vertex id, entered) pairs; entered is True when the vertex is discovered
+            and False once everything reachable through it has been explored.
+        """
+        rows = self.rows
+        marker = self.acquire_marker()
+        marks, stamp = marker.marks, marker.stamp
+
+        try:
+            for root_id in root_ids:
+                if marks[root_id] == stamp:
+                    continue
+
+                marks[root_id] = stamp
+                yield root_id, True
+                stack = [(root_id, iter(rows[root_id]))]
+
+                while stack:
+                    if len(marks) < len(rows):
+                        marker.cover(len(rows))  # Vertices were added while suspended
+                    vertex_id, neighbors = stack[-1]
+                    for neighbor_id in neighbors:
+                        if marks[neighbor_id] != stamp:
+                            # Descend into the first unvisited neighbor; resume this vertex later
+                            marks[neighbor_id] = stamp
+                            yield neighbor_id, True
+                            stack.append((neighbor_id, iter(rows[neighbor_id])))
+                            break
+                    else:
+                        stack.pop()
+                        yield vertex_id, False
+        finally:
+            self.release_marker(marker)
+
+    def __len__(self):
+        # The id range, tombstones included
+        return len(self.rows)
@@ -0,0 +1,150 @@
+# Placeholder left in `labels` at the id of a removed label until the table is compacted.
+REMOVED = object()
+
+
+class SymbolTable:
+    """
+    A class to intern vertex labels as dense integer ids.
+
+    Every label receives the next free id the first time it is seen, so the ids of a table
+    with n labels are exactly 0..n-1. This lets graph code store vertices in lists and
+    arrays indexed by id instead of dictionaries and sets keyed by the original labels.
+
+    Removing a label leaves a tombstone (REMOVED) at its id, so the ids of the other labels
+    stay valid. `compact` renumbers the remaining labels densely again.
+
+    Attributes:
+        ids (dict): Maps each label to its integer id.
+        labels (list): Maps each integer id back to its label, or to REMOVED.
+        removed (int): The number of tombstones in `labels`.
+    """
+
+    def __init__(self, labels=()):
+        """
+        Initialize the table, optionally interning an initial sequence of labels.
+
+        Args:
+            labels (iterable, optional): Labels to intern in order.
+        """
+        self.ids = {}     # label -> id
+        self.labels = []  # id -> label
+        self.removed = 0
+
+        for label in labels:
+            self.intern(label)
+
+    def intern(self, label):
+        """
+        Return the id of a label, assigning the next free id if the label is new.
+
+        Args:
+            label (hashable): The label to intern.
+
+        Returns:
+            int: The id of the label.
+        """
+        vertex_id = self.ids.get(label)
+        if vertex_id is None:
+            vertex_id = len(self.labels)
+            self.ids[label] = vertex_id
+            self.labels.append(label)
+        return vertex_id
+
+    def id_of(self, label):
+        """
+        Return the id of an already interned label.
+
+        Args:
+            label (hashable): The label to look up.
+
+        Returns:
+            int: The id of the label.
+
+        Raises:
+            KeyError: If the label has not been interned.
+        """
+        return self.ids[label]
+
+    def get(self, label, default=None):
+        """
+        Return the id of a label, or a default value if the label is unknown.
+
+        Args:
+            label (hashable): The label to look up.
+            default (any, optional): The value returned for unknown labels.
+
+        Returns:
+            int: The id of the label, or `default`.
+        """
+        return self.ids.get(label, default)
+
+    def label_of(self, vertex_id):
+        """
+        Return the label that was interned under an id.
+
+        Args:
+            vertex_id (int): The id to translate.
+
+        Returns:
+            hashable: The label of the id.
+        """
+        return self.labels[vertex_id]
+
+    def remove(self, label):
+        """
+        Forget a label, leaving a tombstone at its id. The id is not reused.
+
+        Args:
+            label (hashable): The label to remove.
+
+        Returns:
+            int: The id the label had.
+
+        Raises:
+            KeyError: If the label has not been interned.
+        """
+        vertex_id = self.ids.pop(label)
+        self.labels[vertex_id] = REMOVED
+        self.removed += 1
+        return vertex_id
+
+    def compact(self):
+        """
+        Renumber the labels densely, dropping the tombstones and keeping the order of the ids.
+
+        The tables are updated in place, so objects sharing this table see the new ids.
+
+        Returns:
+            list: The old id of every label, indexed by its new id.
+        """
+        kept = [vertex_id for vertex_id, label in enumerate(self.labels) if label is not REMOVED]
+        self.labels[:] = [self.labels[vertex_id] for vertex_id in kept]
+        self.ids.clear()
+        self.ids.update(zip(self.labels, range(len(self.labels))))
+        self.removed = 0
+        return kept
+
+    def copy(self):
+        """
+        Return an independent copy of the table with the same ids.
+
+        Returns:
+            SymbolTable: The copy.
+        """
+        table = SymbolTable()
+        table.ids = dict(self.ids)
+        table.labels = list(self.labels)
+        table.removed = self.removed
+        return table
+
+    def __len__(self):
+        # The id range, tombstones included
+        return len(self.labels)
+
+    def __contains__(self, label):
+        return label in self.ids
+
+    def __iter__(self):
+        if self.removed:
+            return (label for label in self.labels if label is not REMOVED)
+        return iter(self.labels)
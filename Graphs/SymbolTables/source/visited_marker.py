@@ -0,0 +1,50 @@
+class VisitedMarker:
+    """
+    A class to mark visited vertex ids, reusable across traversals without clearing.
+
+    Instead of storing a flag per vertex, every vertex stores the stamp of the traversal that
+    last visited it. Starting a new traversal just moves to the next stamp, which makes all
+    earlier marks stale at once, so a reset costs O(1) instead of O(V). Stamps are single
+    bytes; after 255 traversals the array is cleared once and the stamps start over.
+
+    Traversals read `marks` and `stamp` into locals and test `marks[i] == stamp` inline.
+
+    Attributes:
+        marks (bytearray): The stamp of the last traversal that visited each vertex id.
+        stamp (int): The stamp of the current traversal, 1..255.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty marker.
+        """
+        self.marks = bytearray()
+        self.stamp = 0
+
+    def reset(self, size):
+        """
+        Start a new traversal over vertex ids 0..size-1 with no vertex marked.
+
+        Args:
+            size (int): The number of vertex ids; the marks grow to cover them if needed.
+        """
+        self.cover(size)
+
+        self.stamp += 1
+        if self.stamp > 255:
+            # Stamps are about to repeat; clear the array once and start over
+            self.marks = bytearray(len(self.marks))
+            self.stamp = 1
+
+    def cover(self, size):
+        """
+        Grow the marks in place to cover vertex ids 0..size-1, keeping the current marks.
+
+        Lazy traversals call this when they resume, since vertices may have been added to the
+        graph while they were suspended.
+
+        Args:
+            size (int): The number of vertex ids.
+        """
+        if len(self.marks) < size:
+            self.marks.extend(bytes(size - len(self.marks)))
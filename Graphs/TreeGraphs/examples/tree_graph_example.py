@@ -26,3 +26,11 @@ if __name__ == "__main__":
     print("\n\nPost-order Traversal:")
     tree.traverse_post_order()
     print("\n")
+
+    # Build a tree from (parent, child) pairs in one pass and query it through the parent pointers
+    org_chart = TreeGraph.from_parent_pairs([("CEO", "CTO"), ("CTO", "Dev"), ("CEO", "CFO"), ("Dev", "Intern")])
+    print("Org chart:")
+    org_chart.display()
+    print(f"Chain of command of Intern: {org_chart.path_to_root('Intern')}")
+    print(f"Does Intern report to CTO? {org_chart.is_ancestor('CTO', 'Intern')}")
+    print(f"Does Intern report to CFO? {org_chart.is_ancestor('CFO', 'Intern')}")
@@ -8,6 +8,9 @@ class TreeNode:
     Attributes:
         value (any): The value stored in the node.
         children (list): A list of children TreeNode instances.
+        parent (TreeNode): The parent node, or None for the root.
+        depth (int): The number of edges between the node and the root.
+        position (int): The index of the node in its parent's children list.
 
     Methods:
         add_child(node): Adds a child node to the current node.
@@ -15,21 +18,27 @@ class TreeNode:
     """
     def __init__(self, value):
         """
-        Initializes a TreeNode with the given value and an empty list of children.
+        Initializes a TreeNode with the given value, an empty list of children and no parent.
 
         Args:
             value (any): The value to store in the node.
         """
         self.value = value
         self.children = []
+        self.parent = None
+        self.depth = 0
+        self.position = 0
 
     def add_child(self, node):
         """
-        Adds a child node to the current node.
+        Adds a child node to the current node and makes the current node its parent.
 
         Args:
             node (TreeNode): The child node to add.
         """
+        node.parent = self
+        node.depth = self.depth + 1
+        node.position = len(self.children)
         self.children.append(node)
 
     def __repr__(self):
@@ -46,11 +55,25 @@ class TreeGraph:
     """
     A class representing a tree graph.
 
+    Every node is also registered in a hash index from its value, so that `add_node` finds the
+    parent in O(1) instead of searching the tree. Values are expected to be unique; what happens
+    to a duplicate value is set by the `duplicates` policy:
+
+    * "first" (default): the value names the node that a breadth-first search from the root
+      reaches first, i.e. the shallowest one, as `_find_node` does;
+    * "last": the value names the newest node that has it;
+    * "error": adding a value that is already in the tree raises a ValueError.
+
     Attributes:
         root (TreeNode): The root node of the tree.
+        duplicates (str): The duplicate value policy.
 
     Methods:
+        from_parent_pairs(pairs, duplicates): Builds a whole tree from (parent, child) pairs.
         add_node(parent_value, child_value): Adds a child node to the tree.
+        find(value): Returns the node indexed under a value.
+        path_to_root(value): Lists the values from a node up to the root.
+        is_ancestor(ancestor_value, value): Checks if one node lies above another.
         _find_node(current_node, value): Helper method to find a node by its value.
         traversal_in_order(node=None): Performs an in-order traversal of the tree.
         traversal_pre_order(node=None): Performs a pre-order traversal of the tree.
@@ -58,14 +81,83 @@ class TreeGraph:
         display(node=None, level=0): Displays the tree structure in a hierarchical format.
     """
 
-    def __init__(self, root_value):
+    DUPLICATE_POLICIES = ("first", "last", "error")
+
+    def __init__(self, root_value, duplicates="first"):
         """
         Initializes a TreeGraph with a root node.
 
         Args:
             root_value (any): The value to assign to the root node.
+            duplicates (str, optional): "first", "last" or "error"; see the class docstring.
+
+        Raises:
+            ValueError: If the duplicate value policy is unknown.
         """
+        if duplicates not in self.DUPLICATE_POLICIES:
+            raise ValueError(f"Unknown duplicate value policy {duplicates!r}!")
+
         self.root = TreeNode(root_value)
+        self.duplicates = duplicates
+        self._nodes = {root_value: self.root}  # Value -> node index
+        self._euler = None  # (entry, exit) times of every node, built by the first is_ancestor
+
+    @classmethod
+    def from_parent_pairs(cls, pairs, duplicates="first"):
+        """
+        Builds a whole tree from (parent value, child value) pairs in a single linear pass.
+
+        The pairs may come in any order; every value names exactly one node, and the children
+        of a node keep the order of their pairs. The root is the only value that never appears
+        as a child.
+
+        Args:
+            pairs (iterable): (parent value, child value) pairs, one per edge of the tree.
+            duplicates (str, optional): The duplicate value policy of the built tree, applied
+                to later calls of `add_node`.
+
+        Returns:
+            TreeGraph: The tree.
+
+        Raises:
+            ValueError: If a value has two parents, there is not exactly one root, or some
+                values form a cycle instead of hanging below the root.
+        """
+        nodes = {}
+        for parent_value, child_value in pairs:
+            parent_node = nodes.get(parent_value)
+            if parent_node is None:
+                parent_node = nodes[parent_value] = TreeNode(parent_value)
+            child_node = nodes.get(child_value)
+            if child_node is None:
+                child_node = nodes[child_value] = TreeNode(child_value)
+            elif child_node.parent is not None:
+                raise ValueError(f"Node {child_value} has two parents: "
+                                 f"{child_node.parent.value} and {parent_value}!")
+            parent_node.add_child(child_node)
+
+        roots = [node for node in nodes.values() if node.parent is None]
+        if len(roots) != 1:
+            raise ValueError(f"A tree needs exactly one root, found {len(roots)}!")
+
+        # Every node has one parent, so the nodes not below the root lie on cycles.
+        # Pairs arrive in any order, so the depths are only final once set from the root down.
+        reached = 0
+        roots[0].depth = 0
+        stack = [roots[0]]
+        while stack:
+            reached += 1
+            node = stack.pop()
+            for child in node.children:
+                child.depth = node.depth + 1
+            stack.extend(node.children)
+        if reached != len(nodes):
+            raise ValueError(f"{len(nodes) - reached} nodes form a cycle instead of hanging below the root!")
+
+        tree = cls(roots[0].value, duplicates)
+        tree.root = roots[0]
+        tree._nodes = nodes
+        return tree
 
     def add_node(self, parent_value, child_value):
         """
@@ -73,18 +165,136 @@ class TreeGraph:
 
         If the parent node is found, a new child node is created and added to it.
         If the parent node is not found, an error message is printed.
+        The parent is looked up in the value index, so this runs in O(1).
 
         Args:
             parent_value (any): The value of the parent node.
             child_value (any): The value of the child node to be added.
+
+        Raises:
+            ValueError: If the child value is already in the tree and the policy is "error".
         """
-        parent_node = self._find_node(self.root, parent_value)
+        parent_node = self._nodes.get(parent_value)
         if parent_node:
+            if self.duplicates == "error" and child_value in self._nodes:
+                raise ValueError(f"Node with value {child_value} already exists!")
             child_node = TreeNode(child_value)
             parent_node.add_child(child_node)
+            indexed_node = self._nodes.get(child_value)
+            if (indexed_node is None or self.duplicates == "last"
+                    or self._visited_first(child_node, indexed_node)):
+                self._nodes[child_value] = child_node
+            self._euler = None
         else:
             print(f"Parent node with value {parent_value} not found.")
 
+    @staticmethod
+    def _visited_first(node, other):
+        """
+        Returns whether a breadth-first search from the root visits node before other.
+
+        A BFS visits the nodes by depth, and the nodes of one depth in the order of the child
+        positions along their paths from the root. Nodes are only ever appended as last
+        children, so their depths and positions never change. Nodes of equal depth are
+        walked up to the children of their lowest common ancestor, whose positions decide.
+
+        Args:
+            node (TreeNode): The first node.
+            other (TreeNode): The second node, distinct from the first.
+
+        Returns:
+            bool: True if node is visited before other.
+        """
+        if node.depth != other.depth:
+            return node.depth < other.depth
+        while node.parent is not other.parent:
+            node, other = node.parent, other.parent
+        return node.position < other.position
+
+    def find(self, value):
+        """
+        Returns the node indexed under a value in O(1).
+
+        Args:
+            value (any): The value of the node to find.
+
+        Returns:
+            TreeNode: The node with the given value (see the duplicate value policy), or None
+            if not found.
+        """
+        return self._nodes.get(value)
+
+    def path_to_root(self, value):
+        """
+        Lists the values from a node up to the root by following the parent pointers.
+
+        Args:
+            value (any): The value of the node to start from.
+
+        Returns:
+            list: The values of the node, its parent, and so on up to the root's, or None if
+            the node is not found.
+        """
+        node = self._nodes.get(value)
+        if node is None:
+            return None
+
+        path = []
+        while node is not None:
+            path.append(node.value)
+            node = node.parent
+        return path
+
+    def _euler_tour(self):
+        """
+        Numbers the nodes in the order a depth-first walk enters and leaves them.
+
+        A node lies in the subtree of another exactly when the walk enters it after the other
+        and leaves it before, so ancestor checks become two comparisons. The times are kept
+        until the next insertion.
+
+        Returns:
+            tuple: (entry, exit) dictionaries mapping every node to its times.
+        """
+        if self._euler is None:
+            entry, exit_ = {}, {}
+            time = 0
+            stack = [(self.root, False)]
+            while stack:
+                node, leaving = stack.pop()
+                if leaving:
+                    exit_[node] = time
+                else:
+                    entry[node] = time
+                    stack.append((node, True))
+                    stack.extend((child, False) for child in reversed(node.children))
+                time += 1
+            self._euler = entry, exit_
+        return self._euler
+
+    def is_ancestor(self, ancestor_value, value):
+        """
+        Checks if one node lies on the path from another node to the root.
+
+        Runs in O(1) per query once the Euler tour of the tree is built, which takes O(n)
+        after every batch of insertions. Every node is its own ancestor.
+
+        Args:
+            ancestor_value (any): The value of the possible ancestor.
+            value (any): The value of the possible descendant.
+
+        Returns:
+            bool: True if the first node is an ancestor of the second, False otherwise (or if
+            either node is not found).
+        """
+        ancestor = self._nodes.get(ancestor_value)
+        node = self._nodes.get(value)
+        if ancestor is None or node is None:
+            return False
+
+        entry, exit_ = self._euler_tour()
+        return entry[ancestor] <= entry[node] and exit_[node] <= exit_[ancestor]
+
     @staticmethod
     def _find_node(current_node, value):
         """
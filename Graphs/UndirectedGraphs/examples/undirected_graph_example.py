@@ -25,3 +25,24 @@ if __name__ == "__main__":
     print("\nChecking if edges exist:")
     print(f"Does an edge exist between A and B? {'Yes' if graph.has_edge('A', 'B') else 'No'}")
     print(f"Does an edge exist between A and D? {'Yes' if graph.has_edge('A', 'D') else 'No'}")
+
+    # Query the connected components
+    graph.add_edge("E", "F")  # E -- F, a separate component
+    print("\nConnected components:")
+    print(f"Are A and D connected? {'Yes' if graph.connected('A', 'D') else 'No'}")
+    print(f"Are A and E connected? {'Yes' if graph.connected('A', 'E') else 'No'}")
+    print(f"Component sizes: {graph.component_sizes()}")
+
+    # Weighted shortest paths
+    roads = UndirectedGraph()
+    roads.add_edge("A", "B", 4.0)
+    roads.add_edge("A", "C", 1.0)
+    roads.add_edge("C", "B", 2.0)
+    roads.add_edge("B", "D", 5.0)
+    distances, parents = roads.dijkstra("A")
+    print(f"\nDijkstra distances from A: {distances}")
+    print(f"A* path from A to D: {roads.a_star('A', 'D', lambda vertex: 0)}")
+
+    # Triangles and clustering coefficients
+    print(f"\nTriangles through every road junction: {roads.triangles()}")
+    print(f"Clustering coefficients: {roads.clustering()}")
@@ -0,0 +1,161 @@
+from array import array
+
+from Graphs.SymbolTables.source.symbol_table import SymbolTable
+
+
+class DisjointSet:
+    """
+    A class representing a disjoint-set (union-find) forest over arbitrary labels.
+
+    Labels are interned to dense ids, and the forest is stored in flat arrays indexed by id:
+    the parent of each element, the rank (an upper bound on the tree height) of each root and
+    the size of each root's set. With union by rank and path compression every operation runs
+    in O(alpha(n)) amortized time, where alpha is the inverse Ackermann function.
+
+    Attributes:
+        symbols (SymbolTable): Maps labels to element ids.
+        parent (array): Parent id of every element; roots are their own parent.
+        rank (bytearray): Rank of every root.
+        size (array): Number of elements in the set of every root.
+        count (int): Number of disjoint sets.
+    """
+
+    def __init__(self, symbols=None):
+        """
+        Initializes an empty disjoint-set forest.
+
+        Args:
+            symbols (SymbolTable, optional): A table to share, e.g. a graph's vertex table, so
+                that element ids and vertex ids coincide. Its labels must then be added in id
+                order.
+        """
+        self.symbols = SymbolTable() if symbols is None else symbols
+        self.parent = array("q")
+        self.rank = bytearray()
+        self.size = array("q")
+        self.count = 0
+
+    def add(self, label):
+        """
+        Add a label as a singleton set, if it is not present yet.
+
+        Args:
+            label (hashable): The label to add.
+
+        Returns:
+            int: The element id of the label.
+        """
+        element = self.symbols.intern(label)
+        if element == len(self.parent):
+            self.parent.append(element)
+            self.rank.append(0)
+            self.size.append(1)
+            self.count += 1
+        return element
+
+    def find(self, element):
+        """
+        Return the root id of the set containing an element id, compressing the path to it.
+
+        Args:
+            element (int): The element id.
+
+        Returns:
+            int: The root id.
+        """
+        parent = self.parent
+
+        root = element
+        while parent[root] != root:
+            root = parent[root]
+
+        # Point every element on the path directly at the root
+        while parent[element] != root:
+            parent[element], element = root, parent[element]
+
+        return root
+
+    def union(self, label1, label2):
+        """
+        Merge the sets containing two labels, adding the labels first if needed.
+
+        Args:
+            label1 (hashable): The first label.
+            label2 (hashable): The second label.
+
+        Returns:
+            bool: True if two different sets were merged, False if they were already one set.
+        """
+        return self.union_ids(self.add(label1), self.add(label2))
+
+    def union_ids(self, element1, element2):
+        """
+        Merge the sets containing two element ids.
+
+        Args:
+            element1 (int): The first element id.
+            element2 (int): The second element id.
+
+        Returns:
+            bool: True if two different sets were merged, False if they were already one set.
+        """
+        root1 = self.find(element1)
+        root2 = self.find(element2)
+        if root1 == root2:
+            return False
+
+        # Attach the shallower tree below the deeper one
+        if self.rank[root1] < self.rank[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        self.size[root1] += self.size[root2]
+        if self.rank[root1] == self.rank[root2]:
+            self.rank[root1] += 1
+
+        self.count -= 1
+        return True
+
+    def connected(self, label1, label2):
+        """
+        Check if two labels belong to the same set.
+
+        Args:
+            label1 (hashable): The first label.
+            label2 (hashable): The second label.
+
+        Returns:
+            bool: True if both labels are known and in the same set, False otherwise.
+        """
+        element1 = self.symbols.get(label1)
+        element2 = self.symbols.get(label2)
+        if element1 is None or element2 is None:
+            return False
+        return self.find(element1) == self.find(element2)
+
+    def representative(self, label):
+        """
+        Return the label of the root of the set containing a label.
+
+        Two labels are in the same set exactly when they have the same representative.
+
+        Args:
+            label (hashable): The label to look up.
+
+        Returns:
+            hashable: The representative label, or None if the label is unknown.
+        """
+        element = self.symbols.get(label)
+        if element is None:
+            return None
+        return self.symbols.labels[self.find(element)]
+
+    def set_sizes(self):
+        """
+        Return the size of every set.
+
+        Returns:
+            dict: Maps the representative label of each set to the number of its elements.
+        """
+        labels = self.symbols.labels
+        return {labels[element]: self.size[element]
+                for element in range(len(self.parent)) if self.parent[element] == element}
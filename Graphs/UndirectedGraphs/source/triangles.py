@@ -0,0 +1,175 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+
+def degree_ordered_adjacency(rows):
+    """
+    Orient every edge of an undirected id adjacency from its lower- to its higher-ranked end.
+
+    Vertices are ranked by the number of distinct neighbors, ties broken by id, and renumbered
+    by rank. Parallel edges are merged and self-loops dropped. Every vertex keeps only its
+    higher-ranked neighbors, so each triangle u < v < w is found exactly once, from u, and no
+    vertex keeps more than O(sqrt(E)) neighbors.
+
+    Args:
+        rows (list): rows[i] holds the neighbor ids of vertex i, as a list (possibly with
+            duplicates) or as a {neighbor id: multiplicity} dictionary.
+
+    Returns:
+        tuple: (offsets, targets, order) where the higher-ranked neighbors of rank r are
+        `targets[offsets[r]:offsets[r + 1]]` in ascending rank order, and order[r] is the
+        vertex id of rank r.
+    """
+    neighbor_sets = [set(row) for row in rows]
+    for vertex_id, neighbors in enumerate(neighbor_sets):
+        neighbors.discard(vertex_id)
+
+    order = sorted(range(len(rows)), key=lambda vertex_id: (len(neighbor_sets[vertex_id]), vertex_id))
+    rank = array("q", [0]) * len(rows)
+    for position, vertex_id in enumerate(order):
+        rank[vertex_id] = position
+
+    offsets = array("q", [0])
+    targets = array("q")
+    for position, vertex_id in enumerate(order):
+        targets.extend(sorted(neighbor_rank for neighbor_rank in map(rank.__getitem__, neighbor_sets[vertex_id])
+                              if neighbor_rank > position))
+        offsets.append(len(targets))
+    return offsets, targets, order
+
+
+def count_triangles_range(offsets, targets, first, last):
+    """
+    Count the triangles whose lowest-ranked vertex lies in a range of ranks.
+
+    For every edge u -> v of the oriented adjacency, the common higher-ranked neighbors of u
+    and v close a triangle; both rows are sorted, so they are intersected with a linear merge.
+
+    Args:
+        offsets (array): Row start positions of the oriented adjacency.
+        targets (array): Concatenated, sorted rows of the oriented adjacency.
+        first (int): The first rank of the range.
+        last (int): One past the last rank of the range.
+
+    Returns:
+        array: The number of triangles found through every rank (all ranks, not just the range).
+    """
+    counts = array("q", [0]) * (len(offsets) - 1)
+    for u in range(first, last):
+        u_start, u_end = offsets[u], offsets[u + 1]
+        for edge in range(u_start, u_end):
+            v = targets[edge]
+            # Merge the neighbors of u after v with the neighbors of v
+            i, i_end = edge + 1, u_end
+            j, j_end = offsets[v], offsets[v + 1]
+            while i < i_end and j < j_end:
+                a, b = targets[i], targets[j]
+                if a < b:
+                    i += 1
+                elif a > b:
+                    j += 1
+                else:
+                    counts[u] += 1
+                    counts[v] += 1
+                    counts[a] += 1
+                    i += 1
+                    j += 1
+    return counts
+
+
+_worker_graph = None  # (offsets, targets) of a pool worker process, set once by _init_worker
+
+
+def _init_worker(offsets, targets):
+    """
+    Store the oriented adjacency in a pool worker, so it is sent to every process only once.
+
+    Defined at module level so that it can be pickled for process pools.
+
+    Args:
+        offsets (array): Row start positions of the oriented adjacency.
+        targets (array): Concatenated rows of the oriented adjacency.
+    """
+    global _worker_graph
+    _worker_graph = offsets, targets
+
+
+def _count_chunk(first, last):
+    """
+    Run `count_triangles_range` in a pool worker.
+
+    Args:
+        first (int): The first rank of the range.
+        last (int): One past the last rank of the range.
+
+    Returns:
+        array: The triangle counts of every rank.
+    """
+    return count_triangles_range(*_worker_graph, first, last)
+
+
+def _work_balanced_bounds(offsets, targets, chunk_count):
+    """
+    Split the ranks into consecutive ranges with about the same amount of merging work.
+
+    The work of rank u is estimated as the sum of the row lengths of its neighbors.
+
+    Args:
+        offsets (array): Row start positions of the oriented adjacency.
+        targets (array): Concatenated rows of the oriented adjacency.
+        chunk_count (int): The number of ranges wanted.
+
+    Returns:
+        list: The range boundaries, starting with 0 and ending with the vertex count.
+    """
+    vertex_count = len(offsets) - 1
+    work = [sum(offsets[v + 1] - offsets[v] + 1 for v in targets[offsets[u]:offsets[u + 1]])
+            for u in range(vertex_count)]
+    step = max(1, sum(work) // chunk_count)
+
+    bounds = [0]
+    done = 0
+    for u, amount in enumerate(work):
+        done += amount
+        if done >= step * len(bounds) and u + 1 < vertex_count:
+            bounds.append(u + 1)
+    bounds.append(vertex_count)
+    return bounds
+
+
+def triangle_counts(rows, processes=None):
+    """
+    Count the triangles through every vertex of an undirected id adjacency.
+
+    Parallel edges and self-loops are ignored: a triangle is a set of three distinct,
+    pairwise adjacent vertices.
+
+    Args:
+        rows (list): rows[i] holds the neighbor ids of vertex i (see `degree_ordered_adjacency`).
+        processes (int, optional): If given, count ranges of vertices with about the same
+            amount of work in a process pool of this size. The oriented adjacency is sent to
+            every worker only once.
+
+    Returns:
+        array: The number of triangles containing each vertex id.
+    """
+    offsets, targets, order = degree_ordered_adjacency(rows)
+    vertex_count = len(order)
+
+    if processes is None:
+        by_rank = count_triangles_range(offsets, targets, 0, vertex_count)
+    else:
+        bounds = _work_balanced_bounds(offsets, targets, 4 * processes)
+        by_rank = array("q", [0]) * vertex_count
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                                 initargs=(offsets, targets)) as pool:
+            for counts in pool.map(_count_chunk, bounds[:-1], bounds[1:]):
+                for position, count in enumerate(counts):
+                    if count:
+                        by_rank[position] += count
+
+    counts = array("q", repeat(0, vertex_count))
+    for position, vertex_id in enumerate(order):
+        counts[vertex_id] = by_rank[position]
+    return counts
@@ -1,22 +1,68 @@
+from array import array
 from collections import defaultdict
+from itertools import repeat
+
+from Graphs.EdgeLists.source.edge_list import chunked, new_endpoints, split_weights
+from Graphs.ShortestPaths.source.shortest_paths import a_star, dijkstra
+from Graphs.SymbolTables.source.interned_adjacency import InternedAdjacency
+from Graphs.UndirectedGraphs.source.disjoint_set import DisjointSet
+from Graphs.UndirectedGraphs.source.triangles import triangle_counts
 
 
 class UndirectedGraph:
     """
     A class to represent an undirected graph using an adjacency list.
 
-    The graph allows adding vertices, adding bidirectional edges, checking if an edge exists,
-    and printing the adjacency list.
+    The graph allows adding vertices, adding and removing bidirectional edges, checking if an
+    edge exists, and printing the adjacency list.
+
+    Two adjacency modes are available. In the default list mode every vertex maps to a list of
+    neighbors. In indexed mode every vertex maps to an insertion-ordered dictionary from neighbor
+    to the number of parallel edges, which makes `has_edge` and `remove_edge` O(1) regardless
+    of the vertex degree.
+
+    Every edge has a weight (1.0 unless given). In list mode the weights of a vertex are kept
+    in a float array parallel to its neighbor list; in indexed mode every neighbor maps to the
+    list of weights of its parallel edges, in insertion order (a self-loop is listed twice, like
+    its neighbor entry). Weight queries and shortest paths use the smallest weight among
+    parallel edges.
+
+    The connected components are tracked incrementally with a disjoint-set forest, so
+    connectivity queries do not need a traversal.
+
+    Whole-graph algorithms run on an adjacency list over dense integer vertex ids (`interned`).
+    It is built the first time such an algorithm runs and kept up to date from then on.
     """
 
-    def __init__(self):
+    def __init__(self, indexed=False):
         """
         Initialize the graph with an empty adjacency list.
 
         The adjacency list is a dictionary where each key is a vertex,
-        and the associated value is a list of neighboring vertices.
+        and the associated value is a list of neighboring vertices,
+        or a {neighbor: multiplicity} dictionary in indexed mode.
+        The weights dictionary maps each vertex to the weights of its edges.
+
+        :param indexed: If True, keep a hashed neighbor index instead of plain lists.
         """
-        self.adjacency_list = defaultdict(list)
+        self.indexed = indexed
+        self.adjacency_list = defaultdict(dict if indexed else list)
+        self.weights = {}
+        self._interned = None  # Integer-id mirror of the adjacency list, built on first use
+        self._components = DisjointSet()  # Union-find index of the connected components
+        self._components_stale = False  # Set when an edge removal may have split a component
+
+    @property
+    def interned(self):
+        """
+        InternedAdjacency: The adjacency list over integer vertex ids that whole-graph
+        algorithms run on, holding every edge in both directions. Built from the adjacency
+        list the first time it is needed and kept up to date by every later change.
+        """
+        if self._interned is None:
+            self._interned = InternedAdjacency.from_adjacency(self.adjacency_list, self.adjacency_list,
+                                                              self.indexed)
+        return self._interned
 
     def add_vertex(self, vertex):
         """
@@ -25,16 +71,24 @@ class UndirectedGraph:
         :param vertex: The vertex to be added to the graph.
         """
         if vertex not in self.adjacency_list:
-            self.adjacency_list[vertex] = []  # Initialize the vertex with an empty list of neighbors
+            # Initialize the vertex with an empty collection of neighbors
+            self.adjacency_list[vertex] = {} if self.indexed else []
+            self.weights[vertex] = {} if self.indexed else array("d")
+            if self._interned is not None:
+                self._interned.add_vertex(vertex)
+            if not self._components_stale:
+                self._components.add(vertex)
 
-    def add_edge(self, vertex1, vertex2):
+    def add_edge(self, vertex1, vertex2, weight=1.0):
         """
         Add an undirected edge between two vertices.
 
         If the vertices do not exist in the graph, they are added automatically.
+        Adding an edge that already exists creates a parallel edge.
 
         :param vertex1: The first vertex of the edge.
         :param vertex2: The second vertex of the edge.
+        :param weight: The weight of the edge.
         """
         # If vertex1 is not present, add it to the graph
         if vertex1 not in self.adjacency_list:
@@ -44,8 +98,141 @@ class UndirectedGraph:
             self.add_vertex(vertex2)
 
         # Add the edge in both directions to represent a bidirectional connection
-        self.adjacency_list[vertex1].append(vertex2)
-        self.adjacency_list[vertex2].append(vertex1)
+        for vertex, neighbor in ((vertex1, vertex2), (vertex2, vertex1)):
+            neighbors = self.adjacency_list[vertex]
+            weights = self.weights[vertex]
+            if self.indexed:
+                neighbors[neighbor] = neighbors.get(neighbor, 0) + 1
+                weights.setdefault(neighbor, []).append(weight)
+            else:
+                neighbors.append(neighbor)
+                weights.append(weight)
+
+        if self._interned is not None:
+            self._interned.add_edge(vertex1, vertex2)
+            self._interned.add_edge(vertex2, vertex1)
+
+        # Both endpoints are now in the same connected component
+        if not self._components_stale:
+            self._components.union(vertex1, vertex2)
+
+    def add_edges_from(self, edges):
+        """
+        Add many undirected edges at once.
+
+        The edges are consumed in batches. The new vertices of a batch are registered together
+        before its edges are appended, so the per-edge work is just the appends, without the
+        membership checks and method calls of `add_edge`. Instead of one union per edge, the
+        connected components are rebuilt once, on the next connectivity query. The adjacency
+        is the same as after calling `add_edge` for every edge in order.
+
+        :param edges: (vertex1, vertex2) pairs, or (vertex1, vertex2, weight) triples.
+        :raises ValueError: If a batch mixes pairs and triples; that batch is not added.
+        """
+        adjacency = self.adjacency_list
+        edge_weights = self.weights
+
+        for chunk in chunked(edges):
+            pairs, weights = split_weights(chunk)
+            for vertex in new_endpoints(pairs, adjacency):
+                self.add_vertex(vertex)
+
+            if self.indexed:
+                for (vertex1, vertex2), weight in zip(pairs, weights or repeat(1.0)):
+                    for vertex, neighbor in ((vertex1, vertex2), (vertex2, vertex1)):
+                        neighbors = adjacency[vertex]
+                        neighbor_weights = edge_weights[vertex]
+                        neighbors[neighbor] = neighbors.get(neighbor, 0) + 1
+                        neighbor_weights.setdefault(neighbor, []).append(weight)
+            elif weights is None:
+                for vertex1, vertex2 in pairs:
+                    adjacency[vertex1].append(vertex2)
+                    adjacency[vertex2].append(vertex1)
+                    edge_weights[vertex1].append(1.0)
+                    edge_weights[vertex2].append(1.0)
+            else:
+                for (vertex1, vertex2), weight in zip(pairs, weights):
+                    adjacency[vertex1].append(vertex2)
+                    adjacency[vertex2].append(vertex1)
+                    edge_weights[vertex1].append(weight)
+                    edge_weights[vertex2].append(weight)
+
+            if self._interned is not None:
+                self._interned.add_edges(pairs)
+                self._interned.add_edges(map(reversed, pairs))
+            self._components_stale = True
+
+    def remove_edge(self, vertex1, vertex2):
+        """
+        Remove one undirected edge between two vertices.
+
+        If parallel edges exist, only one of them is removed. The vertices stay in the graph.
+        Runs in O(1) in indexed mode and O(degree) in list mode.
+
+        :param vertex1: The first vertex of the edge.
+        :param vertex2: The second vertex of the edge.
+        :raises ValueError: If the edge does not exist.
+        """
+        if not self.has_edge(vertex1, vertex2):
+            raise ValueError(f"Edge {vertex1} -- {vertex2} does not exist!")
+
+        # Remove the edge in both directions, mirroring add_edge
+        for vertex, neighbor in ((vertex1, vertex2), (vertex2, vertex1)):
+            neighbors = self.adjacency_list[vertex]
+            weights = self.weights[vertex]
+            if self.indexed:
+                # Drop the first copy together with its weight, as in list mode
+                if neighbors[neighbor] == 1:
+                    del neighbors[neighbor]
+                    del weights[neighbor]
+                else:
+                    neighbors[neighbor] -= 1
+                    del weights[neighbor][0]
+            else:
+                # Drop the first copy together with the weight stored at the same position
+                position = neighbors.index(neighbor)
+                del neighbors[position]
+                del weights[position]
+            if self._interned is not None:
+                self._interned.remove_edge(vertex, neighbor)
+
+        # Union-find cannot split sets; rebuild the index lazily on the next query
+        self._components_stale = True
+
+    def remove_vertex(self, vertex):
+        """
+        Remove a vertex together with all its edges.
+
+        Only the neighbors of the vertex are touched: O(degree) in indexed mode, O(degree of
+        the neighbors) in list mode. The vertex leaves a tombstone among the interned ids until
+        they are compacted, and the connected components are rebuilt on the next query.
+
+        :param vertex: The vertex to remove.
+        :raises ValueError: If the vertex does not exist.
+        """
+        if vertex not in self.adjacency_list:
+            raise ValueError(f"Vertex {vertex} does not exist!")
+
+        neighbors = self.adjacency_list.pop(vertex)
+        del self.weights[vertex]
+
+        for neighbor in set(neighbors).difference((vertex,)):
+            neighbor_list = self.adjacency_list[neighbor]
+            weights = self.weights[neighbor]
+            if self.indexed:
+                del neighbor_list[vertex]
+                del weights[vertex]
+            else:
+                # Keep the weights aligned with the remaining neighbors
+                kept = [position for position, other in enumerate(neighbor_list) if other != vertex]
+                neighbor_list[:] = [neighbor_list[position] for position in kept]
+                weights[:] = array("d", map(weights.__getitem__, kept))
+
+        if self._interned is not None:
+            self._interned.remove_vertex(vertex, neighbors)
+        # Union-find cannot remove elements, and a rebuilt index shares the vertex ids, which a
+        # compaction may have renumbered
+        self._components_stale = True
 
     def has_edge(self, source, target):
         """
@@ -56,11 +243,200 @@ class UndirectedGraph:
         :return: True if there is an edge between source and target, False otherwise.
         """
         # Use get() to avoid KeyError if the source vertex is not in the graph
-        return target in self.adjacency_list.get(source, [])
+        return target in self.adjacency_list.get(source, ())
+
+    def edge_count(self, vertex1, vertex2):
+        """
+        Count the parallel edges between two vertices.
+
+        A self-loop is stored twice in the neighbors of its vertex and is therefore counted twice.
+
+        :param vertex1: The first vertex.
+        :param vertex2: The second vertex.
+        :return: The number of edges between the two vertices (0 if there is none).
+        """
+        neighbors = self.adjacency_list.get(vertex1)
+        if neighbors is None:
+            return 0
+        if self.indexed:
+            return neighbors.get(vertex2, 0)
+        return neighbors.count(vertex2)
+
+    def neighbors(self, vertex):
+        """
+        Iterate over the neighbors of a vertex.
+
+        Parallel edges are reported once per edge in both modes. In indexed mode the copies
+        of a neighbor are reported together, at the position where it was first added.
+
+        :param vertex: The vertex whose neighbors are listed.
+        :return: An iterator over the neighbors of the vertex.
+        """
+        neighbors = self.adjacency_list.get(vertex, ())
+        if self.indexed and neighbors:
+            for neighbor, multiplicity in neighbors.items():
+                for _ in range(multiplicity):
+                    yield neighbor
+        else:
+            yield from neighbors
+
+    def weight(self, vertex1, vertex2):
+        """
+        Return the weight of the edge between two vertices.
+
+        :param vertex1: The first vertex.
+        :param vertex2: The second vertex.
+        :return: The smallest weight among the parallel edges between the two vertices, or None
+                 if there is no such edge.
+        """
+        if not self.has_edge(vertex1, vertex2):
+            return None
+        weights = self.weights[vertex1]
+        if self.indexed:
+            return min(weights[vertex2])
+        return min(weight for neighbor, weight in zip(self.adjacency_list[vertex1], weights)
+                   if neighbor == vertex2)
+
+    def weighted_neighbors(self, vertex):
+        """
+        Iterate over the edges of a vertex together with their weights.
+
+        :param vertex: The vertex whose edges are listed.
+        :return: An iterator over (neighbor, weight) pairs.
+        """
+        if self.indexed:
+            # One entry per neighbor, carrying the smallest parallel-edge weight
+            return ((neighbor, min(weights)) for neighbor, weights in self.weights.get(vertex, {}).items())
+        return zip(self.adjacency_list.get(vertex, ()), self.weights.get(vertex, ()))
+
+    def dijkstra(self, source, targets=None):
+        """
+        Compute weighted shortest-path distances from a source vertex with Dijkstra's algorithm.
+
+        :param source: The vertex to start from.
+        :param targets: Optional vertices; the search stops once all of them are settled.
+        :return: A tuple (distances, parents) of dictionaries covering the settled vertices.
+        :raises ValueError: If a negative edge weight is encountered.
+        """
+        if source not in self.adjacency_list:
+            return {}, {}
+        return dijkstra(self.weighted_neighbors, source, targets)
+
+    def a_star(self, source, target, heuristic):
+        """
+        Find a weighted shortest path between two vertices with the A* algorithm.
+
+        :param source: The first vertex of the path.
+        :param target: The last vertex of the path.
+        :param heuristic: A function estimating the distance from a vertex to the target; the
+                          result is optimal when it never overestimates the true remaining
+                          distance and is consistent.
+        :return: A tuple (distance, path), or (inf, None) if the target is not reachable.
+        :raises ValueError: If a negative edge weight is encountered.
+        """
+        if source not in self.adjacency_list:
+            return float("inf"), None
+        return a_star(self.weighted_neighbors, source, target, heuristic)
+
+    def connected(self, vertex1, vertex2):
+        """
+        Check if two vertices are in the same connected component.
+
+        Runs in O(alpha(n)) amortized time using the union-find index.
+
+        :param vertex1: The first vertex.
+        :param vertex2: The second vertex.
+        :return: True if a path connects the two vertices, False otherwise (or if either
+                 vertex does not exist).
+        """
+        return self._component_index().connected(vertex1, vertex2)
+
+    def component_of(self, vertex):
+        """
+        Return the representative vertex of the connected component containing a vertex.
+
+        Two vertices are connected exactly when they have the same representative. The
+        representative of a component may change when components are merged.
+
+        :param vertex: The vertex to look up.
+        :return: The representative vertex, or None if the vertex does not exist.
+        """
+        return self._component_index().representative(vertex)
+
+    def component_sizes(self):
+        """
+        Return the size of every connected component.
+
+        :return: A dictionary mapping the representative vertex of each component to the
+                 number of vertices in it.
+        """
+        return self._component_index().set_sizes()
+
+    def _component_index(self):
+        """
+        Return the union-find index, rebuilding it first if edges were removed.
+
+        :return: The up-to-date DisjointSet of the graph's vertices.
+        """
+        if self._components_stale:
+            self.interned.compact()
+            # Share the vertex table so that element ids are vertex ids, then union over ints
+            components = DisjointSet(self.interned.symbols)
+            for vertex in self.interned.symbols:
+                components.add(vertex)
+            for vertex_id, neighbor_ids in enumerate(self.interned.rows):
+                for neighbor_id in neighbor_ids:
+                    components.union_ids(vertex_id, neighbor_id)
+            self._components = components
+            self._components_stale = False
+        return self._components
+
+    def triangles(self, processes=None):
+        """
+        Count the triangles through every vertex.
+
+        The edges are oriented from lower to higher degree over a deduplicated, sorted copy
+        of the id adjacency, and the rows of both ends of every edge are merged, so the cost
+        is O(E * sqrt(E)) however the neighbor lists are ordered. Parallel edges and
+        self-loops are ignored.
+
+        :param processes: Optional number of worker processes to split the vertices across.
+        :return: A dictionary mapping every vertex to the number of triangles containing it.
+        """
+        self.interned.compact()  # Every id must be a live vertex
+        return dict(zip(self.interned.symbols.labels, triangle_counts(self.interned.rows, processes)))
+
+    def triangle_count(self, processes=None):
+        """
+        Count the triangles of the graph.
+
+        :param processes: Optional number of worker processes to split the vertices across.
+        :return: The number of sets of three distinct, pairwise adjacent vertices.
+        """
+        return sum(triangle_counts(self.interned.rows, processes)) // 3
+
+    def clustering(self, processes=None):
+        """
+        Compute the local clustering coefficient of every vertex.
+
+        The coefficient of a vertex is the fraction of pairs of its distinct neighbors that are
+        adjacent themselves: 2 * T / (d * (d - 1)) for T triangles and d neighbors other than
+        the vertex itself. Vertices with fewer than two neighbors get 0.
+
+        :param processes: Optional number of worker processes to split the vertices across.
+        :return: A dictionary mapping every vertex to its clustering coefficient.
+        """
+        self.interned.compact()  # Every id must be a live vertex
+        counts = triangle_counts(self.interned.rows, processes)
+        coefficients = {}
+        for vertex_id, (vertex, row) in enumerate(zip(self.interned.symbols.labels, self.interned.rows)):
+            degree = len(set(row).difference((vertex_id,)))
+            coefficients[vertex] = 2 * counts[vertex_id] / (degree * (degree - 1)) if degree > 1 else 0.0
+        return coefficients
 
     def print(self):
         """
         Print the adjacency list of the graph to show the vertices and their neighbors.
         """
-        for vertex, neighbors in self.adjacency_list.items():
-            print(f"{vertex} : {neighbors}")  # Print each vertex with its list of neighbors
+        for vertex in self.adjacency_list:
+            print(f"{vertex} : {list(self.neighbors(vertex))}")  # Print each vertex with its list of neighbors